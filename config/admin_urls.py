@@ -38,6 +38,7 @@ from src.authz.endpoints import CustomTokenObtainPairController
 from src.cinemas.endpoints.cinema import CinemaController
 from src.cinemas.endpoints.hall import HallController
 from src.core.endpoints.gallery import GalleryController
+from src.core.endpoints.images import ImageController
 from src.core.endpoints.statistic import StatisticController
 from src.core.errors import AuthenticationExceptionError
 from src.core.errors import InvalidTokenExceptionError
@@ -57,6 +58,7 @@ admin_api.register_controllers(CustomTokenObtainPairController)
 admin_api.register_controllers(UsersAdminController)
 admin_api.register_controllers(MailingController)
 admin_api.register_controllers(GalleryController)
+admin_api.register_controllers(ImageController)
 admin_api.register_controllers(CinemaController)
 admin_api.register_controllers(MovieController)
 admin_api.register_controllers(HallController)
@@ -1,6 +1,8 @@
-"""ASGI config for config project.
+"""ASGI config for client site.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+Client site is served by ASGI server because of streaming endpoints
+(gunicorn config.asgi:application -k uvicorn.workers.UvicornWorker).
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.0/howto/deployment/asgi/
@@ -10,6 +12,6 @@ import os
 
 from django.core.asgi import get_asgi_application
 
-os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.kino_cms")
 
 application = get_asgi_application()
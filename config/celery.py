@@ -55,6 +55,23 @@ def setup_periodic_tasks(sender, **kwargs):
         get_abcex_rate.s(),
         name="get abcex currency rate",
     )
+    sender.add_periodic_task(
+        60.0,
+        sender.signature("src.booking.tasks.release_expired_holds"),
+        name="release expired seat holds",
+    )
+    sender.add_periodic_task(
+        crontab(minute="30", hour="3"),
+        sender.signature("src.booking.tasks.rebuild_ticket_sales"),
+        name="rebuild ticket sales of last two months",
+    )
+    sender.add_periodic_task(
+        crontab(minute="0", hour="4"),
+        sender.signature(
+            "src.core.tasks.collect_orphan_images", kwargs={"dry_run": True}
+        ),
+        name="report orphan images and files",
+    )
 
 
 app.conf.timezone = "Europe/Kiev"
@@ -90,6 +90,11 @@ CACHES = {
     }
 }
 IMAGEKIT_DEFAULT_IMAGE_CACHE_BACKEND = "django_redis.client.DefaultClient"
+FILE_UPLOAD_HANDLERS = ["django.core.files.uploadhandler.TemporaryFileUploadHandler"]
+IMAGE_CHECK_WORKERS = min(4, os.cpu_count() or 1)
+IMAGE_WEBP_QUALITY = 90
+IMAGE_DERIVATIVE_WIDTHS = [320, 640, 1280]
+RESPONSE_CACHE_TIMEOUT = 60 * 10
 GOOGLE_MAPS_API_KEY = env("GOOGLE_MAPS_API_KEY")
 SITE_ID = 1
 NINJA_JWT = {
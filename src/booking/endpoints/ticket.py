@@ -1,19 +1,22 @@
 """Endpoints for tickets"""
 
-from django.db.models import QuerySet
 from django.http import HttpRequest
+from django.http import StreamingHttpResponse
 from ninja import Header
+from ninja_extra import http_delete
 from ninja_extra import http_get
 from ninja_extra import http_post
 from ninja_extra.controllers.base import ControllerBase
 from ninja_extra.controllers.base import api_controller
 
 from src.booking.models import Seance
-from src.booking.models import Ticket
 from src.booking.schemas.ticket import BuyTicketSchema
+from src.booking.schemas.ticket import SeatHoldConfirmSchema
+from src.booking.schemas.ticket import SeatHoldOutSchema
 from src.booking.schemas.ticket import TicketSchema
 from src.booking.services.ticket import TicketService
 from src.core.errors import NotFoundExceptionError
+from src.core.errors import SeatHoldNotFoundExceptionError
 from src.core.errors import SmthWWExceptionError
 from src.core.errors import TicketAlreadyBoughtExceptionError
 from src.core.errors import UnprocessableEntityExceptionError
@@ -55,7 +58,7 @@ class TicketController(ControllerBase):
         request: HttpRequest,
         seance_id: int,
         accept_lang: LangEnum = Header(alias="Accept-Language", default="uk"),
-    ) -> QuerySet[Ticket]:
+    ) -> list[dict]:
         """Get all tickets for séance by its id.
 
         Returns
@@ -76,7 +79,6 @@ class TicketController(ControllerBase):
             "operationId": "get_recently_tickets",
             "responses": errors_to_docs(
                 {
-                    404: [NotFoundExceptionError(cls_model=Seance)],
                     422: [UnprocessableEntityExceptionError()],
                 }
             ),
@@ -87,22 +89,73 @@ class TicketController(ControllerBase):
         request: HttpRequest,
         seance_id: int,
         accept_lang: LangEnum = Header(alias="Accept-Language", default="uk"),
-    ) -> QuerySet[Ticket]:
-        """Get all tickets that has been bought recently.
-        Long polling endpoint
+    ) -> list[dict]:
+        """Get all tickets that has been bought during last minute.
+        Long polling endpoint, left for old clients,
+        use /ticket/events/ instead of it
 
         Returns
         -------
           - **200**: Success response with the data.
-          - **404**: Success response with the data.
+          - **422**: Success response with the data.
+          - **500**: Internal server error if an unexpected error occurs.
+
+        """
+        return self.ticket_service.get_recently_tickets(seance_id=seance_id)
+
+    @http_get(
+        "/events/",
+        summary="Stream of bought tickets (Server-sent events)",
+        openapi_extra={
+            "operationId": "get_tickets_events",
+            "responses": errors_to_docs(
+                {
+                    404: [NotFoundExceptionError(cls_model=Seance)],
+                    422: [UnprocessableEntityExceptionError()],
+                }
+            ),
+        },
+    )
+    async def get_tickets_events(
+        self,
+        request: HttpRequest,
+        seance_id: int,
+        cursor: str | None = None,
+        last_event_id: str | None = Header(alias="Last-Event-ID", default=None),
+    ):
+        """Stream tickets that are being bought for séance.
+        Every event contains list of tickets(row, seat) of one purchase.
+        Browser EventSource sends header Last-Event-ID after reconnect,
+        so stream continues from the last received event.
+        Stream is closed by server every few minutes, EventSource
+        reconnects by itself and continues from Last-Event-ID.
+        Endpoint works only when site is served by ASGI server
+        (config.asgi:application)
+
+        Please provide:
+          - **seance_id**  id of séance
+          - **cursor**  id of event to continue stream from (optional)
+
+        Returns
+        -------
+          - **200**: Stream of events (text/event-stream).
+          - **404**: Error: Not Found. \n
             Причини: \n
                 1) Не знайдено: немає збігів сеансів \n
                    на заданному запиті.
-          - **422**: Success response with the data.
+          - **422**: Error: Unprocessable Entity. \n
+            Причини: \n
+                1) Некоректний ідентифікатор події
           - **500**: Internal server error if an unexpected error occurs.
 
         """
-        return self.ticket_service.get_recently_tickets(seance_id=seance_id)
+        events = await self.ticket_service.stream_tickets(
+            seance_id=seance_id, cursor=last_event_id or cursor
+        )
+        response = StreamingHttpResponse(events, content_type="text/event-stream")
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"
+        return response
 
     @http_post(
         "/buy/",
@@ -154,3 +207,129 @@ class TicketController(ControllerBase):
 
         """
         return self.ticket_service.buy_tickets(payload=payload)
+
+    @http_post(
+        "/hold/",
+        response=SeatHoldOutSchema,
+        openapi_extra={
+            "operationId": "hold_tickets",
+            "responses": errors_to_docs(
+                {
+                    404: [NotFoundExceptionError(cls_model=Seance)],
+                    409: [TicketAlreadyBoughtExceptionError()],
+                    422: [UnprocessableEntityExceptionError()],
+                }
+            ),
+        },
+    )
+    def hold_tickets(
+        self,
+        request: HttpRequest,
+        payload: BuyTicketSchema,
+        accept_lang: LangEnum = Header(alias="Accept-Language", default="uk"),
+    ) -> SeatHoldOutSchema:
+        """Hold seats of séance for 10 minutes till payment.
+        Please provide:
+          - **Request body**  data for holding tickets
+
+        Returns
+        -------
+          - **200**: Success response with the data.
+          - **404**: Error: Not Found. \n
+            Причини: \n
+                1) Не знайдено: немає збігів сеансів \n
+                   на заданному запиті.
+          - **409**: Error: Conflict. \n
+            Причини: \n
+                1) У вказаному переліку квитків \n
+                   є ті які вже кимось придбані
+          - **422**: Error: Unprocessable Entity. \n
+            Причини: \n
+                1) Дані про розташування \n
+                   квитка на схемі неправельні. \n
+                2) Квитки для покупки не обрані, \n
+                   має бути мінімум 1.\n
+          - **500**: Internal server error if an unexpected error occurs.
+
+        """
+        return self.ticket_service.hold_tickets(payload=payload)
+
+    @http_post(
+        "/confirm/",
+        response=MessageOutSchema,
+        openapi_extra={
+            "operationId": "confirm_hold",
+            "responses": errors_to_docs(
+                {
+                    402: [SmthWWExceptionError()],
+                    404: [SeatHoldNotFoundExceptionError()],
+                    409: [TicketAlreadyBoughtExceptionError()],
+                    422: [UnprocessableEntityExceptionError()],
+                }
+            ),
+        },
+    )
+    def confirm_hold(
+        self,
+        request: HttpRequest,
+        payload: SeatHoldConfirmSchema,
+        accept_lang: LangEnum = Header(alias="Accept-Language", default="uk"),
+    ) -> MessageOutSchema:
+        """Pay for held seats and buy tickets.
+        Please provide:
+          - **Request body**  id of hold
+
+        Returns
+        -------
+          - **200**: Success response with the data.
+          - **402**: Error: Payment Required. \n
+            Причини: \n
+                1) Операція з оплатою нажаль не пройшла, \n
+                   спробуйте ще раз.
+          - **404**: Error: Not Found. \n
+            Причини: \n
+                1) Бронювання місць не знайдено \n
+                   або його час вичерпано.
+          - **409**: Error: Conflict. \n
+            Причини: \n
+                1) У вказаному переліку квитків \n
+                   є ті які вже кимось придбані
+          - **422**: Error: Unprocessable Entity.
+          - **500**: Internal server error if an unexpected error occurs.
+
+        """
+        return self.ticket_service.confirm_hold(hold_id=payload.hold_id)
+
+    @http_delete(
+        "/hold/{hold_id}/",
+        response=MessageOutSchema,
+        openapi_extra={
+            "operationId": "release_hold",
+            "responses": errors_to_docs(
+                {
+                    404: [SeatHoldNotFoundExceptionError()],
+                    422: [UnprocessableEntityExceptionError()],
+                }
+            ),
+        },
+    )
+    def release_hold(
+        self,
+        request: HttpRequest,
+        hold_id: str,
+        accept_lang: LangEnum = Header(alias="Accept-Language", default="uk"),
+    ) -> MessageOutSchema:
+        """Cancel hold of seats.
+
+        Returns
+        -------
+          - **200**: Success response with the data.
+          - **404**: Error: Not Found. \n
+            Причини: \n
+                1) Бронювання місць не знайдено \n
+                   або його час вичерпано.
+          - **422**: Error: Unprocessable Entity.
+          - **500**: Internal server error if an unexpected error occurs.
+
+        """
+        return self.ticket_service.release_hold(hold_id=hold_id)
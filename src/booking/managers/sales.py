@@ -0,0 +1,116 @@
+from datetime import date
+
+from django.db import models
+from django.db import transaction
+from django.db.models import Count
+from django.db.models import F
+from django.db.models import Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+
+class TicketSalesManager(models.Manager):
+    """Custom manager for ticket sales rollup. Rows are updated
+    on every purchase and repaired by periodic rebuild from tickets
+    """
+
+    def add_sales(self, seance_id: int, tickets_count: int) -> None:
+        """Add bought tickets of séance to today's sales.
+        :param seance_id: id of séance
+        :param tickets_count: count of bought tickets
+        """
+        from src.booking.models import Seance
+        from src.core.services.statistic import StatisticService
+
+        seance = Seance.objects.values(
+            "movie_id", "hall_id", "hall__tech_id", "price"
+        ).get(id=seance_id)
+        with transaction.atomic():
+            sales, _ = self.get_or_create(
+                day=timezone.localdate(),
+                movie_id=seance["movie_id"],
+                hall_id=seance["hall_id"],
+                defaults={"tech_id": seance["hall__tech_id"]},
+            )
+            self.filter(id=sales.id).update(
+                tickets_count=F("tickets_count") + tickets_count,
+                income=F("income") + tickets_count * seance["price"],
+            )
+        StatisticService.invalidate_computed_nums()
+
+    def rebuild(self, start: date | None = None) -> int:
+        """Recount sales from bought tickets day by day.
+        :param start: first day for recounting, all days if None
+        :return: count of rollup rows
+        """
+        from src.booking.models import Ticket
+        from src.core.services.statistic import StatisticService
+
+        tickets = Ticket.objects.all()
+        sales = self.all()
+        if start is not None:
+            tickets = tickets.filter(date_created__date__gte=start)
+            sales = sales.filter(day__gte=start)
+        days = set(
+            tickets.annotate(day=TruncDate("date_created"))
+            .values_list("day", flat=True)
+            .order_by()
+            .distinct()
+        )
+        days.update(sales.values_list("day", flat=True).order_by().distinct())
+        rebuilt = sum(self.rebuild_day(day) for day in sorted(days))
+        StatisticService.invalidate_computed_nums()
+        return rebuilt
+
+    def rebuild_day(self, day: date) -> int:
+        """Recount sales of day from bought tickets. Rows of day are locked
+        before tickets are counted, so add_sales waits for recount and adds
+        its tickets after it. Rows are updated in place instead of
+        deleting, so increments of rows which add_sales has read are kept
+        :param day: day for recounting
+        :return: count of rollup rows with sales
+        """
+        from src.booking.models import Ticket
+
+        rows = (
+            Ticket.objects.filter(date_created__date=day)
+            .values("seance__movie_id", "seance__hall_id")
+            .annotate(
+                tech_id=F("seance__hall__tech_id"),
+                tickets_count=Count("id"),
+                income=Sum("seance__price"),
+            )
+            .order_by()
+        )
+        with transaction.atomic():
+            locked = list(
+                self.select_for_update()
+                .filter(day=day)
+                .values_list("id", "movie_id", "hall_id")
+            )
+            counted = [
+                self.model(
+                    day=day,
+                    movie_id=row["seance__movie_id"],
+                    hall_id=row["seance__hall_id"],
+                    tech_id=row["tech_id"],
+                    tickets_count=row["tickets_count"],
+                    income=row["income"],
+                )
+                for row in rows
+            ]
+            self.bulk_create(
+                counted,
+                update_conflicts=True,
+                unique_fields=["day", "movie", "hall"],
+                update_fields=["tech", "tickets_count", "income"],
+            )
+            keys = {(sales.movie_id, sales.hall_id) for sales in counted}
+            self.filter(
+                id__in=[
+                    sales_id
+                    for sales_id, movie_id, hall_id in locked
+                    if (movie_id, hall_id) not in keys
+                ]
+            ).update(tickets_count=0, income=0)
+        return len(counted)
@@ -1,16 +1,17 @@
 from datetime import timedelta
 from typing import TYPE_CHECKING
 
-import pymorphy2
 from django.db import models
-from django.db.models import Q
+from django.db.models import Count
+from django.db.models import F
+from django.db.models import IntegerField
 from django.db.models import QuerySet
-from django.template.defaultfilters import date as _date
+from django.db.models.functions import Cast
 from django.utils import timezone
-from django.utils import translation
 from django.utils.translation import gettext as _
 
 from src.core.errors import NotFoundExceptionError
+from src.core.utils import format_date_label
 
 if TYPE_CHECKING:
     from src.booking.models import Seance
@@ -49,15 +50,23 @@ class SeanceManager(models.Manager):
         return seances
 
     def get_filtered(self, filters: "SeanceFilterSchema") -> list:
-        """Get all séances in site.
-        :return: Séance model instance
+        """Get schedule of séances grouped by dates.
+        Séances are taken by one query with annotated count of sold tickets
+        and count of hall seats (without loading of whole hall layout)
+        :param filters: filters for séances
+        :return: list of dates with séances
         """
-        today = timezone.now()
-        tomorrow = timezone.now() + timedelta(days=1)
-        seances = self.model.objects.prefetch_related(
-            "movie", "hall__cinema", "ticket_set"
-        ).filter(date__date__gte=today.date())
-        seances = seances.filter(hall__cinema__slug=filters.cnm_slug)
+        today = timezone.localdate()
+        tomorrow = today + timedelta(days=1)
+        seances = (
+            self.model.objects.select_related("movie", "hall")
+            .defer("hall__layout")
+            .annotate(
+                tickets_count=Count("ticket"),
+                seats_count=Cast(F("hall__layout__seatsCount"), IntegerField()),
+            )
+            .filter(date__date__gte=today, hall__cinema__slug=filters.cnm_slug)
+        )
         if filters.hall_ids:
             seances = seances.filter(hall__id__in=filters.hall_ids)
         if filters.mv_slugs:
@@ -65,29 +74,18 @@ class SeanceManager(models.Manager):
         if filters.tech_ids:
             seances = seances.filter(hall__tech__in=filters.tech_ids)
         if filters.date:
-            seances = seances.filter(date__date=filters.date)
             dates = [filters.date]
         else:
-            seances = seances.filter(
-                Q(date__date=today.date()) | Q(date__date=tomorrow.date())
-            )
-            dates = [today.date(), tomorrow.date()]
+            dates = [today, tomorrow]
+        seances = seances.filter(date__date__in=dates)
+        grouped = {date: [] for date in dates}
+        for seance in seances:
+            grouped[timezone.localtime(seance.date).date()].append(seance)
         result = []
-        for date in dates:
-            date_seances = []
-            for seance in seances:
-                if seance.date.date() == date:
-                    date_seances.append(seance)
-            date = _date(date, "d F l")
-            date = date.split(" ")
-            current_lang = translation.get_language()
-            morph = pymorphy2.MorphAnalyzer(lang=current_lang)
-            parser = morph.parse(date[1])[0]
-            gent = parser.inflect({"gent"})
-            date[1] = gent.word + ","
+        for date, date_seances in grouped.items():
             result.append(
                 {
-                    "date": " ".join(date).upper(),
+                    "date": format_date_label(date, "d E, l"),
                     "seances": date_seances,
                 }
             )
@@ -1,22 +1,29 @@
 import random
-from typing import TYPE_CHECKING
 
+from datetime import timedelta
+
+from django.core.cache import cache
 from django.db import IntegrityError
 from django.db import models
-from django.db.models import QuerySet
+from django.db import transaction
 from django.utils import timezone
 from django.utils.translation import gettext as _
+from django_redis import get_redis_connection
 
 from src.booking.schemas.ticket import BuyTicketSchema
+from src.booking.utils import OCCUPANCY_KEY
+from src.booking.utils import OCCUPANCY_TIMEOUT
+from src.booking.utils import SEANCE_HALL_KEY
+from src.booking.utils import SeanceOccupancy
+from src.booking.utils import SeatHold
+from src.booking.utils import publish_tickets
 from src.core.errors import NotFoundExceptionError
+from src.core.errors import SeatHoldNotFoundExceptionError
 from src.core.errors import SmthWWExceptionError
 from src.core.errors import TicketAlreadyBoughtExceptionError
 from src.core.errors import UnprocessableEntityExceptionError
 from src.core.schemas.base import MessageOutSchema
 
-if TYPE_CHECKING:
-    from src.booking.models import Ticket
-
 
 # um1.User
 class TicketManager(models.Manager):
@@ -24,43 +31,100 @@ class TicketManager(models.Manager):
     here is redefined some methods for managing tickets in system
     """
 
-    def get_tickets_by_seance_id(self, seance_id: int) -> QuerySet["Ticket"]:
-        """Get séance with the given id.
+    def get_occupancy(self, seance_id: int, hall_id: int) -> SeanceOccupancy:
+        """Get bitmap of occupied seats for séance with the given id.
+        Bitmap is loaded from db only if it isn't present in redis,
+        seats of active holds are occupied in loaded bitmap too
+        :param seance_id: id of séance
+        :param hall_id: id of séance's hall
+        :return: SeanceOccupancy instance
+        """
+        from src.cinemas.models import Hall
+
+        seat_index = Hall.objects.get_seat_index(hall_id=hall_id)
+        occupancy = SeanceOccupancy(seance_id=seance_id, seat_index=seat_index)
+        if not occupancy.exists():
+            locations = list(
+                self.model.objects.filter(seance_id=seance_id).values_list(
+                    "row", "seat"
+                )
+            )
+            locations.extend(SeatHold.get_held_locations(seance_id=seance_id))
+            occupancy.load(locations)
+        return occupancy
+
+    def drop_occupancies(self, hall_id: int) -> int:
+        """Remove bitmaps of séances of hall from redis after change
+        of its layout, offsets of seats in bitmaps point to other seats,
+        so bitmaps are loaded again with new seat index.
+        :param hall_id: id of hall
+        :return: count of séances
+        """
+        from src.booking.models import Seance
+
+        edge = timezone.now() - timedelta(seconds=OCCUPANCY_TIMEOUT)
+        seance_ids = list(
+            Seance.objects.filter(hall_id=hall_id, date__gte=edge).values_list(
+                "id", flat=True
+            )
+        )
+        if seance_ids:
+            get_redis_connection("default").delete(
+                *[OCCUPANCY_KEY.format(seance_id=pk) for pk in seance_ids]
+            )
+            cache.delete_many(
+                [SEANCE_HALL_KEY.format(seance_id=pk) for pk in seance_ids]
+            )
+        return len(seance_ids)
+
+    def get_tickets_by_seance_id(self, seance_id: int) -> list[dict]:
+        """Get bought tickets of séance with the given id.
+        Tickets are taken from bitmap of occupied seats,
+        db is used only when bitmap isn't loaded yet
         :param seance_id: if of séance
-        :return: Séance model instance
+        :return: list of tickets locations
         """
         from src.booking.models import Seance
 
-        try:
-            seance = Seance.objects.prefetch_related("ticket_set").get(id=seance_id)
-        except Seance.DoesNotExist:
-            msg = _("Не знайдено: немає збігів сеансів " "на заданному запиті.")
-            raise NotFoundExceptionError(message=msg, cls_model=Seance)
-        return seance.ticket_set.all()
+        key = SEANCE_HALL_KEY.format(seance_id=seance_id)
+        hall_id = cache.get(key)
+        if hall_id is None:
+            try:
+                hall_id = Seance.objects.values_list("hall_id", flat=True).get(
+                    id=seance_id
+                )
+            except Seance.DoesNotExist:
+                msg = _("Не знайдено: немає збігів сеансів " "на заданному запиті.")
+                raise NotFoundExceptionError(message=msg, cls_model=Seance)
+            cache.set(key, hall_id, OCCUPANCY_TIMEOUT)
+        occupancy = self.get_occupancy(seance_id=seance_id, hall_id=hall_id)
+        locations = occupancy.get_occupied()
+        if locations is None:
+            locations = self.model.objects.filter(seance_id=seance_id).values_list(
+                "row", "seat"
+            )
+        return [{"row": row, "seat": seat} for row, seat in locations]
 
-    def create_tickets(self, payload: BuyTicketSchema) -> MessageOutSchema:
-        """Get séance with the given id.
-        :param payload: body for creating ticket
+    def hold_tickets(self, payload: BuyTicketSchema) -> SeatHold:
+        """Hold séance seats for some minutes till payment is confirmed.
+        :param payload: body for holding tickets
+        :return: SeatHold instance
         """
         from src.booking.models import Seance
+        from src.cinemas.models import Hall
 
         try:
             today = timezone.now()
-            seance = Seance.objects.prefetch_related("hall").get(
+            seance = Seance.objects.only("id", "hall").get(
                 id=payload.seance_id, date__gte=today
             )
         except Seance.DoesNotExist:
             msg = _("Не знайдено: немає збігів сеансів " "на заданному запиті.")
             raise NotFoundExceptionError(message=msg, cls_model=Seance)
-        tickets = []
+        seat_index = Hall.objects.get_seat_index(hall_id=seance.hall_id)
+        locations = []
         for ticket in payload.tickets:
-            found = False
-            for row in seance.hall.layout["rows"]:
-                if "number" in row and row["number"] == ticket.row:
-                    for seat in row["seats"]:
-                        if "number" in seat and seat["number"] == ticket.seat:
-                            found = True
-            if found is False:
+            if (ticket.row, ticket.seat) not in seat_index:
                 msg = _(
                     "Дані про розташування "
                     "квитка (ряд: {row}, "
@@ -68,27 +132,126 @@ class TicketManager(models.Manager):
                     "на схемі неправельні."
                 ).format(row=ticket.row, seat=ticket.seat)
                 raise UnprocessableEntityExceptionError(message=msg)
-            item = self.model(
-                seance_id=payload.seance_id, row=ticket.row, seat=ticket.seat
-            )
-            tickets.append(item)
-        if len(tickets) < 1:
+            if (ticket.row, ticket.seat) not in locations:
+                locations.append((ticket.row, ticket.seat))
+        if len(locations) < 1:
             msg = _("Квитки для покупки не обрані, має бути мінімум 1.")
             raise UnprocessableEntityExceptionError(message=msg, field="tickets")
-        try:
-            tickets_list = self.model.objects.bulk_create(tickets)
-        except IntegrityError:
-            if len(tickets) > 1:
+        occupancy = self.get_occupancy(seance_id=seance.id, hall_id=seance.hall_id)
+        reserved = occupancy.reserve(locations)
+        if reserved is None:
+            occupancy = self.get_occupancy(seance_id=seance.id, hall_id=seance.hall_id)
+            reserved = occupancy.reserve(locations)
+        if reserved is False:
+            if len(locations) > 1:
                 msg = _("У вказаному переліку квитків " "є ті які вже кимось придбані")
             else:
                 msg = _("Цей квиток вже придбаний кимось")
             raise TicketAlreadyBoughtExceptionError(message=msg)
+        hold = SeatHold.create(
+            seance_id=seance.id, hall_id=seance.hall_id, locations=locations
+        )
+        return hold
+
+    def confirm_hold(self, hold_id: str) -> MessageOutSchema:
+        """Pay for held seats and convert them to tickets.
+        If payment fails, hold stays active till its expiration
+        :param hold_id: id of hold
+        """
+        from src.booking.models import TicketSales
+
+        hold = SeatHold.get(hold_id=hold_id)
+        if hold is None or not hold.claim():
+            msg = _("Бронювання місць не знайдено або його час вичерпано.")
+            raise SeatHoldNotFoundExceptionError(message=msg)
+        if hold.is_expired:
+            self.release(hold)
+            msg = _("Бронювання місць не знайдено або його час вичерпано.")
+            raise SeatHoldNotFoundExceptionError(message=msg)
         if random.choice([False, False, True]):
-            ticket_ids = [ticket.id for ticket in tickets_list]
-            queryset = self.model.objects.filter(id__in=ticket_ids)
-            queryset.delete()
+            hold.restore()
             msg = _("Операція з оплатою нажаль не пройшла, " "спробуйте ще раз.")
             raise SmthWWExceptionError(message=msg)
+        tickets = [
+            self.model(seance_id=hold.seance_id, row=row, seat=seat)
+            for row, seat in hold.locations
+        ]
+        try:
+            with transaction.atomic():
+                self.model.objects.bulk_create(tickets)
+                TicketSales.objects.add_sales(
+                    seance_id=hold.seance_id, tickets_count=len(tickets)
+                )
+        except IntegrityError:
+            self.release(hold, sold=True)
+            if len(tickets) > 1:
+                msg = _("У вказаному переліку квитків " "є ті які вже кимось придбані")
+            else:
+                msg = _("Цей квиток вже придбаний кимось")
+            raise TicketAlreadyBoughtExceptionError(message=msg)
+        hold.delete()
+        publish_tickets(seance_id=hold.seance_id, locations=hold.locations)
         msg = _("Покупка пройшла успішно")
+        return MessageOutSchema(detail=msg)
 
+    def release_hold(self, hold_id: str) -> MessageOutSchema:
+        """Cancel hold and make its seats free.
+        :param hold_id: id of hold
+        """
+        hold = SeatHold.get(hold_id=hold_id)
+        if hold is None or not hold.claim():
+            msg = _("Бронювання місць не знайдено або його час вичерпано.")
+            raise SeatHoldNotFoundExceptionError(message=msg)
+        self.release(hold)
+        msg = _("Бронювання місць скасовано")
         return MessageOutSchema(detail=msg)
+
+    def release_expired_holds(self) -> int:
+        """Make seats of all expired holds free.
+        :return: count of released holds
+        """
+        released = 0
+        for hold_id in SeatHold.get_expired_ids():
+            hold = SeatHold.get(hold_id=hold_id)
+            if hold is None:
+                SeatHold.discard(hold_id=hold_id)
+                continue
+            if hold.claim():
+                self.release(hold)
+                released += 1
+        return released
+
+    def release(self, hold: SeatHold, sold: bool = False) -> None:
+        """Make seats of claimed hold free and remove hold.
+        :param hold: claimed SeatHold instance
+        :param sold: some seats of hold can be bought already,
+        they stay occupied
+        """
+        from src.cinemas.models import Hall
+
+        locations = hold.locations
+        if sold:
+            bought = set(
+                self.model.objects.filter(
+                    seance_id=hold.seance_id,
+                    row__in={row for row, seat in locations},
+                    seat__in={seat for row, seat in locations},
+                ).values_list("row", "seat")
+            )
+            locations = [location for location in locations if location not in bought]
+        seat_index = Hall.objects.get_seat_index(hall_id=hold.hall_id)
+        occupancy = SeanceOccupancy(seance_id=hold.seance_id, seat_index=seat_index)
+        occupancy.release(locations)
+        hold.delete()
+
+    def create_tickets(self, payload: BuyTicketSchema) -> MessageOutSchema:
+        """Hold seats and buy tickets in one step.
+        :param payload: body for creating ticket
+        """
+        hold = self.hold_tickets(payload=payload)
+        try:
+            result = self.confirm_hold(hold_id=hold.hold_id)
+        except SmthWWExceptionError:
+            self.release_hold(hold_id=hold.hold_id)
+            raise
+        return result
@@ -0,0 +1,34 @@
+# Generated by Django 5.0.6 on 2026-10-17 22:42
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('booking', '0009_ticket_date_created'),
+        ('cinemas', '0020_alter_hall_tech'),
+        ('movies', '0009_alter_tech_options'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TicketSales',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('tickets_count', models.PositiveIntegerField(default=0)),
+                ('income', models.PositiveBigIntegerField(default=0)),
+                ('hall', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='cinemas.hall')),
+                ('movie', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='movies.movie')),
+                ('tech', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, to='movies.tech')),
+            ],
+            options={
+                'verbose_name': 'Ticket sales',
+                'verbose_name_plural': 'Ticket sales',
+                'db_table': 'ticket_sales',
+                'unique_together': {('day', 'movie', 'hall')},
+            },
+        ),
+    ]
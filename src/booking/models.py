@@ -1,5 +1,6 @@
 from django.db import models
 
+from src.booking.managers.sales import TicketSalesManager
 from src.booking.managers.seance import SeanceManager
 from src.booking.managers.ticket import TicketManager
 
@@ -38,3 +39,27 @@ class Ticket(models.Model):
         verbose_name = "Ticket"
         verbose_name_plural = "Tickets"
         db_table = "tickets"
+
+
+class TicketSales(models.Model):
+    """Продажи билетов за день по фильму и залу.
+    Обновляется при покупке билетов, используется для статистики
+    :param day день покупки билетов
+    :param tech технология зала на момент покупки
+    :param tickets_count количество купленных билетов
+    :param income доход с купленных билетов
+    """
+
+    day = models.DateField()
+    movie = models.ForeignKey("movies.Movie", on_delete=models.CASCADE)
+    hall = models.ForeignKey("cinemas.Hall", on_delete=models.CASCADE)
+    tech = models.ForeignKey("movies.Tech", on_delete=models.SET_NULL, null=True)
+    tickets_count = models.PositiveIntegerField(default=0)
+    income = models.PositiveBigIntegerField(default=0)
+    objects = TicketSalesManager()
+
+    class Meta:
+        unique_together = ("day", "movie", "hall")
+        verbose_name = "Ticket sales"
+        verbose_name_plural = "Ticket sales"
+        db_table = "ticket_sales"
@@ -1,8 +1,5 @@
-import pymorphy2
 from dateutil.parser import parse
-from django.template.defaultfilters import date as _date
 from django.utils import timezone
-from django.utils import translation
 from django.utils.translation import gettext as _
 from ninja import FilterSchema
 from ninja import ModelSchema
@@ -12,14 +9,15 @@ from pydantic import field_validator
 from src.booking.models import Seance
 from src.core.errors import UnprocessableEntityExceptionError
 from src.core.models import Image
-from src.core.schemas.images import ImageOutSchema
+from src.core.schemas.images import ImageCardOutSchema
+from src.core.utils import format_date_label
 
 
 class SeanceCardOutSchema(ModelSchema):
     """Pydantic schema for showing séance card."""
 
-    card_img: ImageOutSchema
-    banner: ImageOutSchema
+    card_img: ImageCardOutSchema
+    banner: ImageCardOutSchema
     summary: str
     movie_name: str
 
@@ -37,14 +35,7 @@ class SeanceCardOutSchema(ModelSchema):
 
     @staticmethod
     def resolve_summary(obj: Seance) -> str:
-        date = _date(obj.date, "d F")
-        date = date.split(" ")
-        current_lang = translation.get_language()
-        morph = pymorphy2.MorphAnalyzer(lang=current_lang)
-        parser = morph.parse(date[1])[0]
-        gent = parser.inflect({"gent"})
-        date[1] = gent.word
-        date = " ".join(date).upper()
+        date = format_date_label(obj.date.date(), "d E")
         summary = _("{date}, {time}, ЗАЛ №{hall_number}").format(
             date=date, time=obj.date.strftime("%H:%M"), hall_number=obj.hall.number
         )
@@ -86,8 +77,12 @@ class SeanceOutSchema(ModelSchema):
 
     @staticmethod
     def resolve_booking(obj: Seance) -> bool:
-        seats_count = obj.hall.layout["seatsCount"]
-        tickets_count = obj.ticket_set.count()
+        if hasattr(obj, "tickets_count"):
+            seats_count = obj.seats_count
+            tickets_count = obj.tickets_count
+        else:
+            seats_count = obj.hall.layout["seatsCount"]
+            tickets_count = obj.ticket_set.count()
         if seats_count == tickets_count:
             return False
         today = timezone.now()
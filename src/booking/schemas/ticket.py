@@ -1,3 +1,5 @@
+from datetime import datetime
+
 from ninja import Schema
 
 
@@ -13,3 +15,16 @@ class BuyTicketSchema(Schema):
 
     seance_id: int
     tickets: list[TicketSchema]
+
+
+class SeatHoldOutSchema(Schema):
+    """Pydantic schema for showing hold of seats."""
+
+    hold_id: str
+    expires_at: datetime
+
+
+class SeatHoldConfirmSchema(Schema):
+    """Pydantic schema for confirming hold of seats."""
+
+    hold_id: str
@@ -1,10 +1,18 @@
-from datetime import timedelta
+from collections.abc import AsyncIterator
+from datetime import datetime
 
-from django.db.models import QuerySet
 from django.utils import timezone
+from django.utils.translation import gettext as _
 
+from src.booking.models import Seance
 from src.booking.models import Ticket
 from src.booking.schemas.ticket import BuyTicketSchema
+from src.booking.schemas.ticket import SeatHoldOutSchema
+from src.booking.utils import TICKET_EVENT_ID_RE
+from src.booking.utils import get_recent_tickets
+from src.booking.utils import stream_tickets
+from src.core.errors import NotFoundExceptionError
+from src.core.errors import UnprocessableEntityExceptionError
 from src.core.schemas.base import MessageOutSchema
 
 
@@ -21,7 +29,34 @@ class TicketService:
         return result
 
     @staticmethod
-    def get_tickets(seance_id: int) -> QuerySet[Ticket]:
+    def hold_tickets(payload: BuyTicketSchema) -> SeatHoldOutSchema:
+        """Hold seats of séance till payment.
+        :param payload: contains data for holding tickets
+        """
+        hold = Ticket.objects.hold_tickets(payload=payload)
+        expires_at = datetime.fromtimestamp(
+            hold.expires_at, tz=timezone.get_current_timezone()
+        )
+        return SeatHoldOutSchema(hold_id=hold.hold_id, expires_at=expires_at)
+
+    @staticmethod
+    def confirm_hold(hold_id: str) -> MessageOutSchema:
+        """Buy tickets for held seats.
+        :param hold_id: id of hold
+        """
+        result = Ticket.objects.confirm_hold(hold_id=hold_id)
+        return result
+
+    @staticmethod
+    def release_hold(hold_id: str) -> MessageOutSchema:
+        """Cancel hold of seats.
+        :param hold_id: id of hold
+        """
+        result = Ticket.objects.release_hold(hold_id=hold_id)
+        return result
+
+    @staticmethod
+    def get_tickets(seance_id: int) -> list[dict]:
         """Get tickets by séance id.
         :param seance_id: id of séance
         """
@@ -29,11 +64,23 @@ class TicketService:
         return result
 
     @staticmethod
-    def get_recently_tickets(seance_id: int) -> QuerySet[Ticket]:
-        """Get tickets by séance id.
+    def get_recently_tickets(seance_id: int) -> list[dict]:
+        """Get tickets bought during last minute by séance id.
         :param seance_id: id of séance
         """
-        today = timezone.now()
-        today = today - timedelta(minutes=1)
-        tickets = Ticket.objects.filter(seance_id=seance_id, date_created__gte=today)
+        tickets = get_recent_tickets(seance_id=seance_id, seconds=60)
         return tickets
+
+    @staticmethod
+    async def stream_tickets(seance_id: int, cursor: str | None) -> AsyncIterator[str]:
+        """Get stream of events about bought tickets by séance id.
+        :param seance_id: id of séance
+        :param cursor: id of last event received by client
+        """
+        if cursor and not TICKET_EVENT_ID_RE.fullmatch(cursor):
+            msg = _("Некоректний ідентифікатор події: {cursor}").format(cursor=cursor)
+            raise UnprocessableEntityExceptionError(message=msg, field="cursor")
+        if not await Seance.objects.filter(id=seance_id).aexists():
+            msg = _("Не знайдено: немає збігів сеансів " "на заданному запиті.")
+            raise NotFoundExceptionError(message=msg, cls_model=Seance)
+        return stream_tickets(seance_id=seance_id, cursor=cursor)
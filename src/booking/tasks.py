@@ -0,0 +1,30 @@
+"""Celery tasks for booking"""
+
+from datetime import timedelta
+
+from celery.app import shared_task
+from django.utils import timezone
+
+from src.booking.models import Ticket
+from src.booking.models import TicketSales
+
+
+@shared_task()
+def release_expired_holds() -> int:
+    """Make seats of expired holds free again.
+    :return: count of released holds
+    """
+    return Ticket.objects.release_expired_holds()
+
+
+@shared_task()
+def rebuild_ticket_sales(days: int | None = 62) -> int:
+    """Recount ticket sales rollup from bought tickets.
+    Fixes rows which were missed or changed by deleting of tickets
+    :param days: count of last days for recounting, all days if None
+    :return: count of rollup rows
+    """
+    start = None
+    if days is not None:
+        start = timezone.localdate() - timedelta(days=days)
+    return TicketSales.objects.rebuild(start=start)
@@ -0,0 +1,353 @@
+"""Common utils for booking app"""
+
+import json
+import re
+import time
+import uuid
+from collections.abc import AsyncIterator
+from collections.abc import Iterable
+
+from django.conf import settings
+from django_redis import get_redis_connection
+from redis import asyncio as aioredis
+
+from src.cinemas.utils import SeatIndex
+
+OCCUPANCY_KEY = "seance_occupancy:{seance_id}"
+OCCUPANCY_TIMEOUT = 60 * 60 * 24
+SEANCE_HALL_KEY = "seance_hall:{seance_id}"
+SEAT_HOLD_KEY = "seat_hold:{hold_id}"
+SEAT_HOLDS_KEY = "seat_holds"
+SEANCE_HOLDS_KEY = "seance_holds:{seance_id}"
+SEAT_HOLD_TIMEOUT = 60 * 10
+SEAT_HOLD_GRACE = 60 * 10
+TICKET_EVENTS_KEY = "seance_events:{seance_id}"
+TICKET_EVENTS_MAXLEN = 1000
+TICKET_EVENTS_BLOCK = 15_000
+TICKET_EVENTS_LIFETIME = 60 * 5
+TICKET_EVENT_ID_RE = re.compile(r"\d+-\d+|\$")
+TICKET_EVENTS_POOL = aioredis.ConnectionPool.from_url(
+    settings.CACHES["default"]["LOCATION"]
+)
+
+RESERVE_SCRIPT = """
+if redis.call("EXISTS", KEYS[1]) == 0 then
+    return -1
+end
+for _, offset in ipairs(ARGV) do
+    if redis.call("GETBIT", KEYS[1], offset) == 1 then
+        return 0
+    end
+end
+for _, offset in ipairs(ARGV) do
+    redis.call("SETBIT", KEYS[1], offset, 1)
+end
+return 1
+"""
+
+RELEASE_SCRIPT = """
+if redis.call("EXISTS", KEYS[1]) == 0 then
+    return 0
+end
+for _, offset in ipairs(ARGV) do
+    redis.call("SETBIT", KEYS[1], offset, 0)
+end
+return 1
+"""
+
+
+class SeanceOccupancy:
+    """Bitmap of occupied seats of séance which is stored in redis.
+    Every bit is a seat of hall (position of seat is taken from SeatIndex),
+    bit equals 1 when ticket for this seat is bought.
+    Reserving and releasing of seats are made by lua scripts,
+    so they are atomic for all workers
+    :param seance_id: id of séance
+    :param seat_index: compiled layout of séance's hall
+    """
+
+    def __init__(self, seance_id: int, seat_index: SeatIndex):
+        self.seance_id = seance_id
+        self.seat_index = seat_index
+        self.key = OCCUPANCY_KEY.format(seance_id=seance_id)
+        self.redis = get_redis_connection("default")
+
+    def exists(self) -> bool:
+        """Check that bitmap is loaded to redis."""
+        return bool(self.redis.exists(self.key))
+
+    def load(self, locations: Iterable[tuple[int, int]]) -> None:
+        """Load bitmap to redis if it isn't loaded yet.
+        :param locations: (row, seat) pairs of bought tickets and active holds
+        """
+        bitmap = bytearray(len(self.seat_index) // 8 + 1)
+        for location in locations:
+            if location in self.seat_index:
+                offset = self.seat_index.offset(location)
+                bitmap[offset // 8] |= 0x80 >> (offset % 8)
+        self.redis.set(self.key, bytes(bitmap), ex=OCCUPANCY_TIMEOUT, nx=True)
+
+    def reserve(self, locations: list[tuple[int, int]]) -> bool | None:
+        """Mark seats as occupied if all of them are free.
+        :param locations: (row, seat) pairs of tickets
+        :return: True if seats were reserved, False if some of them
+        are occupied already and None if bitmap isn't loaded
+        """
+        offsets = [self.seat_index.offset(location) for location in locations]
+        script = self.redis.register_script(RESERVE_SCRIPT)
+        result = script(keys=[self.key], args=offsets)
+        if result == -1:
+            return None
+        return bool(result)
+
+    def release(self, locations: list[tuple[int, int]]) -> None:
+        """Mark seats as free, seats which aren't present
+        in layout of hall anymore are skipped.
+        :param locations: (row, seat) pairs of tickets
+        """
+        offsets = [
+            self.seat_index.offset(location)
+            for location in locations
+            if location in self.seat_index
+        ]
+        script = self.redis.register_script(RELEASE_SCRIPT)
+        script(keys=[self.key], args=offsets)
+
+    def drop(self) -> None:
+        """Remove bitmap from redis, it will be loaded again from db."""
+        self.redis.delete(self.key)
+
+    def get_occupied(self) -> list[tuple[int, int]] | None:
+        """Get (row, seat) pairs of occupied seats.
+        :return: list of pairs or None if bitmap isn't loaded
+        """
+        bitmap = self.redis.get(self.key)
+        if bitmap is None:
+            return None
+        offsets = [
+            index * 8 + bit
+            for index, byte in enumerate(bitmap)
+            if byte
+            for bit in range(8)
+            if byte & (0x80 >> bit)
+        ]
+        return self.seat_index.locations(offsets)
+
+
+class SeatHold:
+    """Temporary hold of séance seats which is stored in redis.
+    Seats of hold are occupied in SeanceOccupancy bitmap till hold
+    is confirmed (converted to tickets), released or expired.
+    All active holds are kept in sorted set by expiration time,
+    removing hold from this set is used as atomic claim of hold,
+    so hold can be confirmed or released only by one worker.
+    Ids of holds are also kept in set of séance, so seats of holds
+    are put to bitmap when it is loaded again
+    :param hold_id: unique id of hold
+    :param seance_id: id of séance
+    :param hall_id: id of séance's hall
+    :param locations: (row, seat) pairs of held seats
+    :param expires_at: unix time when hold expires
+    """
+
+    def __init__(
+        self,
+        hold_id: str,
+        seance_id: int,
+        hall_id: int,
+        locations: list[tuple[int, int]],
+        expires_at: float,
+    ):
+        self.hold_id = hold_id
+        self.seance_id = seance_id
+        self.hall_id = hall_id
+        self.locations = locations
+        self.expires_at = expires_at
+        self.key = SEAT_HOLD_KEY.format(hold_id=hold_id)
+        self.redis = get_redis_connection("default")
+
+    @classmethod
+    def create(
+        cls, seance_id: int, hall_id: int, locations: list[tuple[int, int]]
+    ) -> "SeatHold":
+        """Create hold and save it to redis.
+        :param seance_id: id of séance
+        :param hall_id: id of séance's hall
+        :param locations: (row, seat) pairs of held seats
+        :return: SeatHold instance
+        """
+        hold = cls(
+            hold_id=uuid.uuid4().hex,
+            seance_id=seance_id,
+            hall_id=hall_id,
+            locations=locations,
+            expires_at=time.time() + SEAT_HOLD_TIMEOUT,
+        )
+        data = {
+            "seance_id": seance_id,
+            "hall_id": hall_id,
+            "locations": locations,
+            "expires_at": hold.expires_at,
+        }
+        seance_key = SEANCE_HOLDS_KEY.format(seance_id=seance_id)
+        pipe = hold.redis.pipeline()
+        pipe.set(hold.key, json.dumps(data), ex=SEAT_HOLD_TIMEOUT + SEAT_HOLD_GRACE)
+        pipe.zadd(SEAT_HOLDS_KEY, {hold.hold_id: hold.expires_at})
+        pipe.sadd(seance_key, hold.hold_id)
+        pipe.expire(seance_key, OCCUPANCY_TIMEOUT)
+        pipe.execute()
+        return hold
+
+    @classmethod
+    def get(cls, hold_id: str) -> "SeatHold | None":
+        """Get hold from redis.
+        :param hold_id: unique id of hold
+        :return: SeatHold instance or None if hold doesn't exist
+        """
+        redis = get_redis_connection("default")
+        data = redis.get(SEAT_HOLD_KEY.format(hold_id=hold_id))
+        if data is None:
+            return None
+        data = json.loads(data)
+        return cls(
+            hold_id=hold_id,
+            seance_id=data["seance_id"],
+            hall_id=data["hall_id"],
+            locations=[tuple(location) for location in data["locations"]],
+            expires_at=data["expires_at"],
+        )
+
+    @staticmethod
+    def get_held_locations(seance_id: int) -> list[tuple[int, int]]:
+        """Get seats of all holds of séance which aren't removed yet,
+        claimed and expired holds occupy seats till they are processed.
+        :param seance_id: id of séance
+        :return: (row, seat) pairs of held seats
+        """
+        redis = get_redis_connection("default")
+        seance_key = SEANCE_HOLDS_KEY.format(seance_id=seance_id)
+        hold_ids = [hold_id.decode() for hold_id in redis.smembers(seance_key)]
+        if not hold_ids:
+            return []
+        holds = redis.mget(
+            [SEAT_HOLD_KEY.format(hold_id=hold_id) for hold_id in hold_ids]
+        )
+        locations = []
+        lost = []
+        for hold_id, data in zip(hold_ids, holds):
+            if data is None:
+                lost.append(hold_id)
+                continue
+            hold_locations = json.loads(data)["locations"]
+            locations.extend(tuple(location) for location in hold_locations)
+        if lost:
+            redis.srem(seance_key, *lost)
+        return locations
+
+    @staticmethod
+    def get_expired_ids() -> list[str]:
+        """Get ids of all holds which are expired."""
+        redis = get_redis_connection("default")
+        hold_ids = redis.zrangebyscore(SEAT_HOLDS_KEY, 0, time.time())
+        return [hold_id.decode() for hold_id in hold_ids]
+
+    @staticmethod
+    def discard(hold_id: str) -> None:
+        """Remove id of hold which data is already lost from active holds.
+        :param hold_id: unique id of hold
+        """
+        get_redis_connection("default").zrem(SEAT_HOLDS_KEY, hold_id)
+
+    @property
+    def is_expired(self) -> bool:
+        """Check that hold is expired."""
+        return self.expires_at <= time.time()
+
+    def claim(self) -> bool:
+        """Take hold for processing.
+        :return: True if hold was taken by this call
+        """
+        return bool(self.redis.zrem(SEAT_HOLDS_KEY, self.hold_id))
+
+    def restore(self) -> None:
+        """Return claimed hold back to the list of active holds."""
+        self.redis.zadd(SEAT_HOLDS_KEY, {self.hold_id: self.expires_at})
+
+    def delete(self) -> None:
+        """Remove hold from redis."""
+        pipe = self.redis.pipeline()
+        pipe.delete(self.key)
+        pipe.srem(SEANCE_HOLDS_KEY.format(seance_id=self.seance_id), self.hold_id)
+        pipe.execute()
+
+
+def publish_tickets(seance_id: int, locations: list[tuple[int, int]]) -> str:
+    """Publish event about bought tickets to redis stream of séance.
+    :param seance_id: id of séance
+    :param locations: (row, seat) pairs of bought tickets
+    :return: id of event in stream
+    """
+    redis = get_redis_connection("default")
+    key = TICKET_EVENTS_KEY.format(seance_id=seance_id)
+    tickets = [{"row": row, "seat": seat} for row, seat in locations]
+    pipe = redis.pipeline()
+    pipe.xadd(
+        key,
+        {"tickets": json.dumps(tickets)},
+        maxlen=TICKET_EVENTS_MAXLEN,
+        approximate=True,
+    )
+    pipe.expire(key, OCCUPANCY_TIMEOUT)
+    event_id, _ = pipe.execute()
+    return event_id.decode()
+
+
+def get_recent_tickets(seance_id: int, seconds: int) -> list[dict]:
+    """Get tickets which were published to stream of séance recently.
+    Ids of events in redis stream are unix time in milliseconds,
+    so range of stream is read without scanning tickets table
+    :param seance_id: id of séance
+    :param seconds: how old events can be
+    :return: list of tickets locations
+    """
+    redis = get_redis_connection("default")
+    key = TICKET_EVENTS_KEY.format(seance_id=seance_id)
+    start = int((time.time() - seconds) * 1000)
+    events = redis.xrange(key, min=f"{start}-0", max="+")
+    tickets = []
+    for _, fields in events:
+        tickets.extend(json.loads(fields[b"tickets"]))
+    return tickets
+
+
+async def stream_tickets(seance_id: int, cursor: str | None) -> AsyncIterator[str]:
+    """Stream events about bought tickets of séance in server-sent events format.
+    Every event has id of redis stream entry, client can pass it back
+    (Last-Event-ID header) to continue stream after reconnect.
+    Stream is closed after TICKET_EVENTS_LIFETIME seconds, so connections
+    of gone clients don't hold worker forever, client just reconnects
+    :param seance_id: id of séance
+    :param cursor: id of last event received by client,
+    "$" or None to stream only new events
+    """
+    redis = aioredis.Redis(connection_pool=TICKET_EVENTS_POOL)
+    key = TICKET_EVENTS_KEY.format(seance_id=seance_id)
+    try:
+        if not cursor or cursor == "$":
+            last_events = await redis.xrevrange(key, count=1)
+            cursor = last_events[0][0].decode() if last_events else "0-0"
+        yield "retry: 3000\n\n"
+        deadline = time.monotonic() + TICKET_EVENTS_LIFETIME
+        while time.monotonic() < deadline:
+            response = await redis.xread(
+                {key: cursor}, count=100, block=TICKET_EVENTS_BLOCK
+            )
+            if not response:
+                yield ": ping\n\n"
+                continue
+            for event_id, fields in response[0][1]:
+                cursor = event_id.decode()
+                data = fields[b"tickets"].decode()
+                yield f"id: {cursor}\nevent: tickets\ndata: {data}\n\n"
+    finally:
+        await redis.aclose()
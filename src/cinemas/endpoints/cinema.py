@@ -12,6 +12,7 @@ from ninja_extra.permissions import IsAdminUser
 from ninja_extra.schemas.response import PaginatedResponseSchema
 
 from src.cinemas.models import Cinema
+from src.cinemas.models import Hall
 from src.cinemas.schemas.cinema import CinemaCardOutSchema
 from src.cinemas.schemas.cinema import CinemaClientOutSchema
 from src.cinemas.schemas.cinema import CinemaContactOutSchema
@@ -23,11 +24,15 @@ from src.cinemas.services.cinema import CinemaService
 from src.core.errors import NotFoundExceptionError
 from src.core.errors import NotUniqueFieldExceptionError
 from src.core.errors import UnprocessableEntityExceptionError
+from src.core.models import Gallery
 from src.core.models import Image
 from src.core.schemas.base import LangEnum
 from src.core.schemas.base import MessageOutSchema
 from src.core.schemas.base import errors_to_docs
 from src.core.utils import CustomJWTAuth
+from src.core.utils import cache_response
+from src.core.utils import versioned_response
+from src.movies.models import Tech
 
 
 @api_controller("/cinema", tags=["cinemas"])
@@ -320,6 +325,7 @@ class CinemaClientController(ControllerBase):
             ),
         },
     )
+    @cache_response(Cinema, Image)
     @paginate()
     def get_all_cinema_contacts(
         self,
@@ -350,6 +356,8 @@ class CinemaClientController(ControllerBase):
             ),
         },
     )
+    @versioned_response(Cinema, "cnm_slug")
+    @cache_response(Cinema, Hall, Tech, Image, Gallery)
     def get_cinema_by_slug(
         self,
         request: HttpRequest,
@@ -11,6 +11,7 @@ from ninja_extra.pagination.decorator import paginate
 from ninja_extra.permissions import IsAdminUser
 from ninja_extra.schemas.response import PaginatedResponseSchema
 
+from src.cinemas.models import Cinema
 from src.cinemas.models import Hall
 from src.cinemas.schemas.hall import HallCardOutSchema, HallClientOutSchema
 from src.cinemas.schemas.hall import HallInSchema
@@ -22,11 +23,13 @@ from src.core.errors import InvalidTokenExceptionError
 from src.core.errors import NotFoundExceptionError
 from src.core.errors import NotUniqueFieldExceptionError
 from src.core.errors import UnprocessableEntityExceptionError
+from src.core.models import Gallery
 from src.core.models import Image
 from src.core.schemas.base import LangEnum
 from src.core.schemas.base import MessageOutSchema
 from src.core.schemas.base import errors_to_docs
 from src.core.utils import CustomJWTAuth
+from src.core.utils import cache_response
 from src.movies.models import Tech
 
 
@@ -334,6 +337,7 @@ class HallClientController(ControllerBase):
             ),
         },
     )
+    @cache_response(Hall)
     def get_hall_schema(
         self,
         request: HttpRequest,
@@ -371,6 +375,7 @@ class HallClientController(ControllerBase):
             ),
         },
     )
+    @cache_response(Hall, Cinema, Image, Gallery)
     def get_hall_by_id(
         self,
         request: HttpRequest,
@@ -1,8 +1,12 @@
 from typing import TYPE_CHECKING
 
+from django.core.cache import cache
 from django.db import models
 from django.utils.translation import gettext as _
 
+from src.cinemas.utils import SEAT_INDEX_KEY
+from src.cinemas.utils import SEAT_INDEX_TIMEOUT
+from src.cinemas.utils import SeatIndex
 from src.core.errors import NotFoundExceptionError
 
 if TYPE_CHECKING:
@@ -41,3 +45,44 @@ class HallManager(models.Manager):
             msg = _("Не знайдено: немає збігів залів " "на заданному запиті.")
             raise NotFoundExceptionError(message=msg, cls_model=self.model)
         return hall
+
+    def get_seat_index(self, hall_id: int) -> SeatIndex:
+        """Get compiled seat index of hall with the given hall id.
+        Index is taken from cache and compiled from layout
+        only if cache is empty for this hall
+        :param hall_id: id of hall
+        :rtype: SeatIndex
+        :return: SeatIndex instance
+        """
+        seat_index = cache.get(SEAT_INDEX_KEY.format(hall_id=hall_id))
+        if seat_index is None:
+            try:
+                layout = self.model.objects.values_list("layout", flat=True).get(
+                    id=hall_id
+                )
+            except self.model.DoesNotExist:
+                msg = _("Не знайдено: немає збігів залів " "на заданному запиті.")
+                raise NotFoundExceptionError(message=msg, cls_model=self.model)
+            seat_index = self.cache_seat_index(hall_id=hall_id, layout=layout)
+        return seat_index
+
+    @staticmethod
+    def cache_seat_index(hall_id: int, layout: dict) -> SeatIndex:
+        """Compile layout of hall and save it to cache.
+        :param hall_id: id of hall
+        :param layout: JSON layout of hall
+        :rtype: SeatIndex
+        :return: SeatIndex instance
+        """
+        seat_index = SeatIndex.from_layout(layout)
+        cache.set(
+            SEAT_INDEX_KEY.format(hall_id=hall_id), seat_index, SEAT_INDEX_TIMEOUT
+        )
+        return seat_index
+
+    @staticmethod
+    def invalidate_seat_index(hall_id: int) -> None:
+        """Remove compiled seat index of hall from cache.
+        :param hall_id: id of hall
+        """
+        cache.delete(SEAT_INDEX_KEY.format(hall_id=hall_id))
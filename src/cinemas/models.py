@@ -6,10 +6,11 @@ from phonenumber_field.modelfields import PhoneNumberField
 from src.cinemas.managers.cinema import CinemaManager
 from src.cinemas.managers.hall import HallManager
 from src.core.models import Seo
+from src.core.models import Versioned
 
 
 # Create your models here.
-class Cinema(Seo):
+class Cinema(Seo, Versioned):
     """Описание Cinema.
     Наследуется от abstract model Seo, и наследует все её поля
 
@@ -9,6 +9,7 @@ from pydantic.fields import Field
 from config.settings.settings import GOOGLE_MAPS_API_KEY
 from src.cinemas.models import Cinema
 from src.core.schemas.gallery import GalleryItemSchema
+from src.core.schemas.images import ImageCardOutSchema
 from src.core.schemas.images import ImageInSchema
 from src.core.schemas.images import ImageOutSchema
 from src.core.schemas.images import ImageUpdateSchema
@@ -62,7 +63,7 @@ class CinemaInSchema(ninja_schema.ModelSchema):
 class CinemaCardOutSchema(ModelSchema):
     """Pydantic schema for showing cinema card."""
 
-    banner: ImageOutSchema
+    banner: ImageCardOutSchema
 
     class Meta:
         model = Cinema
@@ -76,7 +77,7 @@ class CinemaCardOutSchema(ModelSchema):
 class CinemaOutSchema(ModelSchema):
     """Pydantic schema for showing cinema full data."""
 
-    banner: ImageOutSchema
+    banner: ImageCardOutSchema
     logo: ImageOutSchema
     seo_image: ImageOutSchema
 
@@ -104,7 +105,7 @@ class CinemaOutSchema(ModelSchema):
 class CinemaClientOutSchema(ModelSchema):
     """Pydantic schema for showing cinema full data in client site."""
 
-    banner: ImageOutSchema
+    banner: ImageCardOutSchema
     logo: ImageOutSchema
     seo_image: ImageOutSchema
     techs: list[TechOutSchema]
@@ -140,7 +141,7 @@ class CinemaClientOutSchema(ModelSchema):
 class CinemaContactOutSchema(ModelSchema):
     """Pydantic schema for showing cinema contacts."""
 
-    banner: ImageOutSchema
+    banner: ImageCardOutSchema
     logo: ImageOutSchema
 
     @staticmethod
@@ -6,6 +6,7 @@ from pydantic.fields import Field
 from src.cinemas.models import Hall
 from src.core.errors import NotFoundExceptionError
 from src.core.schemas.gallery import GalleryItemSchema
+from src.core.schemas.images import ImageCardOutSchema
 from src.core.schemas.images import ImageInSchema
 from src.core.schemas.images import ImageOutSchema
 from src.core.schemas.images import ImageUpdateSchema
@@ -68,7 +69,7 @@ class HallCardOutSchema(ModelSchema):
 class HallOutSchema(ModelSchema):
     """Pydantic schema for showing hall full data."""
 
-    banner: ImageOutSchema
+    banner: ImageCardOutSchema
     seo_image: ImageOutSchema
     tech: TechOutSchema
 
@@ -91,7 +92,7 @@ class HallOutSchema(ModelSchema):
 class HallClientOutSchema(ModelSchema):
     """Pydantic schema for showing hall full data in the client site."""
 
-    banner: ImageOutSchema
+    banner: ImageCardOutSchema
     seo_image: ImageOutSchema
     tech: TechOutSchema
 
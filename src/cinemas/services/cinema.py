@@ -11,7 +11,7 @@ from src.core.schemas.base import MessageOutSchema
 from src.core.services.core import CoreService
 from src.core.services.gallery import GalleryService
 from src.core.services.images import ImageService
-from src.core.utils import make_slug
+from src.core.services.slug import SlugService
 
 
 class CinemaService:
@@ -23,10 +23,12 @@ class CinemaService:
         image_service: ImageService,
         core_service: CoreService,
         gallery_service: GalleryService,
+        slug_service: SlugService,
     ):
         self.image_service = image_service
         self.gallery_service = gallery_service
         self.core_service = core_service
+        self.slug_service = slug_service
 
     def create(self, request: HttpRequest, schema: CinemaInSchema) -> MessageOutSchema:
         """Create cinema."""
@@ -36,14 +38,15 @@ class CinemaService:
         self.core_service.check_field_unique(
             value=schema.name_ru, field_name="name_ru", model=Cinema
         )
-        bodies = [schema.banner, schema.logo, schema.seo_image]
-        banner, logo, seo_image = self.image_service.bulk_create(schemas=bodies)
-        gallery = self.gallery_service.create(images=schema.gallery)
+        bodies = [schema.banner, schema.logo, schema.seo_image, *(schema.gallery or [])]
+        banner, logo, seo_image, *gallery_images = self.image_service.bulk_create(
+            schemas=bodies
+        )
+        gallery = self.gallery_service.create(images=gallery_images)
 
-        Cinema.objects.create(
+        cinema = Cinema(
             name_uk=schema.name_uk,
             name_ru=schema.name_ru,
-            slug=make_slug(value=schema.name_uk, model=Cinema),
             description_uk=schema.description_uk,
             description_ru=schema.description_ru,
             email=schema.email,
@@ -61,6 +64,7 @@ class CinemaService:
             seo_description=schema.seo_description,
             seo_image=seo_image,
         )
+        self.slug_service.save(instance=cinema, value=cinema.name_uk)
         return MessageOutSchema(detail=_("Кінотеатр успішно створений"))
 
     def update(
@@ -74,17 +78,18 @@ class CinemaService:
         self.core_service.check_field_unique(
             value=schema.name_ru, field_name="name_ru", instance=cinema, model=Cinema
         )
+        self.image_service.check_updates(
+            [schema.banner, schema.logo, schema.seo_image]
+        )
+        self.gallery_service.update(schemas=schema.gallery, gallery=cinema.gallery)
         self.image_service.update(schema.banner, cinema.banner)
         self.image_service.update(schema.logo, cinema.logo)
         self.image_service.update(schema.seo_image, cinema.seo_image)
-
-        self.gallery_service.update(schemas=schema.gallery, gallery=cinema.gallery)
         expt_list = ["banner", "logo", "seo_image", "gallery"]
         for attr, value in schema.dict().items():
             if attr not in expt_list and value is not None:
                 setattr(cinema, attr, value)
-        cinema.slug = make_slug(value=cinema.name_uk, model=Cinema, instance=cinema)
-        cinema.save()
+        self.slug_service.save(instance=cinema, value=cinema.name_uk)
         return MessageOutSchema(detail=_("Кінотеатр успішно оновлений"))
 
     @staticmethod
@@ -3,6 +3,7 @@
 from django.utils.translation import gettext as _
 from injector import inject
 
+from src.booking.models import Ticket
 from src.cinemas.models import Cinema
 from src.cinemas.models import Hall
 from src.cinemas.schemas.hall import HallInSchema
@@ -33,10 +34,12 @@ class HallService:
         """Create hall."""
         cinema = self.cinema_service.get_by_slug(cnm_slug)
         self.check_number_unique(cinema=cinema, number=schema.number)
-        bodies = [schema.banner, schema.seo_image]
-        banner, seo_image = self.image_service.bulk_create(schemas=bodies)
-        gallery = self.gallery_service.create(images=schema.gallery)
-        Hall.objects.create(
+        bodies = [schema.banner, schema.seo_image, *(schema.gallery or [])]
+        banner, seo_image, *gallery_images = self.image_service.bulk_create(
+            schemas=bodies
+        )
+        gallery = self.gallery_service.create(images=gallery_images)
+        hall = Hall.objects.create(
             number=schema.number,
             description_uk=schema.description_uk,
             description_ru=schema.description_ru,
@@ -49,21 +52,28 @@ class HallService:
             seo_description=schema.seo_description,
             seo_image=seo_image,
         )
+        Hall.objects.cache_seat_index(hall_id=hall.id, layout=hall.layout)
+        Cinema.touch(id=cinema.id)
         return MessageOutSchema(detail=_("Зал успішно створений"))
 
     def update(self, hall_id: int, schema: HallUpdateSchema) -> MessageOutSchema:
         """Update hall."""
         hall = Hall.objects.get_by_id(hall_id=hall_id)
         self.check_number_unique(cinema=hall.cinema, number=schema.number, hall=hall)
+        self.image_service.check_updates([schema.banner, schema.seo_image])
+        self.gallery_service.update(schemas=schema.gallery, gallery=hall.gallery)
         self.image_service.update(schema.banner, hall.banner)
         self.image_service.update(schema.seo_image, hall.seo_image)
-
-        self.gallery_service.update(schemas=schema.gallery, gallery=hall.gallery)
+        layout = hall.layout
         expt_list = ["banner", "seo_image", "gallery"]
         for attr, value in schema.dict().items():
             if attr not in expt_list and value is not None:
                 setattr(hall, attr, value)
         hall.save()
+        if hall.layout != layout:
+            Hall.objects.cache_seat_index(hall_id=hall.id, layout=hall.layout)
+            Ticket.objects.drop_occupancies(hall_id=hall.id)
+        Cinema.touch(id=hall.cinema_id)
         return MessageOutSchema(detail=_("Зал успішно оновлений"))
 
     @staticmethod
@@ -114,7 +124,9 @@ class HallService:
             hall.banner_id,
         ]
         gallery = hall.gallery
+        Hall.objects.invalidate_seat_index(hall_id=hall.id)
         hall.delete()
+        Cinema.touch(id=hall.cinema_id)
         gallery_imgs_ids = list(gallery.images.values_list("id", flat=True))
         gallery.delete()
         imgs_ids_for_delete = hall_imgs_ids + gallery_imgs_ids
@@ -3,6 +3,7 @@ from ninja_extra.testing import TestClient
 
 from ...core.management.commands.init_script import Command
 from ..endpoints.hall import HallController
+from ..utils import SeatIndex
 
 
 @pytest.mark.django_db()
@@ -194,3 +195,20 @@ class TestHallAdminController:
     def test_delete_hall(self, hall_id, expected_status):
         response = self.client.delete(f"/{hall_id}/", headers=self.headers)
         assert response.status_code == expected_status
+
+
+class TestSeatIndex:
+    def test_from_layout(self):
+        layout = {
+            "seatsCount": 3,
+            "rows": [
+                {"number": 1, "seats": [{"number": 1}, {}, {"number": 2}]},
+                {},
+                {"number": 2, "seats": [{"number": 1}]},
+            ],
+        }
+        seat_index = SeatIndex.from_layout(layout)
+        assert seat_index.seats_count == 3
+        assert (1, 2) in seat_index
+        assert (2, 1) in seat_index
+        assert (2, 2) not in seat_index
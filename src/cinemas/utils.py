@@ -0,0 +1,66 @@
+"""Common utils for cinemas app"""
+
+SEAT_INDEX_KEY = "hall_seat_index:{hall_id}"
+SEAT_INDEX_TIMEOUT = 60 * 60 * 24
+
+
+class SeatIndex:
+    """Compiled representation of hall layout.
+    Layout of hall is stored like nested JSON (rows -> seats)
+    with empty dicts for passages, so for checking that seat exists
+    we keep here only valid (row, seat) pairs and count of seats.
+    Every pair has its own position(offset) in order of layout,
+    it is used for storing occupied seats of séance in bitmap
+    :param seats: dict of valid (row, seat) pairs and their offsets
+    :param seats_count: count of seats in hall
+    """
+
+    __slots__ = ("seats", "seats_count")
+
+    def __init__(self, seats: dict[tuple[int, int], int], seats_count: int):
+        self.seats = seats
+        self.seats_count = seats_count
+
+    @classmethod
+    def from_layout(cls, layout: dict) -> "SeatIndex":
+        """Compile hall layout to seat index.
+        :param layout: JSON layout of hall
+        :return: SeatIndex instance
+        """
+        locations = (
+            (row["number"], seat["number"])
+            for row in layout.get("rows", [])
+            if "number" in row
+            for seat in row.get("seats", [])
+            if "number" in seat
+        )
+        seats = {}
+        for location in locations:
+            seats.setdefault(location, len(seats))
+        seats_count = layout.get("seatsCount", len(seats))
+        return cls(seats=seats, seats_count=seats_count)
+
+    def offset(self, location: tuple[int, int]) -> int:
+        """Get position of seat in bitmap.
+        :param location: (row, seat) pair
+        """
+        return self.seats[location]
+
+    def locations(self, offsets: list[int]) -> list[tuple[int, int]]:
+        """Get (row, seat) pairs by their positions in bitmap.
+        :param offsets: positions of seats in bitmap
+        """
+        locations = list(self.seats)
+        return [locations[offset] for offset in offsets if offset < len(locations)]
+
+    def __contains__(self, location: tuple[int, int]) -> bool:
+        return location in self.seats
+
+    def __len__(self) -> int:
+        return len(self.seats)
+
+    def __getstate__(self) -> tuple:
+        return self.seats, self.seats_count
+
+    def __setstate__(self, state: tuple) -> None:
+        self.seats, self.seats_count = state
@@ -0,0 +1,85 @@
+"""Image endpoints"""
+
+from django.http import HttpRequest
+from ninja import File
+from ninja import Form
+from ninja import Header
+from ninja.files import UploadedFile
+from ninja_extra import http_post
+from ninja_extra.controllers.base import ControllerBase
+from ninja_extra.controllers.base import api_controller
+from ninja_extra.permissions.common import IsAdminUser
+
+from src.core.errors import InvalidTokenExceptionError
+from src.core.errors import UnprocessableEntityExceptionError
+from src.core.models import Image
+from src.core.schemas.base import LangEnum
+from src.core.schemas.base import errors_to_docs
+from src.core.schemas.images import ImageUploadOutSchema
+from src.core.services.images import ImageService
+from src.core.utils import CustomJWTAuth
+
+
+@api_controller(
+    "/image",
+    tags=["images"],
+    permissions=[IsAdminUser()],
+    auth=CustomJWTAuth(),
+)
+class ImageController(ControllerBase):
+    """A controller class for managing images in system.
+
+    This class provides endpoints for
+    uploading images in the site
+    """
+
+    def __init__(self, image_service: ImageService):
+        """Use this method to inject "services" to ImageController.
+
+        :param image_service: variable for managing images
+        """
+        self.image_service = image_service
+
+    @http_post(
+        "/upload/",
+        response=ImageUploadOutSchema,
+        openapi_extra={
+            "operationId": "upload_image",
+            "responses": errors_to_docs(
+                {
+                    401: [InvalidTokenExceptionError()],
+                    422: [UnprocessableEntityExceptionError()],
+                }
+            ),
+        },
+    )
+    def upload_image(
+        self,
+        request: HttpRequest,
+        file: UploadedFile = File(...),
+        alt: str = Form(None, max_length=60),
+        accept_lang: LangEnum = Header(alias="Accept-Language", default="uk"),
+    ) -> Image:
+        """Upload image by multipart form, file is written
+        to temporary file on disk instead of memory.
+        Id of uploaded image can be sent as image_id
+        instead of base64 image when entities are created,
+        every uploaded image can be attached only to one entity.
+
+        Please provide:
+          - **file**  image file
+          - **alt**  text description of image
+
+        Returns
+        -------
+          - **200**: Success response with the data.
+          - **422**: Error: Unprocessable Entity.
+            Причини: \n
+                1) Дозволено відправляти тільки jpeg, jpg, png, svg, webp \n
+                2) Максимально дозволений розмір файлу 1MB \n
+                3) Файл пошкоджений \n
+          - **500**: Internal server error if an unexpected error occurs.
+
+        """
+        result = self.image_service.upload(file=file, alt=alt)
+        return result
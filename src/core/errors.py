@@ -37,6 +37,16 @@ class TicketAlreadyBoughtExceptionError(CustomAPIException):
         super().__init__(message=message, field=field, code=code)
 
 
+class SeatHoldNotFoundExceptionError(CustomAPIException):
+    """Exception raised when hold of seats doesn't exist or expired."""
+
+    code = "SEAT_HOLD_NOT_FOUND"
+    message = "..."
+    field = "hold_id"
+    location = "body"
+    status_code = 404
+
+
 class NotFoundExceptionError(CustomAPIException):
     """Exception raised when row wasn't found in db."""
 
@@ -0,0 +1,56 @@
+"""Benchmark of checking base64 images for ImageService.bulk_create"""
+
+import base64
+import os
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from src.core.schemas.images import ImageInSchema
+from src.core.services.images import ImageService
+
+
+class Command(BaseCommand):
+    help = "Compare serial and parallel checking of 1, 10 and 50 base64 images"
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--dir", default=os.path.join("seed", "bottom_slider"))
+        parser.add_argument("--repeat", type=int, default=3)
+
+    def handle(self, *args, **options) -> None:
+        service = ImageService()
+        sources = []
+        for filename in sorted(os.listdir(options["dir"])):
+            path = os.path.join(options["dir"], filename)
+            if os.path.getsize(path) < 1_000_000:
+                with open(path, "rb") as file:
+                    image = base64.b64encode(file.read()).decode()
+                name, extension = os.path.splitext(filename)
+                sources.append(ImageInSchema(filename=f"image{extension}", image=image))
+        self.stdout.write(f"workers: {settings.IMAGE_CHECK_WORKERS}")
+        for count in [1, 10, 50]:
+            schemas = [sources[index % len(sources)] for index in range(count)]
+            serial = self._measure(
+                lambda: [
+                    service.check_image(image_base64=s.image, filename=s.filename)
+                    for s in schemas
+                ],
+                options["repeat"],
+            )
+            parallel = self._measure(
+                lambda: service.check_images([s.model_copy() for s in schemas]),
+                options["repeat"],
+            )
+            self.stdout.write(
+                f"{count} images: serial {serial:.3f}s, parallel {parallel:.3f}s"
+            )
+
+    @staticmethod
+    def _measure(func, repeat: int) -> float:
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+        return min(timings)
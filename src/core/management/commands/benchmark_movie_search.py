@@ -0,0 +1,104 @@
+"""Benchmark of MovieManager.get_by_search_line on synthetic catalog"""
+
+import random
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from src.movies.models import Movie
+
+WORDS = [
+    ("зоряні", "звездные"),
+    ("війни", "войны"),
+    ("темний", "темный"),
+    ("лицар", "рыцарь"),
+    ("володар", "властелин"),
+    ("перснів", "колец"),
+    ("місто", "город"),
+    ("гріхів", "грехов"),
+    ("останній", "последний"),
+    ("герой", "герой"),
+    ("дикий", "дикий"),
+    ("захід", "запад"),
+    ("втеча", "побег"),
+    ("шоушенк", "шоушенк"),
+    ("зелена", "зеленая"),
+    ("миля", "миля"),
+]
+SEARCH_LINES = ["зоряні війни", "зоряни", "лицр", "шоушенк", "темн", "котики"]
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare icontains and trigram search of movies over synthetic catalog, "
+        "created movies are rolled back"
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--movies", type=int, default=100_000)
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def handle(self, *args, **options) -> None:
+        with transaction.atomic():
+            self._create_movies(options["movies"])
+            with connection.cursor() as cursor:
+                cursor.execute("ANALYZE movies")
+            for line in SEARCH_LINES:
+                icontains = self._measure(
+                    lambda line=line: list(
+                        Movie.objects.filter(
+                            Q(name_ru__icontains=line) | Q(name_uk__icontains=line)
+                        )[:20]
+                    ),
+                    options["repeat"],
+                )
+                trigram = self._measure(
+                    lambda line=line: list(
+                        Movie.objects.get_by_search_line(line)[:20]
+                    ),
+                    options["repeat"],
+                )
+                found = Movie.objects.get_by_search_line(line).count()
+                self.stdout.write(
+                    f"{line!r}: icontains {icontains * 1000:.1f}ms, "
+                    f"trigram {trigram * 1000:.1f}ms, found {found}"
+                )
+            transaction.set_rollback(True)
+
+    def _create_movies(self, count: int) -> None:
+        rand = random.Random(0)
+        movies = []
+        for index in range(count):
+            words = rand.sample(WORDS, 3)
+            movies.append(
+                Movie(
+                    slug=f"benchmark-{index}",
+                    name_uk=" ".join(word[0] for word in words) + f" {index}",
+                    name_ru=" ".join(word[1] for word in words) + f" {index}",
+                    description_uk="-",
+                    description_ru="-",
+                    trailer_link="https://www.youtube.com/",
+                    year=2024,
+                    budget=1,
+                    duration=timedelta(minutes=90),
+                    released=timezone.localdate(),
+                    seo_title="-",
+                    seo_description="-" * 50,
+                )
+            )
+        Movie.objects.bulk_create(movies, batch_size=5000)
+        self.stdout.write(f"movies: {Movie.objects.count()}")
+
+    @staticmethod
+    def _measure(func, repeat: int) -> float:
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+        return min(timings)
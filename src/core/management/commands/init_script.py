@@ -19,6 +19,7 @@ from src.cinemas.models import Cinema
 from src.cinemas.models import Hall
 from src.core.models import Gallery
 from src.core.models import Image
+from src.core.services.images import ImageService
 from src.movies.models import Movie
 from src.movies.models import MovieParticipant
 from src.movies.models import MovieParticipantPerson
@@ -155,11 +156,10 @@ class Command(BaseCommand):
         :return: Image model instance
         """
         random_image = random.choice(os.listdir(os.path.join("seed", seed_path)))
-        image = open(os.path.join("seed", seed_path, random_image), "rb")
-        image = Image.objects.create(
-            alt="alt",
-            image=File(image, "/media/" + image.name),
-        )
+        file = open(os.path.join("seed", seed_path, random_image), "rb")
+        image = Image(alt="alt")
+        ImageService.set_file(image, File(file, "/media/" + file.name))
+        image.save()
         return image
 
     @classmethod
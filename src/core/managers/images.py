@@ -4,6 +4,8 @@ from django.db import models
 from django.utils.translation import gettext as _
 
 from src.core.errors import NotFoundExceptionError
+from src.core.errors import UnprocessableEntityExceptionError
+from src.core.services.core import CoreService
 
 
 class ImageManager(models.Manager):
@@ -25,14 +27,47 @@ class ImageManager(models.Manager):
             raise NotFoundExceptionError(message=msg, cls_model=self.model)
         return image
 
+    def take_uploaded(self, img_id: int, alt: str | None = None) -> object:
+        """Take temporary image for attaching to entity. Flag is cleared
+        by the same query, so concurrent requests can't take one image twice
+        :param img_id: id of uploaded image
+        :param alt: new text description of image
+        :rtype: Image
+        :return: Image model instance
+        """
+        fields = {"is_temporary": False}
+        if alt:
+            fields["alt"] = alt
+        taken = self.model.objects.filter(id=img_id, is_temporary=True).update(
+            **fields
+        )
+        if not taken:
+            msg = _(
+                "Картинку з таким image_id не завантажено "
+                "або вона вже використана"
+            )
+            raise UnprocessableEntityExceptionError(message=msg, field="image_id")
+        return self.model.objects.get(id=img_id)
+
+    def get_by_hash(self, content_hash: str) -> object | None:
+        """Get an image with the same content.
+        :param content_hash: sha256 of image file
+        :rtype: Image
+        :return: Image model instance or None
+        """
+        return (
+            self.model.objects.filter(content_hash=content_hash)
+            .only("image", "content_hash", "derivatives")
+            .first()
+        )
+
     def check_of_ids(self, ids: list[int]) -> object:
         """Check that all values in parameter ids exist in db.
         :param ids: list of images ids
         :rtype: Boolean
         """
-        db_ids = self.model.objects.values_list("id", flat=True)
-        for i in ids:
-            if i not in db_ids:
-                msg = _("Не знайдено: немає збігів картинок " "на заданному запиті.")
-                raise NotFoundExceptionError(message=msg, cls_model=self.model)
+        msg = _("Не знайдено: немає збігів картинок " "на заданному запиті.")
+        CoreService.check_ids_exist(
+            ids=ids, queryset=self.model.objects.all(), message=msg, field="images"
+        )
         return True
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.6 on 2026-10-17 23:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_image_content_hash'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='image',
+            name='is_temporary',
+            field=models.BooleanField(default=False, editable=False),
+        ),
+    ]
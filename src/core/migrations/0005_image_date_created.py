@@ -0,0 +1,18 @@
+# Generated by Django 5.0.6 on 2026-10-17 23:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_image_is_temporary'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='image',
+            name='date_created',
+            field=models.DateTimeField(auto_now_add=True, null=True),
+        ),
+    ]
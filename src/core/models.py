@@ -2,7 +2,8 @@
 
 from django.core.validators import MinLengthValidator
 from django.db import models
-from imagekit.models import ImageSpecField
+from django.db.models import F
+from django_cleanup import cleanup
 
 from src.core.managers.gallery import GalleryManager
 from src.core.managers.images import ImageManager
@@ -38,6 +39,44 @@ class Seo(models.Model):
         db_table = "seo"
 
 
+class Versioned(models.Model):
+    """Описание Versioned.
+    Абстрактная модель с версией записи, версия увеличивается
+    при каждом сохранении записи и при изменении ее картинок,
+    из нее строится ETag детальной страницы
+
+    :param version номер версии записи;
+    """
+
+    version = models.PositiveIntegerField(default=1, editable=False)
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs) -> None:
+        """Save record with increased version."""
+        if self._state.adding:
+            super().save(*args, **kwargs)
+            return
+        self.version = F("version") + 1
+        if kwargs.get("update_fields") is not None:
+            kwargs["update_fields"] = {*kwargs["update_fields"], "version"}
+        super().save(*args, **kwargs)
+        self.refresh_from_db(fields=["version"])
+
+    @classmethod
+    def touch(cls, *args, **kwargs) -> int:
+        """Increase version of records without saving them.
+        :param args: Q objects for filtering records
+        :param kwargs: lookups for filtering records
+        :return: count of updated records
+        """
+        return cls._default_manager.filter(*args, **kwargs).update(
+            version=F("version") + 1
+        )
+
+
+@cleanup.ignore
 class Image(models.Model):
     """Описание Image
     Модель необходима для хранения изображений всего сайта
@@ -45,13 +84,26 @@ class Image(models.Model):
     Дополнительная информация о модели, ее назначении и использовании.
     Таинственные поля:
     :param alt описывает информацию о картинке в виде текста;
-    :param image_webp генерит на основе исходной
-           картинки такое изображение в формате .webp
+    :param content_hash sha256 содержимого файла, картинки с одинаковым
+           содержимым ссылаются на один файл, файл удаляется
+           вместе с последней ссылающейся на него картинкой
+           (поэтому django_cleanup для модели отключен);
+    :param derivatives пути к сгенерированным в фоне на основе исходной
+           картинки изображениям в формате .webp (полного размера
+           и уменьшенным до IMAGE_DERIVATIVE_WIDTHS);
+    :param is_temporary картинка загружена отдельно(multipart формой)
+           и еще не прикреплена ни к одной сущности, по image_id
+           можно прикрепить только такую картинку и только один раз;
+    :param date_created дата создания, картинки на которые никто
+           не ссылается удаляются только спустя IMAGE_ORPHAN_GRACE
     """
 
     alt = models.CharField(max_length=60, validators=[MinLengthValidator(1)])
     image = models.ImageField(upload_to=get_timestamp_path, null=True)
-    image_webp = ImageSpecField(source="image", format="WEBP", options={"quality": 90})
+    content_hash = models.CharField(max_length=64, blank=True, db_index=True)
+    derivatives = models.JSONField(default=dict, editable=False)
+    is_temporary = models.BooleanField(default=False, editable=False)
+    date_created = models.DateTimeField(auto_now_add=True, null=True)
 
     objects = ImageManager()
 
@@ -0,0 +1,331 @@
+"""Keyset(cursor) pagination for list endpoints.
+
+Page of rows is found by values of ordering fields of the last
+(or first) row of previous page, so database jumps to it
+by index instead of counting and skipping all previous rows
+"""
+
+import base64
+import binascii
+import json
+from collections import OrderedDict
+from datetime import date
+from datetime import datetime
+from datetime import time
+from typing import Any
+from typing import Generic
+from typing import TypeVar
+
+from django.core.exceptions import FieldDoesNotExist
+from django.core.exceptions import ValidationError
+from django.db import connections
+from django.db.models import Field as ModelField
+from django.db.models import Model
+from django.db.models import Q
+from django.db.models import QuerySet
+from django.http import HttpRequest
+from django.utils.translation import gettext as _
+from ninja import Schema
+from ninja.pagination import PaginationBase
+from ninja_extra.conf import settings
+from ninja_extra.schemas.response import Url
+from ninja_extra.urls import replace_query_param
+from pydantic import Field
+
+from src.core.errors import UnprocessableEntityExceptionError
+
+T = TypeVar("T")
+
+
+class CursorPaginatedResponseSchema(Schema, Generic[T]):
+    """Pydantic schema for page of cursor pagination.
+    Count is estimated and returned only if it was asked
+    """
+
+    count: int | None
+    next: Url | None
+    previous: Url | None
+    results: list[T]
+
+
+class CursorPagination(PaginationBase):
+    """Keyset pagination by ordering of queryset.
+    Ordering is taken from queryset or Meta.ordering of model
+    and primary key is added to it for unique position of every row.
+    Cursor is opaque for client, it keeps values of ordering fields
+    and direction of reading, so next and previous pages are
+    available as links like in PageNumberPaginationExtra
+    :param page_size: default length of page
+    :param max_page_size: max length of page which client can ask
+    """
+
+    class Input(Schema):
+        cursor: str | None = None
+        page_size: int = Field(100, gt=0, le=200)
+        count: bool = False
+
+    cursor_query_param = "cursor"
+
+    def __init__(
+        self,
+        page_size: int = settings.PAGINATION_PER_PAGE,
+        max_page_size: int | None = None,
+        pass_parameter: str | None = None,
+    ) -> None:
+        super().__init__(pass_parameter=pass_parameter)
+        self.page_size = page_size
+        self.max_page_size = max_page_size or 200
+        self.Input = self.create_input()
+
+    def create_input(self) -> type[Input]:
+        class DynamicInput(CursorPagination.Input):
+            page_size: int = Field(self.page_size, gt=0, le=self.max_page_size)
+
+        return DynamicInput
+
+    def paginate_queryset(
+        self,
+        queryset: QuerySet,
+        pagination: Input,
+        request: HttpRequest | None = None,
+        **params: Any,
+    ) -> Any:
+        """Get page of queryset after or before cursor.
+        :param queryset: ordered queryset of rows
+        :param pagination: cursor, page size and flag of count
+        :param request: request for building of links
+        :return: dict with count, next, previous and results
+        """
+        ordering = self.get_ordering(queryset)
+        count = self.estimate_count(queryset) if pagination.count else None
+        reverse = False
+        page = queryset
+        if pagination.cursor:
+            values, reverse = self.decode_cursor(
+                pagination.cursor, queryset.model, ordering
+            )
+            keyset = self.keyset(queryset.model, ordering, values, reverse)
+            page = queryset.filter(keyset)
+        if reverse:
+            ordering_query = [self.invert(field) for field in ordering]
+        else:
+            ordering_query = ordering
+        rows = list(page.order_by(*ordering_query)[: pagination.page_size + 1])
+        has_more = len(rows) > pagination.page_size
+        rows = rows[: pagination.page_size]
+        if reverse:
+            rows.reverse()
+        has_next = bool(rows) and (reverse or has_more)
+        has_previous = bool(rows) and (has_more if reverse else bool(pagination.cursor))
+
+        url = request.build_absolute_uri()
+        next_link = previous_link = None
+        if has_next:
+            next_link = self.get_link(url, ordering, rows[-1], reverse=False)
+        if has_previous:
+            previous_link = self.get_link(url, ordering, rows[0], reverse=True)
+        return OrderedDict(
+            [
+                ("count", count),
+                ("next", next_link),
+                ("previous", previous_link),
+                ("results", rows),
+            ]
+        )
+
+    @classmethod
+    def get_response_schema(cls, response_schema: Any) -> Any:
+        return CursorPaginatedResponseSchema[response_schema]
+
+    @staticmethod
+    def get_ordering(queryset: QuerySet) -> list[str]:
+        """Get ordering fields of queryset with primary key in the end.
+        :param queryset: queryset of rows
+        :return: list of fields like in order_by
+        """
+        ordering = list(queryset.query.order_by)
+        if not ordering and queryset.query.default_ordering:
+            ordering = list(queryset.model._meta.ordering)
+        if not all(isinstance(field, str) for field in ordering):
+            raise TypeError("Cursor pagination supports only ordering by fields")
+        pk_names = {"pk", queryset.model._meta.pk.name}
+        if not pk_names & {field.lstrip("-") for field in ordering}:
+            descending = bool(ordering) and ordering[-1].startswith("-")
+            ordering.append("-pk" if descending else "pk")
+        return ordering
+
+    @staticmethod
+    def invert(field: str) -> str:
+        """Change direction of ordering field.
+        :param field: field like in order_by
+        """
+        return field[1:] if field.startswith("-") else f"-{field}"
+
+    @classmethod
+    def keyset(
+        cls, model: type[Model], ordering: list[str], values: list, reverse: bool
+    ) -> Q:
+        """Build condition for rows which go after values by ordering.
+        Rows are compared field by field: (a > x) or (a = x and b > y) ...
+        Nulls are last in ascending and first in descending ordering
+        like in postgres
+        :param model: model of queryset
+        :param ordering: ordering fields
+        :param values: values of ordering fields of row in cursor
+        :param reverse: rows before values are needed
+        :return: Q for filtering
+        """
+        condition = Q(pk__in=[])
+        equal = Q()
+        for field, value in zip(ordering, values):
+            if reverse:
+                field = cls.invert(field)
+            name = field.lstrip("-")
+            descending = field.startswith("-")
+            if value is None:
+                after = Q(**{f"{name}__isnull": False}) if descending else Q(pk__in=[])
+                same = Q(**{f"{name}__isnull": True})
+            else:
+                lookup = "lt" if descending else "gt"
+                after = Q(**{f"{name}__{lookup}": value})
+                if not descending and cls.is_nullable(model, name):
+                    after |= Q(**{f"{name}__isnull": True})
+                same = Q(**{name: value})
+            condition |= equal & after
+            equal &= same
+        return condition
+
+    @staticmethod
+    def get_field(model: type[Model], name: str) -> ModelField | None:
+        """Get model field of ordering field.
+        :param model: model of queryset
+        :param name: field name, with relations by __
+        :return: field or None for annotations and unknown fields
+        """
+        *relations, field_name = name.split("__")
+        try:
+            for relation in relations:
+                model = model._meta.get_field(relation).related_model
+            if field_name == "pk":
+                return model._meta.pk
+            return model._meta.get_field(field_name)
+        except (FieldDoesNotExist, AttributeError):
+            return None
+
+    @staticmethod
+    def is_nullable(model: type[Model], name: str) -> bool:
+        """Check that ordering field can be null.
+        Annotations and unknown fields are considered nullable
+        :param model: model of queryset
+        :param name: field name, with relations by __
+        """
+        *relations, field_name = name.split("__")
+        try:
+            for relation in relations:
+                field = model._meta.get_field(relation)
+                if field.null:
+                    return True
+                model = field.related_model
+            return field_name != "pk" and model._meta.get_field(field_name).null
+        except FieldDoesNotExist:
+            return True
+
+    @staticmethod
+    def get_value(row: Any, field: str) -> Any:
+        """Get value of ordering field from row.
+        :param row: model instance
+        :param field: field like in order_by, with relations by __
+        """
+        value = row
+        for attr in field.lstrip("-").split("__"):
+            if value is None:
+                break
+            value = getattr(value, attr)
+        return value
+
+    @classmethod
+    def encode_cursor(cls, values: list, reverse: bool) -> str:
+        """Make opaque cursor from values of ordering fields.
+        Microseconds of datetime are kept, so json of django isn't used
+        :param values: values of ordering fields
+        :param reverse: cursor points to rows before values
+        """
+        data = json.dumps(
+            {"v": values, "r": reverse},
+            default=cls._encode_value,
+            separators=(",", ":"),
+        )
+        return base64.urlsafe_b64encode(data.encode()).decode().rstrip("=")
+
+    @staticmethod
+    def _encode_value(value: Any) -> str:
+        if isinstance(value, datetime | date | time):
+            return value.isoformat()
+        return str(value)
+
+    @classmethod
+    def decode_cursor(
+        cls, cursor: str, model: type[Model], ordering: list[str]
+    ) -> tuple[list, bool]:
+        """Get values of ordering fields and direction from cursor.
+        Values are converted by fields of model, so changed cursor
+        can't break query with value of wrong type
+        :param cursor: cursor from query
+        :param model: model of queryset
+        :param ordering: ordering fields
+        :return: values and flag of reading before values
+        """
+        try:
+            padding = "=" * (-len(cursor) % 4)
+            data = json.loads(base64.urlsafe_b64decode(cursor + padding))
+            values, reverse = data["v"], data["r"]
+            if not isinstance(values, list) or len(values) != len(ordering):
+                raise ValueError("Wrong count of values")
+            for index, name in enumerate(ordering):
+                field = cls.get_field(model, name.lstrip("-"))
+                if field is not None and values[index] is not None:
+                    values[index] = field.to_python(values[index])
+        except (
+            binascii.Error,
+            ValidationError,
+            ValueError,
+            TypeError,
+            KeyError,
+        ) as exc:
+            raise UnprocessableEntityExceptionError(
+                message=_("Невірний курсор"), field="cursor"
+            ) from exc
+        return values, bool(reverse)
+
+    def get_link(self, url: str, ordering: list[str], row: Any, reverse: bool) -> str:
+        """Get link to page after(or before) row.
+        :param url: url of current page
+        :param ordering: ordering fields
+        :param row: last(or first) row of current page
+        :param reverse: link to previous page
+        """
+        values = [self.get_value(row, field) for field in ordering]
+        cursor = self.encode_cursor(values, reverse)
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    @staticmethod
+    def estimate_count(queryset: QuerySet) -> int | None:
+        """Get count of rows from statistics of postgres instead of COUNT.
+        Whole table is estimated by pg_class.reltuples,
+        filtered queryset by estimate of its plan
+        :param queryset: queryset of rows
+        :return: estimated count or None if statistics isn't collected
+        """
+        connection = connections[queryset.db]
+        if connection.vendor != "postgresql":
+            return None
+        if not queryset.query.where:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                    [queryset.model._meta.db_table],
+                )
+                row = cursor.fetchone()
+            return row[0] if row and row[0] >= 0 else None
+        plan = json.loads(queryset.order_by().explain(format="json"))
+        return int(plan[0]["Plan"]["Plan Rows"])
@@ -3,8 +3,10 @@
 import re
 
 import ninja_schema
+from django.core.files.base import ContentFile
 from django.utils.translation import gettext as _
 from ninja import ModelSchema
+from pydantic import PrivateAttr
 from pydantic.functional_validators import field_validator
 
 from config.settings.settings import ABSOLUTE_URL
@@ -12,6 +14,7 @@ from src.core.errors import UnprocessableEntityExceptionError
 from src.core.models import Gallery
 from src.core.models import Image
 from src.core.schemas.images import ImageOutSchema
+from src.core.schemas.images import get_derivative_url
 
 
 class GalleryInSchema(ninja_schema.ModelSchema):
@@ -49,7 +52,18 @@ class GalleryItemSchema(ninja_schema.ModelSchema):
     """Pydantic schema for uploading image to server side."""
 
     delete: bool
+    image_id: int = None
     filename: str = None
+    _file = PrivateAttr(default=None)
+
+    @property
+    def file(self) -> ContentFile | None:
+        """Image decoded from base64 by ImageService.check_images."""
+        return self._file
+
+    @file.setter
+    def file(self, file: ContentFile) -> None:
+        self._file = file
 
     @field_validator("filename")
     def clean_filename(cls, filename: str) -> str:
@@ -96,12 +110,8 @@ class GalleryItemOutSchema(ModelSchema):
 
     @staticmethod
     def resolve_image_webp(obj: Image):
-        extension = obj.image.name.split(".")[-1]
-        if extension != "svg":
-            return ABSOLUTE_URL + str(obj.image_webp.url)
-        else:
-            return ABSOLUTE_URL + str(obj.image.url)
+        return get_derivative_url(obj, "webp")
 
     class Meta:
         model = Image
-        fields = "__all__"
+        exclude = ["derivatives", "content_hash", "is_temporary", "date_created"]
@@ -1,10 +1,12 @@
-import binascii
 import re
-from base64 import b64decode
 
 import ninja_schema
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
 from django.utils.translation import gettext as _
 from ninja import ModelSchema
+from pydantic import PrivateAttr
 from pydantic.functional_validators import field_validator
 
 from config.settings.settings import ABSOLUTE_URL
@@ -13,10 +15,24 @@ from src.core.models import Image
 
 
 class ImageInSchema(ninja_schema.ModelSchema):
-    """Pydantic schema for uploading image to server side."""
+    """Pydantic schema for uploading image to server side.
+    Image is sent in base64 with filename or as image_id
+    of image uploaded by multipart form before
+    """
 
-    filename: str
-    image: str
+    image_id: int = None
+    filename: str = None
+    image: str = None
+    _file = PrivateAttr(default=None)
+
+    @property
+    def file(self) -> ContentFile | None:
+        """Image decoded from base64 by ImageService.check_images."""
+        return self._file
+
+    @file.setter
+    def file(self, file: ContentFile) -> None:
+        self._file = file
 
     @field_validator("filename")
     def clean_filename(cls, filename: str) -> str:
@@ -45,21 +61,38 @@ class ImageInSchema(ninja_schema.ModelSchema):
 
         return filename
 
-    @ninja_schema.model_validator("image")
-    def clean_base64(cls, value: str) -> str:
-        try:
-            b64decode(value, validate=True)
-        except binascii.Error:
-            msg = _("Невірний формат base64 був відправлений")
-            raise UnprocessableEntityExceptionError(msg, field="image")
-        return value
-
     class Config:
         model = Image
         include = ["image", "alt"]
         optional = ["alt"]
 
 
+def get_derivative_url(obj: Image, name: str) -> str:
+    """Get url of generated derivative of image without touching storage,
+    original image is returned while derivative isn't generated yet
+    :param obj: Image model instance
+    :param name: name of derivative
+    """
+    path = obj.derivatives.get(name)
+    if path is None:
+        return ABSOLUTE_URL + str(obj.image.url)
+    return ABSOLUTE_URL + default_storage.url(path)
+
+
+class ImageUploadOutSchema(ModelSchema):
+    """Pydantic schema for return id of uploaded image."""
+
+    image: str
+
+    @staticmethod
+    def resolve_image(obj: Image):
+        return ABSOLUTE_URL + str(obj.image.url)
+
+    class Meta:
+        model = Image
+        fields = ["id", "image", "alt"]
+
+
 class ImageOutSchema(ModelSchema):
     """Pydantic schema for return image to client side."""
 
@@ -72,17 +105,31 @@ class ImageOutSchema(ModelSchema):
 
     @staticmethod
     def resolve_image_webp(obj: Image):
-        extension = obj.image.name.split(".")[-1]
-        if extension != "svg":
-            return ABSOLUTE_URL + str(obj.image_webp.url)
-        else:
-            return ABSOLUTE_URL + str(obj.image.url)
+        return get_derivative_url(obj, "webp")
 
     class Meta:
         model = Image
         fields = ["image", "alt"]
 
 
+class ImageCardOutSchema(ImageOutSchema):
+    """Pydantic schema for return image of card, banner or slider
+    with smaller webp images by their widths, like {"320w": url},
+    for srcset attribute.
+    """
+
+    srcset: dict[str, str]
+
+    @staticmethod
+    def resolve_srcset(obj: Image):
+        srcset = {}
+        for width in settings.IMAGE_DERIVATIVE_WIDTHS:
+            name = f"webp_{width}"
+            if name in obj.derivatives:
+                srcset[f"{width}w"] = get_derivative_url(obj, name)
+        return srcset
+
+
 class ImageUpdateSchema(ImageInSchema):
     """Pydantic schema for updating image."""
 
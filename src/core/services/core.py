@@ -1,6 +1,10 @@
+from collections.abc import Iterable
+
 from django.db.models import Model
+from django.db.models import QuerySet
 from django.utils.translation import gettext as _
 
+from src.core.errors import NotFoundExceptionError
 from src.core.errors import NotUniqueFieldExceptionError
 
 
@@ -26,3 +30,33 @@ class CoreService:
                     "Поле повинно бути унікальним. " "*{value}* - Ця назва вже зайнята"
                 ).format(value=value)
                 raise NotUniqueFieldExceptionError(message=msg, field=field_name)
+
+    @staticmethod
+    def get_missing_ids(ids: Iterable[int], queryset: QuerySet) -> set[int]:
+        """Find ids which aren't present in queryset by one query;
+        :param ids: ids for checking
+        :param queryset: rows where ids have to be present
+        :return: set of missing ids
+        """
+        ids = set(ids)
+        if not ids:
+            return set()
+        found = queryset.filter(id__in=ids).values_list("id", flat=True)
+        return ids - set(found)
+
+    @classmethod
+    def check_ids_exist(
+        cls, ids: Iterable[int], queryset: QuerySet, message: str, field: str = ""
+    ) -> None:
+        """Check that all ids are present in queryset;
+        :param ids: ids for checking
+        :param queryset: rows where ids have to be present
+        :param message: text of error with {diff} for missing ids
+        :param field: field of request which contains ids
+        """
+        missing = cls.get_missing_ids(ids=ids, queryset=queryset)
+        if missing:
+            msg = message.format(diff=sorted(missing))
+            raise NotFoundExceptionError(
+                message=msg, cls_model=queryset.model, field=field
+            )
@@ -1,10 +1,10 @@
+from django.db import transaction
 from injector import inject
 
 from src.core.errors import NotFoundExceptionError
 from src.core.models import Gallery
 from src.core.models import Image
 from src.core.schemas.gallery import GalleryItemSchema
-from src.core.schemas.images import ImageInSchema
 from src.core.services.images import ImageService
 
 
@@ -15,29 +15,48 @@ class GalleryService:
     def __init__(self, image_service: ImageService):
         self.image_service = image_service
 
-    def create(self, images: list[ImageInSchema]) -> Gallery:
-        """Create gallery."""
+    @staticmethod
+    def create(images: list[Image]) -> Gallery:
+        """Create gallery of images. Images are created by
+        owner in one bulk with its other images
+        :param images: created images of gallery
+        """
         gallery = Gallery.objects.create()
         if images:
-            list_of_images = self.image_service.bulk_create(schemas=images)
-            gallery.images.set(list_of_images)
+            gallery.images.set(images)
         return gallery
 
     def update(self, schemas: list[GalleryItemSchema], gallery: Gallery) -> None:
-        """Update gallery."""
+        """Update gallery. Images of gallery are loaded once,
+        items are split to creates, updates and deletes
+        which are applied in bulk in one transaction.
+        Images of items are checked and uploaded images are taken
+        before anything is changed, new files are deleted on rollback
+        """
         if schemas:
+            images = {image.id: image for image in gallery.images.all()}
+            self.images_match_gallery(images, [schema.id for schema in schemas])
+            to_delete = []
+            to_update = []
+            to_create = []
             for schema in schemas:
                 if schema.id:
-                    img = self.image_service.get_image(schema.id)
-                    self.image_matches_gallery(gallery, schema.id)
                     if schema.delete:
-                        self.image_service.delete(img)
+                        to_delete.append(schema.id)
                     else:
-                        self.image_service.update(schema, img)
+                        to_update.append((schema, images[schema.id]))
                 elif not schema.delete:
-                    image_obj = self.image_service.create(schema)
-                    gallery.images.add(image_obj)
-                    gallery.save()
+                    to_create.append(schema)
+            self.image_service.check_images(to_create)
+            self.image_service.check_updates([schema for schema, image in to_update])
+            with self.image_service.discard_new_files(), transaction.atomic():
+                if to_create:
+                    list_of_images = self.image_service.bulk_create(schemas=to_create)
+                    gallery.images.add(*list_of_images)
+                if to_update:
+                    self.image_service.bulk_update(to_update)
+                if to_delete:
+                    self.image_service.bulk_delete(to_delete)
 
     @staticmethod
     def get_by_id(gallery_id: int) -> Gallery:
@@ -46,9 +65,12 @@ class GalleryService:
         return gallery.images.all()
 
     @staticmethod
-    def image_matches_gallery(gallery: Gallery, img_id: int) -> None:
-        """Get gallery by id."""
-        ids = gallery.images.values_list("id", flat=True)
-        if img_id not in ids:
-            msg = f"Дане зображення id({img_id}) " "не належить до галереї кінотеатру"
+    def images_match_gallery(images: dict[int, Image], img_ids: list[int]) -> None:
+        """Check that images belong to gallery.
+        :param images: images of gallery by ids
+        :param img_ids: ids of images, None for new images
+        """
+        missing = {img_id for img_id in img_ids if img_id} - images.keys()
+        if missing:
+            msg = f"Дані зображення ids {sorted(missing)} " "не належать до галереї"
             raise NotFoundExceptionError(message=msg, cls_model=Image)
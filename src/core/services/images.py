@@ -2,18 +2,69 @@
 
 import binascii
 import io
+import os
+import re
 import shutil
+import time
 from base64 import b64decode
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import timedelta
 from pathlib import Path
 
+from django.conf import settings
+from django.core.cache import cache
 from django.core.files.base import ContentFile
+from django.core.files.base import File
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.db.models import Q
+from django.db.models import QuerySet
+from django.utils import timezone
 from django.utils.translation import gettext as _
+from ninja.files import UploadedFile
 from PIL import Image
 
 import src.core.models as im
 from src.core.errors import UnprocessableEntityExceptionError
 from src.core.schemas.images import ImageInSchema
 from src.core.schemas.images import ImageUpdateSchema
+from src.core.tasks import generate_image_derivatives
+from src.core.tasks import purge_image_files
+from src.core.utils import get_content_hash
+from src.core.utils import invalidate_responses
+
+DERIVATIVES_PATH = "derivatives/Image/{stem}/{name}.webp"
+MEDIA_SCAN_BATCH_SIZE = 1000
+MEDIA_SCAN_GRACE = 60 * 60
+IMAGE_ORPHAN_GRACE = 60 * 60 * 24
+IMAGE_HASH_USED_KEY = "image_hash_used:{content_hash}"
+
+new_files: ContextVar[list | None] = ContextVar("new_image_files", default=None)
+
+
+def scan_media(path: Path, dirs: bool) -> Iterator[list[os.DirEntry]]:
+    """Walk directory of media and yield its entries in batches,
+    entries changed during last MEDIA_SCAN_GRACE seconds are skipped.
+    :param path: directory for scanning
+    :param dirs: yield directories if True, otherwise files
+    """
+    if not path.is_dir():
+        return
+    edge = time.time() - MEDIA_SCAN_GRACE
+    batch = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir() != dirs or entry.stat().st_mtime > edge:
+                continue
+            batch.append(entry)
+            if len(batch) == MEDIA_SCAN_BATCH_SIZE:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
 
 
 class ImageService:
@@ -28,6 +79,18 @@ class ImageService:
             "webp",
         ]
 
+    @staticmethod
+    def check_schema(filename: str | None, image_base64: str | None) -> None:
+        """Check that base64 image is sent with filename
+        when id of uploaded image isn't sent
+        """
+        if not filename or not image_base64:
+            msg = _(
+                "Треба відправити image_id завантаженої картинки "
+                "або image з filename"
+            )
+            raise UnprocessableEntityExceptionError(message=msg, field="image")
+
     @staticmethod
     def check_image(image_base64: str, filename: str) -> ContentFile:
         """Check base64 image is valid
@@ -53,67 +116,394 @@ class ImageService:
             raise UnprocessableEntityExceptionError(message=msg)
         return image_field
 
+    def check_file(self, file: UploadedFile) -> None:
+        """Check uploaded image file is valid, image is checked
+        by Pillow straight from temporary file
+        :param file: uploaded image file
+        """
+        extension = file.name.split(".")[-1].lower()
+        if extension not in self.image_types:
+            msg = _("Дозволено відправляти тільки {image_types}").format(
+                image_types=self.image_types
+            )
+            raise UnprocessableEntityExceptionError(message=msg, field="file")
+        if file.size > 1_000_000:
+            msg = _("Максимально дозволений розмір файлу 1MB")
+            raise UnprocessableEntityExceptionError(message=msg, field="file")
+        if extension != "svg":
+            try:
+                img = Image.open(file)
+                img.verify()
+            except Exception:
+                msg = _("Файл пошкоджений")
+                raise UnprocessableEntityExceptionError(message=msg, field="file")
+            finally:
+                file.seek(0)
+
+    def upload(self, file: UploadedFile, alt: str | None = None) -> im.Image:
+        """Create image from multipart file, id of image
+        can be sent as image_id instead of base64 image
+        when entities are created
+        :param file: uploaded image file
+        :param alt: text description of image
+        """
+        self.check_file(file)
+        if not alt:
+            alt = Path(file.name).stem[:60]
+        obj = im.Image(alt=alt, is_temporary=True)
+        self.set_file(obj, file)
+        obj.save()
+        if not obj.derivatives:
+            self.schedule_derivatives([obj.id])
+        return obj
+
+    @staticmethod
+    def set_file(
+        image_obj: im.Image, file: File, content_hash: str | None = None
+    ) -> None:
+        """Set file to image by hash of its content. If image with the same
+        content exists, its file and derivatives are reused instead of saving
+        file again. Hash is marked as used before looking for such image,
+        so purge_files doesn't delete file which row can't see yet
+        :param image_obj: Image model instance
+        :param file: checked image file
+        :param content_hash: sha256 of file if it's counted already
+        """
+        if content_hash is None:
+            content_hash = get_content_hash(file)
+        image_obj.content_hash = content_hash
+        cache.set(
+            IMAGE_HASH_USED_KEY.format(content_hash=content_hash),
+            True,
+            MEDIA_SCAN_GRACE,
+        )
+        same = im.Image.objects.get_by_hash(content_hash=content_hash)
+        if same is None:
+            image_obj.image = file
+            image_obj.derivatives = {}
+            tracked = new_files.get()
+            if tracked is not None:
+                tracked.append(image_obj)
+        else:
+            image_obj.image = same.image.name
+            image_obj.derivatives = same.derivatives
+
+    @staticmethod
+    def release_files(image_objs: list[im.Image]) -> None:
+        """Start deleting of files of images with their derivatives
+        in background after commit of current transaction.
+        :param image_objs: deleted or changed Image model instances
+        """
+        files = [
+            {
+                "name": obj.image.name,
+                "content_hash": obj.content_hash,
+                "derivatives": list(obj.derivatives.values()),
+            }
+            for obj in image_objs
+            if obj.image
+        ]
+        if files:
+            transaction.on_commit(lambda: purge_image_files.delay(files=files))
+
+    @contextmanager
+    def discard_new_files(self) -> Iterator[None]:
+        """Delete files which were saved inside block if it fails.
+        Block must wrap whole transaction, so rows of new files are
+        rolled back already and files aren't referred by anything.
+        Files shared by hash with other images are kept by purge_files
+        """
+        tracked = []
+        token = new_files.set(tracked)
+        try:
+            yield
+        except Exception:
+            self.purge_files(
+                [
+                    {"name": obj.image.name, "derivatives": []}
+                    for obj in tracked
+                    if obj.image and obj.image._committed
+                ]
+            )
+            raise
+        finally:
+            new_files.reset(token)
+
+    def purge_files(self, files: list[dict]) -> int:
+        """Delete files with their derivatives and Imagekit cache,
+        files which are referred by other images are kept.
+        Files which hash was used by set_file during last MEDIA_SCAN_GRACE
+        seconds are kept too, new image can refer to them in transaction
+        which isn't committed yet, such files are left to collect_orphans
+        :param files: names of files with their hashes and paths of derivatives
+        :return: count of deleted files
+        """
+        names = [file["name"] for file in files]
+        referenced = set(
+            im.Image.objects.filter(image__in=names).values_list("image", flat=True)
+        )
+        used = cache.get_many(
+            [
+                IMAGE_HASH_USED_KEY.format(content_hash=file["content_hash"])
+                for file in files
+                if file.get("content_hash")
+            ]
+        )
+        purged = 0
+        for file in files:
+            if file["name"] in referenced:
+                continue
+            if file.get("content_hash") and (
+                IMAGE_HASH_USED_KEY.format(content_hash=file["content_hash"]) in used
+            ):
+                continue
+            self.clear_imagekit_cache(file["name"])
+            for path in file["derivatives"]:
+                default_storage.delete(path)
+            default_storage.delete(file["name"])
+            purged += 1
+        return purged
+
+    @staticmethod
+    def get_orphan_images() -> QuerySet:
+        """Get images which aren't referred by any entity or gallery
+        and are older than IMAGE_ORPHAN_GRACE. Owners delete their images
+        with on_delete=DO_NOTHING, so such rows are left behind them,
+        also here are uploaded images which were never attached
+        """
+        edge = timezone.now() - timedelta(seconds=IMAGE_ORPHAN_GRACE)
+        images = im.Image.objects.filter(
+            Q(date_created__lt=edge) | Q(date_created__isnull=True)
+        )
+        for relation in im.Image._meta.related_objects:
+            name = relation.field.name
+            used = relation.related_model._base_manager.filter(
+                **{f"{name}__isnull": False}
+            ).values(name)
+            images = images.exclude(id__in=used)
+        return images
+
+    @classmethod
+    def collect_orphans(cls, dry_run: bool = True) -> dict:
+        """Find images and files in media which don't belong to anything
+        and delete them. Orphan rows are deleted first, so their files are
+        found as orphans in the same run. Files, dirs of derivatives
+        and Imagekit cache are compared with images table in batches,
+        new files are skipped because their images can be not committed yet
+        :param dry_run: only report orphans without deleting
+        :return: report with ids of images and paths of orphans
+        """
+        media = Path(settings.MEDIA_ROOT)
+        report = {
+            "dry_run": dry_run,
+            "images": [],
+            "files": [],
+            "derivatives": [],
+            "cache": [],
+        }
+        orphans = cls.get_orphan_images()
+        report["images"] = list(orphans.values_list("id", flat=True))
+        if report["images"] and not dry_run:
+            orphans.filter(id__in=report["images"]).delete()
+        for batch in scan_media(media / "Image", dirs=False):
+            names = {f"Image/{entry.name}": entry for entry in batch}
+            referenced = set(
+                im.Image.objects.filter(image__in=names).values_list("image", flat=True)
+            )
+            for name, entry in names.items():
+                if name not in referenced:
+                    report["files"].append(name)
+                    if not dry_run:
+                        os.remove(entry.path)
+        roots = {
+            "derivatives": media / "derivatives" / "Image",
+            "cache": media / "CACHE" / "images" / "Image",
+        }
+        for key, root in roots.items():
+            for batch in scan_media(root, dirs=True):
+                stems = {entry.name: entry for entry in batch}
+                pattern = "^Image/(%s)\\." % "|".join(map(re.escape, stems))
+                referenced = {
+                    Path(name).stem
+                    for name in im.Image.objects.filter(
+                        image__regex=pattern
+                    ).values_list("image", flat=True)
+                }
+                for stem, entry in stems.items():
+                    if stem not in referenced:
+                        report[key].append(str(Path(entry.path).relative_to(media)))
+                        if not dry_run:
+                            shutil.rmtree(entry.path)
+        return report
+
+    @staticmethod
+    def get_uploaded(schema: ImageInSchema) -> im.Image:
+        """Get image which was uploaded before by image_id of schema,
+        images attached to other entities can't be taken.
+        """
+        return im.Image.objects.take_uploaded(
+            img_id=schema.image_id, alt=schema.alt
+        )
+
+    def check_images(
+        self, schemas: list[ImageInSchema | None], required: bool = True
+    ) -> None:
+        """Check base64 images of schemas in bounded thread pool,
+        so all images of request are checked before any file is saved.
+        Decoded image is kept in schema and isn't decoded again.
+        Error of the first invalid schema is raised like in serial checking
+        :param schemas: schemas of images, None for images which aren't sent
+        :param required: schema without image_id must bring image with filename,
+        otherwise only schemas with image and filename are checked
+        """
+        schemas = [
+            schema
+            for schema in schemas
+            if schema is not None
+            and not schema.image_id
+            and schema.file is None
+            and (required or (schema.filename and schema.image))
+        ]
+
+        def check(schema: ImageInSchema) -> ContentFile:
+            self.check_schema(filename=schema.filename, image_base64=schema.image)
+            return self.check_image(image_base64=schema.image, filename=schema.filename)
+
+        workers = min(settings.IMAGE_CHECK_WORKERS, len(schemas))
+        if workers < 2:
+            files = [check(schema) for schema in schemas]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                files = list(executor.map(check, schemas))
+        for schema, file in zip(schemas, files, strict=True):
+            schema.file = file
+
+    def check_updates(self, schemas: list[ImageUpdateSchema | None]) -> None:
+        """Check schemas of changed images before anything is saved.
+        Uploaded image can be taken only on creation
+        :param schemas: schemas of images, None for images which aren't changed
+        """
+        for schema in schemas:
+            if schema is not None and schema.image_id:
+                msg = _("Завантажену картинку можна використати тільки при створенні")
+                raise UnprocessableEntityExceptionError(message=msg, field="image_id")
+        self.check_images(schemas, required=False)
+
     def create(self, schema: ImageInSchema) -> Image:
         """Create image to server side for some entity.
         json format
         """
-        filename = schema.filename
-        image_base64 = schema.image
+        if schema.image_id:
+            return self.get_uploaded(schema)
+        self.check_images([schema])
         alt_text = schema.alt
-        image_field = self.check_image(image_base64=image_base64, filename=filename)
-        name, extension = filename.split(".")
+        name, extension = schema.filename.split(".")
         if not alt_text:
             alt_text = name
-        obj = im.Image.objects.create(image=image_field, alt=alt_text)
+        obj = im.Image(alt=alt_text)
+        self.set_file(obj, schema.file)
+        obj.save()
+        if not obj.derivatives:
+            self.schedule_derivatives([obj.id])
         return obj
 
     def update(self, schema: ImageUpdateSchema, image_obj: im.Image) -> None:
-        """Update image in json format"""
+        """Update image in json format, versions of records
+        which show image are increased
+        """
         if schema:
-            filename = schema.filename
-            image_base64 = schema.image
-            if filename and image_base64:
-                name, extension = filename.split(".")
-                image_field = self.check_image(
-                    image_base64=image_base64, filename=filename
-                )
-                self.clear_imagekit_cache(image_obj)
-                image_obj.image = image_field
-                image_obj.alt = name
-            if schema.alt:
-                image_obj.alt = schema.alt
+            self.apply_update(schema, image_obj)
             image_obj.save()
+            self.touch_owners([image_obj.id])
+
+    def bulk_update(self, items: list[tuple[ImageUpdateSchema, im.Image]]) -> None:
+        """Update multiple images by one query.
+        :param items: pairs of schema and image for updating
+        """
+        self.check_updates([schema for schema, image_obj in items])
+        images = []
+        for schema, image_obj in items:
+            self.apply_update(schema, image_obj)
+            if not image_obj.image._committed:
+                image_obj.image.save(
+                    image_obj.image.name, image_obj.image.file, save=False
+                )
+            images.append(image_obj)
+        im.Image.objects.bulk_update(
+            images, ["image", "alt", "content_hash", "derivatives"]
+        )
+        self.touch_owners([image_obj.id for image_obj in images])
+        invalidate_responses(im.Image)
+
+    def apply_update(self, schema: ImageUpdateSchema, image_obj: im.Image) -> None:
+        """Change image by schema without saving it to db."""
+        self.check_updates([schema])
+        if schema.file:
+            name, extension = schema.filename.split(".")
+            old_image = im.Image(
+                image=image_obj.image.name,
+                content_hash=image_obj.content_hash,
+                derivatives=image_obj.derivatives,
+            )
+            self.release_files([old_image])
+            self.set_file(image_obj, schema.file)
+            image_obj.alt = name
+            if not image_obj.derivatives:
+                self.schedule_derivatives([image_obj.id])
+        if schema.alt:
+            image_obj.alt = schema.alt
 
     def bulk_create(self, schemas: list[ImageInSchema]) -> im.Image:
         """Create image to server side for some entity.
-        json format
-
+        json format. All images are checked before
+        uploaded images are taken and files are saved
         """
+        list_of_images = []
         images = []
+        shared = []
+        batch = {}
+        self.check_images(schemas)
         for schema in schemas:
-            filename = schema.filename
-            image_base64 = schema.image
+            if schema.image_id:
+                list_of_images.append(self.get_uploaded(schema))
+                continue
+            image_field = schema.file
             alt_text = schema.alt
-            image_field = self.check_image(image_base64=image_base64, filename=filename)
-            name, extension = filename.split(".")
+            name, extension = schema.filename.split(".")
             if not alt_text:
                 alt_text = name
-            images.append(im.Image(image=image_field, alt=alt_text))
-        list_of_images = im.Image.objects.bulk_create(images)
+            image = im.Image(alt=alt_text)
+            content_hash = get_content_hash(image_field)
+            if content_hash in batch:
+                shared.append((image, batch[content_hash]))
+            else:
+                self.set_file(image, image_field, content_hash=content_hash)
+                batch[content_hash] = image
+                images.append(image)
+            list_of_images.append(image)
+        im.Image.objects.bulk_create(images)
+        if shared:
+            for image, same in shared:
+                image.image = same.image.name
+                image.content_hash = same.content_hash
+                image.derivatives = same.derivatives
+            im.Image.objects.bulk_create([image for image, same in shared])
+        self.schedule_derivatives(
+            [image.id for image in images if not image.derivatives]
+        )
         return list_of_images
 
     def delete(self, image_obj: im.Image) -> None:
         """Delete image."""
         if image_obj:
-            self.clear_imagekit_cache(image_obj)
             image_obj.delete()
+            self.release_files([image_obj])
 
     def bulk_delete(self, image_ids: list[int]) -> None:
         """Delete multiple images."""
-        images = im.Image.objects.filter(id__in=image_ids)
-        for img in images:
-            self.clear_imagekit_cache(img)
-        images.delete()
+        images = list(im.Image.objects.filter(id__in=image_ids))
+        im.Image.objects.filter(id__in=image_ids).delete()
+        self.release_files(images)
 
     @staticmethod
     def get_image(img_id: int) -> Image:
@@ -123,12 +513,85 @@ class ImageService:
         return obj
 
     @staticmethod
-    def clear_imagekit_cache(image_obj: im.Image) -> Image:
+    def clear_imagekit_cache(name: str) -> None:
         """Clear webp image format which generates
         Imagekit library for each image in system.
+        :param name: name of image file
         """
-        name = image_obj.image.name
         dir_path = Path(name).stem
-        dir_to_rem = Path(f"media/CACHE/images/Image/{dir_path}")
+        dir_to_rem = Path(settings.MEDIA_ROOT) / "CACHE/images/Image" / dir_path
         if dir_to_rem.is_dir():
             shutil.rmtree(dir_to_rem)
+
+    @staticmethod
+    def schedule_derivatives(image_ids: list[int]) -> None:
+        """Start generating of derivatives in background
+        after commit of current transaction.
+        :param image_ids: ids of new or changed images
+        """
+        if image_ids:
+            transaction.on_commit(
+                lambda: generate_image_derivatives.delay(image_ids=image_ids)
+            )
+
+    @staticmethod
+    def touch_owners(image_ids: list[int] | QuerySet) -> None:
+        """Increase versions of records which show images
+        directly or in gallery, so ETags of their pages are changed.
+        :param image_ids: ids of changed images
+        """
+        for model in im.Versioned.__subclasses__():
+            lookups = Q()
+            for field in model._meta.fields:
+                if field.related_model is im.Image:
+                    lookups |= Q(**{f"{field.name}__in": image_ids})
+                elif field.related_model is im.Gallery:
+                    lookups |= Q(**{f"{field.name}__images__in": image_ids})
+            if lookups:
+                model.touch(lookups)
+
+    @staticmethod
+    def generate_derivatives(img_id: int) -> dict[str, str]:
+        """Generate webp image of full size and smaller ones
+        with widths from IMAGE_DERIVATIVE_WIDTHS and save their paths to all
+        images with the same file, paths aren't saved if file was released
+        while generating
+        :param img_id: id of image
+        :return: paths of derivatives by names
+        """
+        image_obj = im.Image.objects.filter(id=img_id).first()
+        if image_obj is None or not image_obj.image:
+            return {}
+        name = image_obj.image.name
+        if name.endswith(".svg"):
+            return {}
+        with image_obj.image.open("rb") as file:
+            source = Image.open(file)
+            source.load()
+        if source.mode not in ("RGB", "RGBA"):
+            source = source.convert("RGBA")
+        sizes = {"webp": None}
+        for width in settings.IMAGE_DERIVATIVE_WIDTHS:
+            if width < source.width:
+                sizes[f"webp_{width}"] = width
+        derivatives = {}
+        for derivative_name, width in sizes.items():
+            img = source
+            if width:
+                img = source.copy()
+                img.thumbnail((width, source.height))
+            buffer = io.BytesIO()
+            img.save(buffer, "WEBP", quality=settings.IMAGE_WEBP_QUALITY)
+            path = DERIVATIVES_PATH.format(stem=Path(name).stem, name=derivative_name)
+            default_storage.delete(path)
+            derivatives[derivative_name] = default_storage.save(
+                path, ContentFile(buffer.getvalue())
+            )
+        updated = im.Image.objects.filter(image=name).update(derivatives=derivatives)
+        if not updated:
+            for path in derivatives.values():
+                default_storage.delete(path)
+            return {}
+        ImageService.touch_owners(im.Image.objects.filter(image=name).values("id"))
+        invalidate_responses(im.Image)
+        return derivatives
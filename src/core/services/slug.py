@@ -0,0 +1,68 @@
+"""Service for allocating unique slugs of models"""
+
+import re
+
+from django.db import IntegrityError
+from django.db import transaction
+from django.db.models import Model
+from pytils.translit import slugify
+
+SLUG_SUFFIX_LENGTH = 6
+SLUG_SAVE_ATTEMPTS = 5
+
+
+class SlugService:
+    """A service class for allocating unique slugs of models.
+    All slugs with the same base are fetched by one query,
+    free suffix is picked in memory
+    """
+
+    @staticmethod
+    def allocate(value: str, model: type[Model], instance: Model = None) -> str:
+        """Get unique slug for value like base, base-1, base-2...
+        Next suffix goes after the biggest taken one, so slugs
+        of deleted instances aren't given to new ones
+        :param value: value for slugify
+        :param model: type of model for checking on unique in db
+        :param instance: instance of model that needs slug
+        :return: unique slug
+        """
+        max_length = model._meta.get_field("slug").max_length
+        base = slugify(value)[: max_length - SLUG_SUFFIX_LENGTH].strip("-")
+        base = base or model._meta.model_name
+        pattern = re.compile(rf"{re.escape(base)}(?:-(\d+))?")
+        if instance and instance.slug and pattern.fullmatch(instance.slug):
+            return instance.slug
+        slugs = model.objects.filter(slug__startswith=base)
+        if instance and instance.pk:
+            slugs = slugs.exclude(id=instance.id)
+        suffixes = []
+        for slug in slugs.values_list("slug", flat=True):
+            match = pattern.fullmatch(slug)
+            if match:
+                suffixes.append(int(match.group(1) or 0))
+        if not suffixes:
+            return base
+        return f"{base}-{max(suffixes) + 1}"
+
+    def save(self, instance: Model, value: str) -> None:
+        """Save instance with unique slug. Slug can be taken
+        by concurrent request between allocating and saving,
+        so on violation of unique slug it is allocated again
+        :param instance: instance of model that needs slug
+        :param value: value for slugify
+        """
+        model = type(instance)
+        for attempt in range(SLUG_SAVE_ATTEMPTS):
+            instance.slug = self.allocate(value=value, model=model, instance=instance)
+            try:
+                with transaction.atomic():
+                    instance.save()
+                return
+            except IntegrityError:
+                taken = model.objects.filter(slug=instance.slug)
+                if instance.pk:
+                    taken = taken.exclude(id=instance.pk)
+                if attempt == SLUG_SAVE_ATTEMPTS - 1 or not taken.exists():
+                    raise
+                instance.slug = None
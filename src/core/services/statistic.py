@@ -1,10 +1,17 @@
 import pendulum
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count
+from django.db.models import Q
 from django.db.models import Sum
 
-from src.booking.models import Ticket
+from src.booking.models import TicketSales
 from src.movies.models import Tech
 from src.users.models import User
 
+COMPUTED_NUMS_KEY = "statistic_computed_nums"
+COMPUTED_NUMS_TIMEOUT = 60
+
 
 class StatisticService:
     """A service class for managing images."""
@@ -47,51 +54,57 @@ class StatisticService:
         end_current_month = today.end_of("month")
         start_last_month = start_current_month.subtract(months=1)
         end_last_month = end_current_month.subtract(months=1)
-        users = User.objects.all()
-        users_count = users.count()
-        men = users.filter(man=True).count()
-        women = users.filter(man=False).count()
-        current_month_tickets = Ticket.objects.filter(
-            date_created__range=[start_current_month, end_current_month],
+        result = cache.get(COMPUTED_NUMS_KEY)
+        if result is not None:
+            return result
+        users = User.objects.aggregate(
+            users_count=Count("id"),
+            men=Count("id", filter=Q(man=True)),
+            women=Count("id", filter=Q(man=False)),
         )
-        current_month_income = current_month_tickets.aggregate(
-            total_income=Sum("seance__price")
-        )["total_income"]
-        last_month_tickets = Ticket.objects.filter(
-            date_created__range=[start_last_month, end_last_month],
+        income = TicketSales.objects.filter(
+            day__range=[start_last_month.date(), end_current_month.date()],
+        ).aggregate(
+            current_month_income=Sum(
+                "income", filter=Q(day__gte=start_current_month.date())
+            ),
+            last_month_income=Sum("income", filter=Q(day__lte=end_last_month.date())),
         )
-        last_month_income = last_month_tickets.aggregate(
-            total_income=Sum("seance__price")
-        )["total_income"]
+        current_month_income = income["current_month_income"]
+        last_month_income = income["last_month_income"]
         income_progress = self.progress_calc(current_month_income, last_month_income)
         income_progress = 0 if income_progress is None else round(income_progress, 2)
         result = {
             "current_month_income": int(current_month_income or 0),
             "income_progress": income_progress,
-            "users_count": int(users_count or 0),
-            "men": int(men or 0),
-            "women": int(women or 0),
+            "users_count": int(users["users_count"] or 0),
+            "men": int(users["men"] or 0),
+            "women": int(users["women"] or 0),
         }
+        cache.set(COMPUTED_NUMS_KEY, result, COMPUTED_NUMS_TIMEOUT)
         return result
 
+    @staticmethod
+    def invalidate_computed_nums() -> None:
+        """Remove cached computed numbers after commit of current transaction,
+        it's called when users or tickets are changed
+        """
+        transaction.on_commit(lambda: cache.delete(COMPUTED_NUMS_KEY))
+
     def get_most_popular_movies(
         self,
     ) -> dict:
         """Get most popular movies on the site."""
         today = pendulum.now(tz="Europe/Kiev")
         start_current_month = today.start_of("month")
-        tickets = Ticket.objects.prefetch_related("seance__movie").filter(
-            date_created__gte=start_current_month
+        sales = (
+            TicketSales.objects.filter(day__gte=start_current_month.date())
+            .values("movie__name_uk")
+            .annotate(value=Sum("tickets_count"))
+            .order_by("-value")
         )
-        labels = []
-        for ticket in tickets:
-            labels.append(ticket.seance.movie.name_uk)
-        labels = list(set(labels))
-        values = []
-        for label in labels:
-            value = tickets.filter(seance__movie__name_uk=label).count()
-
-            values.append(value)
+        labels = [sale["movie__name_uk"] for sale in sales]
+        values = [sale["value"] for sale in sales]
         result = {"labels": labels, "values": values}
         return result
 
@@ -101,20 +114,14 @@ class StatisticService:
         """Get most income movies on the site."""
         today = pendulum.now(tz="Europe/Kiev")
         start_current_month = today.start_of("month")
-        tickets = Ticket.objects.prefetch_related("seance__movie").filter(
-            date_created__gte=start_current_month
+        sales = (
+            TicketSales.objects.filter(day__gte=start_current_month.date())
+            .values("movie__name_uk")
+            .annotate(value=Sum("income"))
+            .order_by("-value")
         )
-        labels = []
-        for ticket in tickets:
-            labels.append(ticket.seance.movie.name_uk)
-        labels = list(set(labels))
-        values = []
-        for label in labels:
-            value = tickets.filter(seance__movie__name_uk=label).aggregate(
-                total_income=Sum("seance__price")
-            )
-
-            values.append(value["total_income"])
+        labels = [sale["movie__name_uk"] for sale in sales]
+        values = [sale["value"] for sale in sales]
         result = {"labels": labels, "values": values}
         return result
 
@@ -124,15 +131,15 @@ class StatisticService:
         """Get most popular techs on the site."""
         today = pendulum.now(tz="Europe/Kiev")
         start_current_month = today.start_of("month")
-        tickets = Ticket.objects.prefetch_related(
-            "seance__movie", "seance__hall__tech"
-        ).filter(date_created__gte=start_current_month)
-        techs = Tech.objects.all()
+        techs = Tech.objects.annotate(
+            value=Sum(
+                "ticketsales__tickets_count",
+                filter=Q(ticketsales__day__gte=start_current_month.date()),
+                default=0,
+            )
+        ).order_by("id")
         labels = [tech.name for tech in techs]
-        values = []
-        for label in labels:
-            value = tickets.filter(seance__hall__tech__name=label).count()
-            values.append(value)
+        values = [tech.value for tech in techs]
         total = sum(values)
         values_percents = []
         for value in values:
@@ -0,0 +1,44 @@
+"""Celery tasks for core"""
+
+from celery.app import shared_task
+
+from src.core.models import Image
+
+
+@shared_task()
+def generate_image_derivatives(image_ids: list[int] | None = None) -> int:
+    """Generate webp derivatives of images.
+    :param image_ids: ids of images, all images without derivatives if None
+    :return: count of processed images
+    """
+    from src.core.services.images import ImageService
+
+    if image_ids is None:
+        image_ids = list(
+            Image.objects.filter(derivatives={}).values_list("id", flat=True)
+        )
+    for img_id in image_ids:
+        ImageService.generate_derivatives(img_id=img_id)
+    return len(image_ids)
+
+
+@shared_task()
+def purge_image_files(files: list[dict]) -> int:
+    """Delete files of deleted or changed images.
+    :param files: names of files with paths of their derivatives
+    :return: count of deleted files
+    """
+    from src.core.services.images import ImageService
+
+    return ImageService().purge_files(files=files)
+
+
+@shared_task()
+def collect_orphan_images(dry_run: bool = True) -> dict:
+    """Delete images and files in media which don't belong to anything.
+    :param dry_run: only report orphans without deleting
+    :return: report with ids of images and paths of orphans
+    """
+    from src.core.services.images import ImageService
+
+    return ImageService.collect_orphans(dry_run=dry_run)
@@ -1,10 +1,35 @@
-"""Test cases for core essences(Gallery, Image)"""
+"""Test cases for core essences(Gallery, Image, Slug)"""
+
+import os
+from datetime import timedelta
+from urllib.parse import parse_qs
+from urllib.parse import urlsplit
 
 import pytest
+from django.core.cache import cache
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import IntegrityError
+from django.db.models import F
+from django.test import RequestFactory
+from django.test.client import MULTIPART_CONTENT
+from django.utils import timezone
 from ninja_extra.testing import TestClient
+from pytils.translit import slugify
+
+from src.pages.models import Page
 
 from .endpoints.gallery import GalleryController
+from .endpoints.images import ImageController
 from .endpoints.statistic import StatisticController
+from .errors import UnprocessableEntityExceptionError
+from .models import Gallery
+from .models import Image
+from .pagination import CursorPagination
+from .schemas.images import ImageInSchema
+from .services.images import IMAGE_HASH_USED_KEY
+from .services.images import ImageService
+from .services.slug import SlugService
 
 
 @pytest.mark.django_db()
@@ -30,6 +55,196 @@ class TestGalleryController:
         assert response.status_code == expected_status
 
 
+@pytest.mark.django_db()
+class TestImageController:
+    headers = {"Authorization": "Bearer admin"}
+    client = TestClient(ImageController)
+
+    def test_upload_image(self):
+        file_path = os.path.join("seed", "bottom_slider", "800x500bot.jpg")
+        with open(file_path, "rb") as f:
+            content = f.read()
+        file = SimpleUploadedFile("800x500bot.jpg", content, content_type="image/jpeg")
+        response = self.client.post(
+            "/upload/",
+            content_type=MULTIPART_CONTENT,
+            FILES={"file": file},
+            headers=self.headers,
+        )
+        assert response.status_code == 200
+
+    def test_upload_broken_image(self):
+        file = SimpleUploadedFile("broken.png", b"broken", content_type="image/png")
+        response = self.client.post(
+            "/upload/",
+            content_type=MULTIPART_CONTENT,
+            FILES={"file": file},
+            headers=self.headers,
+        )
+        assert response.status_code == 422
+
+
+@pytest.mark.django_db()
+class TestImageService:
+    image_service = ImageService()
+
+    def test_delete_image_keeps_shared_file(self):
+        file_path = os.path.join("seed", "bottom_slider", "800x500bot.jpg")
+        with open(file_path, "rb") as f:
+            content = f.read()
+        first = self.image_service.upload(SimpleUploadedFile("first.jpg", content))
+        second = self.image_service.upload(SimpleUploadedFile("second.jpg", content))
+        assert first.content_hash == second.content_hash
+        assert first.image.name == second.image.name
+
+        self.image_service.delete(first)
+        assert default_storage.exists(second.image.name)
+
+        purged = self.image_service.purge_files(
+            [{"name": first.image.name, "derivatives": []}]
+        )
+        assert purged == 0
+        assert default_storage.exists(second.image.name)
+
+    def test_purge_keeps_file_of_recently_used_hash(self):
+        file_path = os.path.join("seed", "bottom_slider", "800x500bot.jpg")
+        with open(file_path, "rb") as f:
+            content = f.read()
+        image = self.image_service.upload(SimpleUploadedFile("img.jpg", content))
+        image.delete()
+        files = [
+            {
+                "name": image.image.name,
+                "content_hash": image.content_hash,
+                "derivatives": [],
+            }
+        ]
+
+        assert self.image_service.purge_files(files) == 0
+        assert default_storage.exists(image.image.name)
+
+        cache.delete(IMAGE_HASH_USED_KEY.format(content_hash=image.content_hash))
+        assert self.image_service.purge_files(files) == 1
+        assert not default_storage.exists(image.image.name)
+
+    def test_uploaded_image_is_taken_once(self):
+        file_path = os.path.join("seed", "bottom_slider", "800x500bot.jpg")
+        with open(file_path, "rb") as f:
+            content = f.read()
+        uploaded = self.image_service.upload(SimpleUploadedFile("img.jpg", content))
+        assert uploaded.is_temporary
+
+        taken = self.image_service.get_uploaded(
+            ImageInSchema(image_id=uploaded.id, alt="alt")
+        )
+        assert taken.id == uploaded.id
+        assert not taken.is_temporary
+        assert taken.alt == "alt"
+
+        with pytest.raises(UnprocessableEntityExceptionError):
+            self.image_service.get_uploaded(ImageInSchema(image_id=uploaded.id))
+
+    def test_collect_orphan_images(self):
+        old = timezone.now() - timedelta(days=2)
+        orphan, fresh = Image.objects.bulk_create(
+            [Image(alt="orphan"), Image(alt="fresh")]
+        )
+        Image.objects.filter(id=orphan.id).update(date_created=old)
+        gallery = Gallery.objects.create()
+        gallery.images.add(orphan)
+
+        report = self.image_service.collect_orphans(dry_run=True)
+        assert orphan.id not in report["images"]
+        assert fresh.id not in report["images"]
+
+        gallery.delete()
+        report = self.image_service.collect_orphans(dry_run=False)
+        assert orphan.id in report["images"]
+        assert not Image.objects.filter(id=orphan.id).exists()
+        assert Image.objects.filter(id=fresh.id).exists()
+
+
+@pytest.mark.django_db()
+class TestCursorPagination:
+    paginator = CursorPagination(page_size=2)
+    request = RequestFactory().get("/images/")
+
+    def walk(self, queryset) -> list:
+        """Read all pages of queryset by next links."""
+        rows, cursor = [], None
+        while True:
+            page = self.paginator.paginate_queryset(
+                queryset, self.paginator.Input(cursor=cursor), request=self.request
+            )
+            rows.extend(page["results"])
+            if page["next"] is None:
+                return rows
+            cursor = parse_qs(urlsplit(page["next"]).query)["cursor"][0]
+
+    def test_get_ordering_adds_primary_key(self):
+        ordering = CursorPagination.get_ordering(Image.objects.order_by("-alt"))
+        assert ordering == ["-alt", "-pk"]
+        ordering = CursorPagination.get_ordering(Image.objects.order_by("alt", "id"))
+        assert ordering == ["alt", "id"]
+
+    def test_cursor_keeps_values(self):
+        created = timezone.now()
+        cursor = CursorPagination.encode_cursor([created, 5], reverse=True)
+        values, reverse = CursorPagination.decode_cursor(
+            cursor, Image, ["-date_created", "-pk"]
+        )
+        assert values == [created, 5]
+        assert reverse
+
+    @pytest.mark.parametrize(
+        "cursor",
+        [
+            "invalid",
+            CursorPagination.encode_cursor([5], reverse=False),
+            CursorPagination.encode_cursor(["yesterday", 5], reverse=False),
+        ],
+    )
+    def test_invalid_cursor(self, cursor):
+        with pytest.raises(UnprocessableEntityExceptionError):
+            CursorPagination.decode_cursor(cursor, Image, ["-date_created", "-pk"])
+
+    def test_pages_by_next_and_previous_links(self):
+        images = Image.objects.bulk_create(
+            [Image(alt=alt) for alt in ["b", "a", "c", "a", "b"]]
+        )
+        queryset = Image.objects.filter(id__in=[image.id for image in images])
+        queryset = queryset.order_by("alt")
+        assert self.walk(queryset) == list(queryset.order_by("alt", "pk"))
+
+        first = self.paginator.paginate_queryset(
+            queryset, self.paginator.Input(), request=self.request
+        )
+        cursor = parse_qs(urlsplit(first["next"]).query)["cursor"][0]
+        second = self.paginator.paginate_queryset(
+            queryset, self.paginator.Input(cursor=cursor), request=self.request
+        )
+        cursor = parse_qs(urlsplit(second["previous"]).query)["cursor"][0]
+        previous = self.paginator.paginate_queryset(
+            queryset, self.paginator.Input(cursor=cursor), request=self.request
+        )
+        assert previous["results"] == first["results"]
+        assert previous["previous"] is None
+        assert first["count"] is None
+
+    def test_pages_by_nullable_field(self):
+        images = Image.objects.bulk_create([Image(alt=str(i)) for i in range(5)])
+        Image.objects.filter(id__in=[images[1].id, images[3].id]).update(
+            date_created=None
+        )
+        queryset = Image.objects.filter(id__in=[image.id for image in images])
+        ascending = [F("date_created").asc(nulls_last=True), "pk"]
+        expected = list(queryset.order_by(*ascending))
+        assert self.walk(queryset.order_by("date_created")) == expected
+        descending = [F("date_created").desc(nulls_first=True), "-pk"]
+        expected = list(queryset.order_by(*descending))
+        assert self.walk(queryset.order_by("-date_created")) == expected
+
+
 @pytest.mark.django_db()
 class TestStatisticController:
     headers = {"Authorization": "Bearer admin"}
@@ -50,3 +265,56 @@ class TestStatisticController:
     def test_get_most_popular_techs(self):
         response = self.client.get("/most-popular-techs/", headers=self.headers)
         assert response.status_code == 200
+
+
+@pytest.mark.django_db()
+class TestSlugService:
+    slug_service = SlugService()
+    value = "Сторінка для перевірки слагів"
+
+    @staticmethod
+    def make_page(slug: str) -> Page:
+        return Page.objects.create(slug=slug, content={}, active=True)
+
+    def test_allocate_base_slug(self):
+        slug = self.slug_service.allocate(value=self.value, model=Page)
+        assert slug == slugify(self.value)
+
+    def test_allocate_next_suffix(self):
+        base = slugify(self.value)
+        self.make_page(base)
+        self.make_page(f"{base}-3")
+        self.make_page(f"{base}-other")
+        slug = self.slug_service.allocate(value=self.value, model=Page)
+        assert slug == f"{base}-4"
+
+    def test_allocate_keeps_slug_of_instance(self):
+        base = slugify(self.value)
+        self.make_page(base)
+        page = self.make_page(f"{base}-2")
+        slug = self.slug_service.allocate(value=self.value, model=Page, instance=page)
+        assert slug == page.slug
+
+    def test_save_retries_taken_slug(self, monkeypatch):
+        base = slugify(self.value)
+        self.make_page(base)
+        allocate = SlugService.allocate
+        slugs = iter([base])
+
+        def allocate_taken(**kwargs) -> str:
+            return next(slugs, None) or allocate(**kwargs)
+
+        monkeypatch.setattr(SlugService, "allocate", staticmethod(allocate_taken))
+        page = Page(content={}, active=True)
+        self.slug_service.save(instance=page, value=self.value)
+        assert page.pk is not None
+        assert page.slug == f"{base}-1"
+
+    def test_save_raises_other_integrity_error(self, monkeypatch):
+        def save(*args, **kwargs) -> None:
+            raise IntegrityError
+
+        page = Page(content={}, active=True)
+        monkeypatch.setattr(page, "save", save)
+        with pytest.raises(IntegrityError):
+            self.slug_service.save(instance=page, value=self.value)
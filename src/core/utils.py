@@ -1,22 +1,40 @@
 """Common utils for all apps"""
 
+import hashlib
+from datetime import date
 from datetime import datetime
+from functools import lru_cache
+from functools import wraps
 from os.path import splitext
 from typing import Any
+from typing import Callable
 
+from django.conf import settings
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
+from django.core.files.base import File
 from django.core.paginator import EmptyPage
 from django.core.paginator import Paginator
+from django.db import transaction
 from django.db.models import Model
 from django.db.models import QuerySet
+from django.db.models.signals import m2m_changed
+from django.db.models.signals import post_delete
+from django.db.models.signals import post_save
 from django.http import HttpRequest
+from django.http import HttpResponse
+from django.template.defaultfilters import date as _date
+from django.utils import translation
+from django.utils.cache import get_conditional_response
+from django.utils.cache import patch_vary_headers
+from django.utils.cache import quote_etag
 from django.utils.translation import gettext as _
+from ninja.decorators import decorate_view
 from ninja.errors import HttpError
 from ninja.security import HttpBearer
 from ninja_jwt.authentication import JWTBaseAuthentication
 from phonenumber_field.validators import validate_international_phonenumber
 from pydantic_core._pydantic_core import Url
-from pytils.translit import slugify
 
 from src.core.errors import UnprocessableEntityExceptionError
 from src.users.models import User
@@ -77,6 +95,157 @@ class CustomJWTAuth(JWTBaseAuthentication, HttpBearer):
         return self.jwt_authenticate(request, token)
 
 
+RESPONSE_CACHE_KEY = "response_cache:{digest}"
+RESPONSE_VERSION_KEY = "response_cache_version:{label}"
+
+
+def cache_response(*models: type[Model], timeout: int | None = None) -> Callable:
+    """Cache rendered response of GET endpoint.
+    Response is keyed by path with query, language of request and
+    versions of models which it is built from. Version of model is bumped
+    after every change of it, so stale responses are never read again.
+    Decorator has to be placed under http_get decorator
+    :param models: models which response depends on
+    :param timeout: lifetime of response in seconds, default from settings
+    """
+    labels = [model._meta.label for model in models]
+    connect_invalidation(*models)
+
+    def decorator(run: Callable) -> Callable:
+        @wraps(run)
+        def wrapper(request: HttpRequest, **kwargs) -> HttpResponse:
+            key = get_response_key(request, labels)
+            cached = cache.get(key)
+            if cached is None:
+                response = run(request, **kwargs)
+                if response.status_code != 200:
+                    return response
+                cached = {
+                    "content": response.content,
+                    "content_type": response["Content-Type"],
+                    "etag": quote_etag(hashlib.md5(response.content).hexdigest()),
+                }
+                cache.set(key, cached, timeout or settings.RESPONSE_CACHE_TIMEOUT)
+            else:
+                response = HttpResponse(
+                    cached["content"], content_type=cached["content_type"]
+                )
+            response["ETag"] = cached["etag"]
+            patch_vary_headers(response, ["Accept-Language"])
+            return get_conditional_response(
+                request, etag=cached["etag"], response=response
+            )
+
+        return wrapper
+
+    return decorate_view(decorator)
+
+
+def versioned_response(model: type[Model], kwarg: str, field: str = "slug") -> Callable:
+    """Answer conditional GET of detail endpoint by version of record.
+    ETag is made from version of record, so If-None-Match is checked
+    by one light query before fetching record with all its relations.
+    Decorator has to be placed under http_get decorator
+    and above cache_response
+    :param model: model with version field
+    :param kwarg: name of path parameter with value for lookup
+    :param field: field of model for lookup
+    """
+
+    def decorator(run: Callable) -> Callable:
+        @wraps(run)
+        def wrapper(request: HttpRequest, **kwargs) -> HttpResponse:
+            value = kwargs.get(kwarg)
+            version = (
+                model.objects.filter(**{field: value})
+                .values_list("version", flat=True)
+                .first()
+            )
+            if version is None:
+                return run(request, **kwargs)
+            parts = [
+                settings.ROOT_URLCONF,
+                model._meta.label,
+                str(value),
+                str(version),
+                translation.get_language(),
+            ]
+            etag = quote_etag(hashlib.md5("|".join(parts).encode()).hexdigest())
+            response = get_conditional_response(request, etag=etag)
+            if response is None:
+                response = run(request, **kwargs)
+                if response.status_code != 200:
+                    return response
+            response["ETag"] = etag
+            patch_vary_headers(response, ["Accept-Language"])
+            return response
+
+        return wrapper
+
+    return decorate_view(decorator)
+
+
+def get_response_key(request: HttpRequest, labels: list[str]) -> str:
+    """Make key of cached response for request.
+    :param request: object of request
+    :param labels: labels of models which response depends on
+    """
+    version_keys = [RESPONSE_VERSION_KEY.format(label=label) for label in labels]
+    versions = cache.get_many(version_keys)
+    parts = [
+        settings.ROOT_URLCONF,
+        request.get_full_path(),
+        translation.get_language(),
+        *(str(versions.get(key, 0)) for key in version_keys),
+    ]
+    digest = hashlib.md5("|".join(parts).encode()).hexdigest()
+    return RESPONSE_CACHE_KEY.format(digest=digest)
+
+
+def invalidate_responses(*models: type[Model]) -> None:
+    """Bump versions of models after commit of transaction,
+    so cached responses which depend on them are rebuilt.
+    Used directly for changes which don't send signals (bulk_update etc.)
+    :param models: changed models
+    """
+
+    def bump_versions() -> None:
+        for model in models:
+            key = RESPONSE_VERSION_KEY.format(label=model._meta.label)
+            cache.add(key, 0, timeout=None)
+            cache.incr(key)
+
+    transaction.on_commit(bump_versions)
+
+
+def connect_invalidation(*models: type[Model]) -> None:
+    """Connect invalidation of cached responses to signals of models
+    and of their many-to-many relations, changes of other models
+    don't bump any versions
+    :param models: models which cached responses depend on
+    """
+    for model in models:
+        post_save.connect(invalidate_responses_handler, sender=model)
+        post_delete.connect(invalidate_responses_handler, sender=model)
+        for field in model._meta.get_fields():
+            if field.many_to_many:
+                relation = field if field.auto_created else field.remote_field
+                m2m_changed.connect(
+                    invalidate_responses_handler, sender=relation.through
+                )
+
+
+def invalidate_responses_handler(sender: type[Model], **kwargs) -> None:
+    """Receiver of post_save, post_delete and m2m_changed signals."""
+    if kwargs.get("raw"):
+        return
+    if "action" in kwargs:
+        if kwargs["action"].startswith("post_"):
+            invalidate_responses(type(kwargs["instance"]), kwargs["model"])
+        return
+    invalidate_responses(sender)
+
+
 primitives = (bool, str, int, float, Url)
 
 
@@ -92,22 +261,32 @@ def check_phone_number(phone_number: str) -> None:
         raise UnprocessableEntityExceptionError(message=msg)
 
 
-def make_slug(value: str, model: Model, instance: Model = None) -> str:
-    """Method for making uniques slug for particular model instance
-    :param value: value for slugify
-    :param model: type of model for checking on unique in db
-    :param instance: instance of model that needs slug
-    :return:
+def format_date_label(value: date, date_format: str) -> str:
+    """Method for making upper case date labels for current language,
+    use "E" in date_format for month name in genitive case
+    (05 червня, 05 июня), labels are cached per language
+    :param value: date for formatting
+    :param date_format: format string of django date filter
+    :return: formatted label
+    """
+    return _format_date_label(value, translation.get_language(), date_format)
+
+
+@lru_cache(maxsize=1024)
+def _format_date_label(value: date, lang: str, date_format: str) -> str:
+    with translation.override(lang):
+        return _date(value, date_format).upper()
+
+
+def get_content_hash(file: File) -> str:
+    """Count sha256 of file content for finding of the same files.
+
+    :param file: file object
+    :return: hex digest of content
     """
-    slug = slugify(value)
-    counter = 1
-    while True:
-        objs = model.objects.filter(slug=slug)
-        if instance:
-            objs = objs.exclude(id=instance.id)
-
-        if objs.count() == 0:
-            return slug
-
-        slug = f"{slug}-{counter}"
-        counter += 1
+    content_hash = hashlib.sha256()
+    file.seek(0)
+    for chunk in file.chunks():
+        content_hash.update(chunk)
+    file.seek(0)
+    return content_hash.hexdigest()
@@ -78,6 +78,7 @@ class MailingController(ControllerBase):
             Причини: \n
                 1) Дозволено відправляти тільки html \n
                 2) Максимально дозволений розмір файлу 1MB \n
+                3) Html файл має бути в кодуванні UTF-8 \n
           - **500**: Internal server error if an unexpected error occurs.
 
         """
@@ -0,0 +1,55 @@
+import zlib
+from functools import lru_cache
+
+from django.db import models
+from django.utils.html import strip_spaces_between_tags
+from django.utils.translation import gettext as _
+from ninja.files import UploadedFile
+
+from src.core.errors import UnprocessableEntityExceptionError
+
+
+class MailTemplateManager(models.Manager):
+    """Custom mail template manager. Html of template is minified
+    and compressed once on upload, so letter for mailing is taken
+    by id of template instead of reading file every time
+    """
+
+    def create_template(self, file: UploadedFile, name: str) -> models.Model:
+        """Create template and save its compressed html.
+        :param file: uploaded html file
+        :param name: name of template
+        :return: MailTemplate model instance
+        """
+        try:
+            html_content = file.read().decode()
+        except UnicodeDecodeError:
+            msg = _("Html файл має бути в кодуванні UTF-8")
+            raise UnprocessableEntityExceptionError(message=msg, field="file")
+        file.seek(0)
+        return self.create(file=file, name=name, content=compress(html_content))
+
+    def get_content(self, temp_id: int) -> str:
+        """Get html of template by id. Templates aren't changed after upload,
+        so html is cached in every worker process
+        :param temp_id: id of template
+        :return: letter in html format
+        """
+        return _get_content(self.model, temp_id)
+
+
+def compress(html_content: str) -> bytes:
+    """Minify html and compress it for storing in db.
+    :param html_content: letter in html format
+    """
+    return zlib.compress(strip_spaces_between_tags(html_content.strip()).encode())
+
+
+@lru_cache(maxsize=32)
+def _get_content(model: type[models.Model], temp_id: int) -> str:
+    template = model.objects.only("file", "content").get(id=temp_id)
+    if template.content is None:
+        with template.file.open("rb") as file:
+            template.content = compress(file.read().decode(errors="replace"))
+        template.save(update_fields=["content"])
+    return zlib.decompress(template.content).decode()
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.6 on 2026-10-17 22:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mailing', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='mailtemplate',
+            name='content',
+            field=models.BinaryField(null=True),
+        ),
+    ]
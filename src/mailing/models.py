@@ -3,13 +3,20 @@
 from django.db import models
 
 from src.core.utils import get_timestamp_path
+from src.mailing.managers.template import MailTemplateManager
 
 
 # Create your models here.
 class MailTemplate(models.Model):
+    """Шаблон письма для рассылки
+    :param content минифицированный html шаблона сжатый zlib
+    """
+
     name = models.CharField(max_length=255)
     file = models.FileField(upload_to=get_timestamp_path, null=True)
+    content = models.BinaryField(null=True, editable=False)
     date_created = models.DateTimeField(auto_now_add=True)
+    objects = MailTemplateManager()
 
     class Meta:
         ordering = ["-date_created"]
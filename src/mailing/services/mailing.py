@@ -1,4 +1,3 @@
-from celery.result import AsyncResult
 from django.core.cache import cache
 from django.db.models import QuerySet
 from django.utils.translation import gettext as _
@@ -13,6 +12,8 @@ from src.mailing.models import MailTemplate
 from src.mailing.schemas import MailingInSchema
 from src.mailing.schemas import TaskInfoOutSchema
 from src.mailing.tasks import make_mailing
+from src.mailing.utils import MAILING_TASK_KEY
+from src.mailing.utils import MailingState
 
 
 class MailingService:
@@ -27,12 +28,9 @@ class MailingService:
         for mailing
         :return: message that everything is ok and mailing started
         """
-        if cache.get("mailing_task") is None:
-            temp = MailTemplate.objects.get(id=body.temp_id)
-            with open(f"{temp.file.path}") as file:
-                html_content = file.read()
-            task = make_mailing.delay(user_ids=body.user_ids, html_content=html_content)
-            cache.set("mailing_task", task.id)
+        if cache.get(MAILING_TASK_KEY) is None:
+            task = make_mailing.delay(user_ids=body.user_ids, temp_id=body.temp_id)
+            cache.set(MAILING_TASK_KEY, task.id)
         else:
             msg = _("Треба зачекати поки закінчиться поточне розсилання")
             raise MailingIsActiveExceptionError(message=msg)
@@ -44,19 +42,20 @@ class MailingService:
 
         :return: MailTemplate QuerySet
         """
-        task_id = cache.get("mailing_task")
+        task_id = cache.get(MAILING_TASK_KEY)
         if task_id:
-            task = AsyncResult(task_id)
-            if task.result == "COMPLETE":
-                cache.delete("mailing_task")
+            state = MailingState(mailing_id=task_id)
+            progress = state.get_progress()
+            if progress is not None and progress["complete"]:
+                cache.delete(MAILING_TASK_KEY)
+                state.clear()
                 msg = _("Розсилання успішно виконане")
                 return 201, MessageOutSchema(detail=msg)
-            data = task.result
             current = 0
             total = 100
-            if isinstance(data, dict):
-                current = data["current"]
-                total = data["total"]
+            if progress is not None and progress["total"]:
+                current = progress["current"]
+                total = progress["total"]
             result = (current / total) * 100
             return 200, TaskInfoOutSchema(
                 progress=int(result), letters_count=int(total)
@@ -85,7 +84,7 @@ class MailingService:
             msg = _("Максимально дозволений розмір файлу 1MB")
             raise UnprocessableEntityExceptionError(message=msg)
         name = file.name.split(".")[0]
-        template = MailTemplate.objects.create(file=file, name=name)
+        template = MailTemplate.objects.create_template(file=file, name=name)
         return template
 
     @staticmethod
@@ -99,7 +98,7 @@ class MailingService:
         except MailTemplate.DoesNotExist:
             msg = _("Не знайдено: немає збігів шаблонів " "на заданному запиті")
             raise NotFoundExceptionError(message=msg, cls_model=MailTemplate)
-        task_id = cache.get("mailing_task")
+        task_id = cache.get(MAILING_TASK_KEY)
         if task_id:
             msg = _("Треба зачекати поки закінчиться поточне розсилання")
             raise MailingIsActiveExceptionError(message=msg)
@@ -1,31 +1,84 @@
 """Celery task for implementing mailing"""
 
-from celery import current_task
+from celery import chord
 from celery.app import shared_task
 from django.core.mail import EmailMultiAlternatives
+from django.core.mail import get_connection
 
 from config.settings import settings
+from src.mailing.models import MailTemplate
+from src.mailing.utils import MAILING_CHUNK_SIZE
+from src.mailing.utils import MailingState
+from src.mailing.utils import iter_chunks
 from src.users.models import User
 
 
-@shared_task()
-def make_mailing(user_ids: list | None, html_content: str) -> str:
-    """Send letter to user and ask him to confirm registration
-    In letter he will find link which redirects him to the site
-    for confirmation
-    :param html_content: letter in html format
+@shared_task(bind=True, acks_late=True, reject_on_worker_lost=True)
+def make_mailing(self, user_ids: list | None, temp_id: int) -> str:
+    """Split recipients of mailing to chunks and send them in parallel.
+    Ids of recipients are streamed from db, every chunk is passed
+    to its task by bounds of ids, so emails of all recipients are
+    never kept in memory or in messages of broker. Chunks which were
+    sent before crash of worker are skipped when task is delivered again
+    :param temp_id: id of template with letter
     :param user_ids: list of users for mailing
     """
-    if user_ids is None:
-        users = User.objects.only("email").all()
-    else:
-        users = User.objects.only("id", "email").filter(id__in=user_ids)
-
-    recipients = [user.email for user in users]
-    current_task.update_state(
-        state="PROGRESS", meta={"current": 0, "total": len(recipients)}
-    )
-    for index, recipient in enumerate(recipients, start=1):
+    users = User.objects.order_by("id")
+    if user_ids is not None:
+        users = users.filter(id__in=user_ids)
+    state = MailingState(mailing_id=self.request.id)
+    state.start(total=users.count())
+
+    ids = users.values_list("id", flat=True).iterator(chunk_size=MAILING_CHUNK_SIZE)
+    signatures = []
+    for index, chunk in enumerate(iter_chunks(ids, MAILING_CHUNK_SIZE)):
+        if state.is_chunk_sent(index):
+            continue
+        signatures.append(
+            send_mailing_chunk.si(
+                mailing_id=self.request.id,
+                index=index,
+                temp_id=temp_id,
+                first_id=chunk[0],
+                last_id=chunk[-1],
+                user_ids=chunk if user_ids is not None else None,
+            )
+        )
+    if not signatures:
+        state.finish()
+        return "COMPLETE"
+    chord(signatures)(finish_mailing.si(mailing_id=self.request.id))
+    return "STARTED"
+
+
+@shared_task(acks_late=True, reject_on_worker_lost=True)
+def send_mailing_chunk(
+    mailing_id: str,
+    index: int,
+    temp_id: int,
+    first_id: int,
+    last_id: int,
+    user_ids: list[int] | None = None,
+) -> int:
+    """Send letters to chunk of recipients through one smtp connection.
+    :param mailing_id: id of task which started mailing
+    :param index: number of chunk
+    :param temp_id: id of template with letter
+    :param first_id: id of first user of chunk
+    :param last_id: id of last user of chunk
+    :param user_ids: ids of chunk if mailing isn't for all users
+    :return: count of sent letters
+    """
+    state = MailingState(mailing_id=mailing_id)
+    if state.is_chunk_sent(index):
+        return 0
+    users = User.objects.filter(id__range=(first_id, last_id))
+    if user_ids is not None:
+        users = users.filter(id__in=user_ids)
+    recipients = list(users.values_list("email", flat=True))
+    html_content = MailTemplate.objects.get_content(temp_id=temp_id)
+    messages = []
+    for recipient in recipients:
         email = EmailMultiAlternatives(
             "KinoCMS",
             "",
@@ -33,14 +86,17 @@ def make_mailing(user_ids: list | None, html_content: str) -> str:
             [recipient],
         )
         email.attach_alternative(html_content, "text/html")
-        email.send(fail_silently=True)
-        if index == len(recipients):
-            current_task.update_state(
-                state="COMPLETE", meta={"current": index, "total": len(recipients)}
-            )
-        else:
-            current_task.update_state(
-                state="PROGRESS", meta={"current": index, "total": len(recipients)}
-            )
+        messages.append(email)
+    with get_connection(fail_silently=True) as connection:
+        sent = connection.send_messages(messages) or 0
+    state.complete_chunk(index=index, letters_count=len(recipients))
+    return sent
 
+
+@shared_task()
+def finish_mailing(mailing_id: str) -> str:
+    """Mark mailing as complete when all chunks are sent.
+    :param mailing_id: id of task which started mailing
+    """
+    MailingState(mailing_id=mailing_id).finish()
     return "COMPLETE"
@@ -7,6 +7,7 @@ import random
 import pytest
 from django.core.cache import cache as dj_cache
 from django.core.files import File
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.core.files.uploadedfile import UploadedFile
 from django.test.client import MULTIPART_CONTENT
 from ninja_extra.testing import TestClient
@@ -45,6 +46,21 @@ class TestMailingController:
             )
         assert response.status_code == expected_status
 
+    def test_create_template_not_in_utf8(self):
+        file = SimpleUploadedFile(
+            "not-utf8.html",
+            "<p>Привіт</p>".encode("cp1251"),
+            content_type="text/html",
+        )
+        response = self.client.post(
+            "/template/",
+            content_type=MULTIPART_CONTENT,
+            FILES={"file": file},
+            headers=self.headers,
+        )
+        assert response.status_code == 422
+        assert not MailTemplate.objects.filter(name="not-utf8").exists()
+
     @pytest.mark.parametrize(
         "expected_status",
         [
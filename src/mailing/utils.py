@@ -0,0 +1,93 @@
+"""Common utils for mailing app"""
+
+from collections.abc import Iterable
+from collections.abc import Iterator
+
+from django_redis import get_redis_connection
+
+MAILING_TASK_KEY = "mailing_task"
+MAILING_PROGRESS_KEY = "mailing_progress:{mailing_id}"
+MAILING_CHUNKS_KEY = "mailing_chunks:{mailing_id}"
+MAILING_CHUNK_SIZE = 500
+MAILING_TIMEOUT = 60 * 60 * 24
+
+
+def iter_chunks(ids: Iterable[int], size: int) -> Iterator[list[int]]:
+    """Split stream of ids to chunks, only one chunk is kept in memory.
+    :param ids: ids of recipients in ascending order
+    :param size: length of chunk
+    """
+    chunk = []
+    for item_id in ids:
+        chunk.append(item_id)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class MailingState:
+    """Progress of mailing which is stored in redis.
+    Recipients of mailing are split to chunks, every chunk is sent
+    by its own task, so progress is saved once per chunk.
+    Numbers of sent chunks are kept, so after crash of worker
+    mailing is continued from chunks which weren't sent yet
+    :param mailing_id: id of task which started mailing
+    """
+
+    def __init__(self, mailing_id: str):
+        self.mailing_id = mailing_id
+        self.key = MAILING_PROGRESS_KEY.format(mailing_id=mailing_id)
+        self.chunks_key = MAILING_CHUNKS_KEY.format(mailing_id=mailing_id)
+        self.redis = get_redis_connection("default")
+
+    def start(self, total: int) -> None:
+        """Save count of recipients, sent letters aren't reset
+        if mailing is started again after crash.
+        :param total: count of recipients
+        """
+        pipe = self.redis.pipeline()
+        pipe.hset(self.key, "total", total)
+        pipe.hsetnx(self.key, "current", 0)
+        pipe.expire(self.key, MAILING_TIMEOUT)
+        pipe.execute()
+
+    def is_chunk_sent(self, index: int) -> bool:
+        """Check that chunk of recipients was sent already.
+        :param index: number of chunk
+        """
+        return bool(self.redis.sismember(self.chunks_key, index))
+
+    def complete_chunk(self, index: int, letters_count: int) -> None:
+        """Mark chunk as sent and add its letters to progress.
+        :param index: number of chunk
+        :param letters_count: count of letters in chunk
+        """
+        if self.redis.sadd(self.chunks_key, index):
+            pipe = self.redis.pipeline()
+            pipe.hincrby(self.key, "current", letters_count)
+            pipe.expire(self.chunks_key, MAILING_TIMEOUT)
+            pipe.execute()
+
+    def finish(self) -> None:
+        """Mark mailing as complete."""
+        self.redis.hset(self.key, "complete", 1)
+
+    def get_progress(self) -> dict[str, int] | None:
+        """Get progress of mailing.
+        :return: dict with current, total and complete
+        or None if mailing isn't started yet
+        """
+        progress = self.redis.hgetall(self.key)
+        if not progress:
+            return None
+        return {
+            "current": int(progress.get(b"current", 0)),
+            "total": int(progress.get(b"total", 0)),
+            "complete": bool(int(progress.get(b"complete", 0))),
+        }
+
+    def clear(self) -> None:
+        """Remove state of mailing from redis."""
+        self.redis.delete(self.key, self.chunks_key)
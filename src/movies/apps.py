@@ -8,3 +8,7 @@ class MoviesConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "src.movies"
+
+    def ready(self) -> None:
+        """Connect receivers of signals"""
+        import src.movies.signals  # noqa: F401
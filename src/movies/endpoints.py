@@ -6,6 +6,7 @@ from django.db.models import QuerySet
 from django.http import HttpRequest
 from django_countries.data import COUNTRIES
 from ninja import Header
+from ninja.responses import Response
 from ninja_extra import http_delete
 from ninja_extra import http_get
 from ninja_extra import http_patch
@@ -16,17 +17,25 @@ from ninja_extra.pagination.decorator import paginate
 from ninja_extra.permissions import IsAdminUser
 from ninja_extra.schemas.response import PaginatedResponseSchema
 
+from src.booking.models import Seance
 from src.core.errors import InvalidTokenExceptionError
 from src.core.errors import NotFoundExceptionError
 from src.core.errors import NotUniqueFieldExceptionError
 from src.core.errors import UnprocessableEntityExceptionError
+from src.core.models import Gallery
 from src.core.models import Image
+from src.core.pagination import CursorPaginatedResponseSchema
+from src.core.pagination import CursorPagination
 from src.core.schemas.base import LangEnum
 from src.core.schemas.base import MessageOutSchema
 from src.core.schemas.base import errors_to_docs
 from src.core.utils import CustomJWTAuth
+from src.core.utils import cache_response
+from src.core.utils import versioned_response
 from src.movies.models import Movie
 from src.movies.models import MovieParticipant
+from src.movies.models import MovieParticipantPerson
+from src.movies.models import MovieParticipantRole
 from src.movies.models import Tech
 from src.movies.schemas import MovieCardOutSchema
 from src.movies.schemas import MovieClientOutSchema
@@ -259,6 +268,42 @@ class MovieController(ControllerBase):
         result = self.movie_service.get_all(release=release.value)
         return result
 
+    @http_get(
+        "/all-cards/cursor/",
+        response=CursorPaginatedResponseSchema[MovieCardOutSchema],
+        openapi_extra={
+            "operationId": "get_all_movie_cards_by_cursor",
+            "responses": errors_to_docs(
+                {
+                    422: [UnprocessableEntityExceptionError()],
+                }
+            ),
+        },
+    )
+    @paginate(CursorPagination)
+    def get_all_movie_cards_by_cursor(
+        self,
+        request: HttpRequest,
+        release: ReleaseEnum = ReleaseEnum.Current,
+        accept_lang: LangEnum = Header(alias="Accept-Language", default="uk"),
+    ) -> QuerySet:
+        """Get all movie cards by pages of cursor pagination.
+
+        Please provide:
+         - **cursor**  cursor of page from next or previous link
+         - **page_size**  length of records per page
+         - **count**  return estimated count of records
+
+        Returns
+        -------
+          - **200**: Success response with the data.
+          - **422**: Error: Unprocessable Entity.
+          - **500**: Internal server error if an unexpected error occurs.
+
+        """
+        result = self.movie_service.get_all(release=release.value)
+        return result
+
     @http_post(
         "/",
         response=MessageOutSchema,
@@ -513,6 +558,7 @@ class MovieClientController(ControllerBase):
             ),
         },
     )
+    @cache_response(Movie)
     @paginate()
     def get_movie_schedule_filter(
         self,
@@ -546,6 +592,7 @@ class MovieClientController(ControllerBase):
             ),
         },
     )
+    @cache_response(Movie, Image)
     @paginate()
     def search_movies(
         self,
@@ -576,6 +623,7 @@ class MovieClientController(ControllerBase):
             ),
         },
     )
+    @cache_response(Movie, Seance, Tech, Image)
     @paginate()
     def get_movie_today_cards(
         self,
@@ -608,12 +656,22 @@ class MovieClientController(ControllerBase):
             ),
         },
     )
+    @versioned_response(Movie, "mv_slug")
+    @cache_response(
+        Movie,
+        Tech,
+        MovieParticipant,
+        MovieParticipantPerson,
+        MovieParticipantRole,
+        Image,
+        Gallery,
+    )
     def get_movie_by_slug(
         self,
         request: HttpRequest,
         mv_slug: str,
         accept_lang: LangEnum = Header(alias="Accept-Language", default="uk"),
-    ) -> Movie:
+    ) -> Response:
         """Get movie by slug.
 
         Please provide:
@@ -629,5 +687,7 @@ class MovieClientController(ControllerBase):
           - **500**: Internal server error if an unexpected error occurs.
 
         """
-        result = self.movie_service.get_by_slug(mv_slug=mv_slug)
-        return result
+        result = self.movie_service.get_details(
+            mv_slug=mv_slug, lang=accept_lang.value
+        )
+        return Response(result)
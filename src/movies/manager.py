@@ -2,10 +2,15 @@
 
 from typing import TYPE_CHECKING
 
+from django.conf import settings
+from django.contrib.postgres.search import TrigramWordSimilarity
 from django.db import models
+from django.db.models import Prefetch
 from django.db.models import Q
 from django.db.models import QuerySet
+from django.db.models.functions import Greatest
 from django.utils import timezone
+from django.utils import translation
 from django.utils.translation import gettext as _
 
 from src.booking.models import Seance
@@ -21,6 +26,10 @@ class MovieManager(models.Manager):
     here is redefined some methods for managing movies in system
     """
 
+    def get_queryset(self) -> QuerySet["Movie"]:
+        """Document of movie page is read only by get_details."""
+        return super().get_queryset().defer("details")
+
     def get_by_slug(self, mv_slug: str) -> "Movie":
         """Get movie with the given slug.
         :param mv_slug: slug of movie
@@ -29,34 +38,101 @@ class MovieManager(models.Manager):
         try:
             movie = (
                 self.model.objects.select_related("card_img", "seo_image", "gallery")
-                .prefetch_related("participants__role")
-                .prefetch_related("techs")
-                .prefetch_related("participants__person")
+                .prefetch_related("techs", "participants")
                 .get(slug=mv_slug)
             )
         except self.model.DoesNotExist:
             msg = _("Не знайдено: немає збігів фільмів " "на заданному запиті.")
             raise NotFoundExceptionError(message=msg, cls_model=self.model)
-        from src.movies.models import MovieParticipantRole
-
-        mv_roles = MovieParticipantRole.objects.filter(
-            movieparticipant__movie=movie
-        ).distinct()
-        for mv_role in mv_roles:
-            persons_list = []
-            for participant in movie.participants.all():
-                if participant.role == mv_role:
-                    persons_list.append(participant.person.fullname)
-            mv_role.persons = persons_list
-        movie.mv_roles = mv_roles
         return movie
 
+    def get_details(self, mv_slug: str, lang: str) -> dict:
+        """Get precomputed document of movie page in given language.
+        Document is rebuilt if it was made for older version of movie.
+        :param mv_slug: slug of movie
+        :param lang: language of document
+        :return: data of MovieClientOutSchema
+        """
+        row = self.filter(slug=mv_slug).values("id", "version", "details").first()
+        if row is None:
+            msg = _("Не знайдено: немає збігів фільмів " "на заданному запиті.")
+            raise NotFoundExceptionError(message=msg, cls_model=self.model)
+        details = row["details"]
+        if details.get("version") != row["version"] or lang not in details:
+            details = self.build_details(movie_id=row["id"])
+        return details[lang]
+
+    def build_details(self, movie_id: int) -> dict:
+        """Render movie page by MovieClientOutSchema for every language
+        and save it as document of movie. Document isn't saved
+        if movie was changed while rendering.
+        :param movie_id: id of movie
+        :return: document with version of movie and data by languages
+        """
+        from src.movies.models import MovieParticipant
+        from src.movies.schemas import MovieClientOutSchema
+
+        participants = MovieParticipant.objects.select_related("person", "role")
+        movie = (
+            self.model.objects.select_related("card_img", "seo_image")
+            .prefetch_related("techs", Prefetch("participants", participants))
+            .get(id=movie_id)
+        )
+        roles = {}
+        for participant in movie.participants.all():
+            if participant.role is not None:
+                roles.setdefault(participant.role, []).append(participant.person)
+        movie.mv_roles = sorted(roles, key=lambda role: role.id)
+        details = {"version": movie.version}
+        for lang in settings.MODELTRANSLATION_LANGUAGES:
+            with translation.override(lang):
+                for role in movie.mv_roles:
+                    role.persons = [person.fullname for person in roles[role]]
+                schema = MovieClientOutSchema.from_orm(movie)
+                details[lang] = schema.model_dump()
+        self.filter(id=movie.id, version=movie.version).update(details=details)
+        return details
+
     def get_by_search_line(self, search_line: str) -> QuerySet["Movie"]:
-        """Get movie with the given search line.
+        """Get movies with names or participants similar to the given
+        search line, the most similar names go first. Trigram indexes
+        are used, so unfinished words and typos are found too.
+        Movies by names and by participants are found by separate
+        queries joined by UNION, otherwise OR with subquery of participants
+        doesn't let postgres combine trigram indexes of names
         :param search_line: string for searching
         """
-        movies = self.model.objects.select_related("card_img").filter(
-            Q(name_ru__icontains=search_line) | Q(name_uk__icontains=search_line)
+        from src.movies.models import MovieParticipantPerson
+
+        search_line = search_line.strip()
+        movies = self.model.objects.select_related("card_img")
+        if not search_line:
+            return movies
+        by_name = self.model.objects.filter(
+            Q(name_uk__trigram_word_similar=search_line)
+            | Q(name_ru__trigram_word_similar=search_line)
+        )
+        persons = MovieParticipantPerson.objects.filter(
+            Q(fullname_uk__trigram_word_similar=search_line)
+            | Q(fullname_ru__trigram_word_similar=search_line)
+        )
+        by_participant = self.model.participants.through.objects.filter(
+            movieparticipant__person__in=persons
+        )
+        movie_ids = (
+            by_name.values("id")
+            .order_by()
+            .union(by_participant.values("movie_id").order_by())
+        )
+        movies = (
+            movies.filter(id__in=movie_ids)
+            .annotate(
+                rank=Greatest(
+                    TrigramWordSimilarity(search_line, "name_uk"),
+                    TrigramWordSimilarity(search_line, "name_ru"),
+                )
+            )
+            .order_by("-rank", "-date_created")
         )
         return movies
 
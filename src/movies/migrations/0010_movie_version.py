@@ -0,0 +1,18 @@
+# Generated by Django 5.0.6 on 2026-10-17 22:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0009_alter_tech_options'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='movie',
+            name='version',
+            field=models.PositiveIntegerField(default=1, editable=False),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.0.6 on 2026-10-17 23:00
+
+import django.core.serializers.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0010_movie_version'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='movie',
+            name='details',
+            field=models.JSONField(default=dict, editable=False, encoder=django.core.serializers.json.DjangoJSONEncoder),
+        ),
+    ]
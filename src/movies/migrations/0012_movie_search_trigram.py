@@ -0,0 +1,35 @@
+# Generated by Django 5.0.6 on 2026-10-17 23:01
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('core', '0003_image_content_hash'),
+        ('movies', '0011_movie_details'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        AddIndexConcurrently(
+            model_name='movie',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['name_uk'], name='movies_name_uk_trgm', opclasses=['gin_trgm_ops']),
+        ),
+        AddIndexConcurrently(
+            model_name='movie',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['name_ru'], name='movies_name_ru_trgm', opclasses=['gin_trgm_ops']),
+        ),
+        AddIndexConcurrently(
+            model_name='movieparticipantperson',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['fullname_uk'], name='persons_fullname_uk_trgm', opclasses=['gin_trgm_ops']),
+        ),
+        AddIndexConcurrently(
+            model_name='movieparticipantperson',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['fullname_ru'], name='persons_fullname_ru_trgm', opclasses=['gin_trgm_ops']),
+        ),
+    ]
@@ -1,10 +1,13 @@
 """Models for movie app"""
 
+from django.contrib.postgres.indexes import GinIndex
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
 from django.utils.translation import gettext as _
 from django_countries.fields import CountryField
 
 from src.core.models import Seo
+from src.core.models import Versioned
 from src.movies.manager import MovieManager
 from src.movies.utils import MultiSelectField
 
@@ -51,6 +54,18 @@ class MovieParticipantPerson(models.Model):
         verbose_name = "MovieParticipant"
         verbose_name_plural = "MovieParticipants"
         db_table = "movie_participant_persons"
+        indexes = [
+            GinIndex(
+                name="persons_fullname_uk_trgm",
+                fields=["fullname_uk"],
+                opclasses=["gin_trgm_ops"],
+            ),
+            GinIndex(
+                name="persons_fullname_ru_trgm",
+                fields=["fullname_ru"],
+                opclasses=["gin_trgm_ops"],
+            ),
+        ]
 
 
 class MovieParticipantRole(models.Model):
@@ -88,7 +103,7 @@ class MovieParticipant(models.Model):
         db_table = "movie_participants"
 
 
-class Movie(Seo):
+class Movie(Seo, Versioned):
     """Описание Movie
     Модель хранит все фильмы в системе и при содании фильма
     в соответсвующем сервисе, создаётся спиок сеансов
@@ -116,6 +131,9 @@ class Movie(Seo):
            галерея нужна для слайдера на страницу сущности Cinema
            в самом низу макета.
     :param slug (SlugField): это поля нужно для внешнего
+    :param details (JSONField): готовые данные страницы фильма
+           для каждого языка(MovieClientOutSchema) и версия фильма,
+           для которой они построены, перестраиваются после изменения фильма
     """
 
     slug = models.SlugField(db_index=True, unique=True, null=True)
@@ -162,6 +180,7 @@ class Movie(Seo):
     gallery = models.OneToOneField(
         "core.Gallery", on_delete=models.DO_NOTHING, null=True
     )
+    details = models.JSONField(default=dict, editable=False, encoder=DjangoJSONEncoder)
     objects = MovieManager()
 
     class Meta:
@@ -169,3 +188,15 @@ class Movie(Seo):
         verbose_name = "Movie"
         verbose_name_plural = "Movies"
         db_table = "movies"
+        indexes = [
+            GinIndex(
+                name="movies_name_uk_trgm",
+                fields=["name_uk"],
+                opclasses=["gin_trgm_ops"],
+            ),
+            GinIndex(
+                name="movies_name_ru_trgm",
+                fields=["name_ru"],
+                opclasses=["gin_trgm_ops"],
+            ),
+        ]
@@ -12,12 +12,13 @@ from ninja import ModelSchema
 from pydantic import field_validator
 from pydantic.fields import Field
 
-from src.core.errors import NotFoundExceptionError
 from src.core.errors import UnprocessableEntityExceptionError
 from src.core.schemas.gallery import GalleryItemSchema
+from src.core.schemas.images import ImageCardOutSchema
 from src.core.schemas.images import ImageInSchema
 from src.core.schemas.images import ImageOutSchema
 from src.core.schemas.images import ImageUpdateSchema
+from src.core.services.core import CoreService
 from src.movies.models import Movie
 from src.movies.models import MovieParticipant
 from src.movies.models import MovieParticipantRole
@@ -132,32 +133,21 @@ class MovieInSchema(ninja_schema.ModelSchema):
 
     @ninja_schema.model_validator("participants")
     def clean_participants(cls, participant_ids: list[int]) -> list[int]:
-        participants_db = list(
-            MovieParticipant.objects.filter(id__in=participant_ids).values_list(
-                "id", flat=True
-            )
+        msg = _("У заданому переліку участників є " "ids {diff} які не присутні у базі")
+        CoreService.check_ids_exist(
+            ids=participant_ids,
+            queryset=MovieParticipant.objects.all(),
+            message=msg,
+            field="participants",
         )
-        if len(participant_ids) != len(participants_db):
-            diff = list(set(participant_ids) ^ set(participants_db))
-            msg = _(
-                "У заданому переліку участників є " "ids {diff} які не присутні у базі"
-            ).format(diff=diff)
-            raise NotFoundExceptionError(
-                message=msg, cls_model=MovieParticipant, field="participants"
-            )
         return participant_ids
 
     @ninja_schema.model_validator("techs")
     def clean_techs(cls, tech_ids: list[int]) -> list[int]:
-        techs_db = list(
-            Tech.objects.filter(id__in=tech_ids).values_list("id", flat=True)
+        msg = _("У заданому переліку технологій є " "ids {diff} які не присутні у базі")
+        CoreService.check_ids_exist(
+            ids=tech_ids, queryset=Tech.objects.all(), message=msg, field="techs"
         )
-        if len(tech_ids) != len(techs_db):
-            diff = list(set(tech_ids) ^ set(techs_db))
-            msg = _(
-                "У заданому переліку технологій є " "ids {diff} які не присутні у базі"
-            ).format(diff=diff)
-            raise NotFoundExceptionError(message=msg, cls_model=Tech, field="techs")
         return tech_ids
 
     class Config:
@@ -191,7 +181,7 @@ class MovieInSchema(ninja_schema.ModelSchema):
 class MovieCardOutSchema(ModelSchema):
     """Pydantic schema for showing Movie card."""
 
-    card_img: ImageOutSchema
+    card_img: ImageCardOutSchema
     techs: list[TechOutSchema]
     released: str
 
@@ -413,19 +403,13 @@ class MovieUpdateSchema(ninja_schema.ModelSchema):
 
     @ninja_schema.model_validator("participants")
     def clean_participants(cls, participant_ids: list[int]) -> list[int]:
-        participants_db = list(
-            MovieParticipant.objects.filter(id__in=participant_ids).values_list(
-                "id", flat=True
-            )
+        msg = _("У заданому переліку участників є " "ids {diff} які не присутні у базі")
+        CoreService.check_ids_exist(
+            ids=participant_ids,
+            queryset=MovieParticipant.objects.all(),
+            message=msg,
+            field="participants",
         )
-        if len(participant_ids) != len(participants_db):
-            diff = list(set(participant_ids) ^ set(participants_db))
-            msg = _(
-                "У заданому переліку участників є " "ids {diff} які не присутні у базі"
-            ).format(diff=diff)
-            raise NotFoundExceptionError(
-                message=msg, cls_model=MovieParticipant, field="participants"
-            )
         return participant_ids
 
     class Config:
@@ -12,7 +12,7 @@ from src.core.schemas.base import MessageOutSchema
 from src.core.services.core import CoreService
 from src.core.services.gallery import GalleryService
 from src.core.services.images import ImageService
-from src.core.utils import make_slug
+from src.core.services.slug import SlugService
 from src.movies.models import Movie
 from src.movies.models import MovieParticipant
 from src.movies.models import MovieParticipantRole
@@ -30,10 +30,12 @@ class MovieService:
         image_service: ImageService,
         core_service: CoreService,
         gall_service: GalleryService,
+        slug_service: SlugService,
     ):
         self.core_service = core_service
         self.image_service = image_service
         self.gall_service = gall_service
+        self.slug_service = slug_service
 
     def create(self, request: HttpRequest, schema: MovieInSchema) -> MessageOutSchema:
         """Create Movie."""
@@ -43,13 +45,14 @@ class MovieService:
         self.core_service.check_field_unique(
             value=schema.name_ru, field_name="name_ru", model=Movie
         )
-        bodies = [schema.card_img, schema.seo_image]
-        card_img, seo_image = self.image_service.bulk_create(schemas=bodies)
-        gallery = self.gall_service.create(images=schema.gallery)
-        movie = Movie.objects.create(
+        bodies = [schema.card_img, schema.seo_image, *(schema.gallery or [])]
+        card_img, seo_image, *gallery_images = self.image_service.bulk_create(
+            schemas=bodies
+        )
+        gallery = self.gall_service.create(images=gallery_images)
+        movie = Movie(
             name_uk=schema.name_uk,
             name_ru=schema.name_ru,
-            slug=make_slug(value=schema.name_uk, model=Movie),
             description_uk=schema.description_uk,
             description_ru=schema.description_ru,
             gallery=gallery,
@@ -66,6 +69,7 @@ class MovieService:
             seo_description=schema.seo_description,
             seo_image=seo_image,
         )
+        self.slug_service.save(instance=movie, value=movie.name_uk)
         if schema.participants is not None:
             movie.participants.set(schema.participants)
         if schema.techs is not None:
@@ -85,10 +89,10 @@ class MovieService:
         self.core_service.check_field_unique(
             value=schema.name_ru, field_name="name_ru", instance=movie, model=Movie
         )
+        self.image_service.check_updates([schema.card_img, schema.seo_image])
+        self.gall_service.update(schemas=schema.gallery, gallery=movie.gallery)
         self.image_service.update(schema.card_img, movie.card_img)
         self.image_service.update(schema.seo_image, movie.seo_image)
-
-        self.gall_service.update(schemas=schema.gallery, gallery=movie.gallery)
         expt_list = ["card_img", "seo_image", "gallery", "participants"]
         for attr, value in schema.dict().items():
             if attr not in expt_list and value is not None:
@@ -97,8 +101,7 @@ class MovieService:
         if schema.participants is not None:
             movie.participants.set(schema.participants)
 
-        movie.slug = make_slug(value=movie.name_uk, model=Movie, instance=movie)
-        movie.save()
+        self.slug_service.save(instance=movie, value=movie.name_uk)
         return MessageOutSchema(detail=_("Фільм успішно оновлений"))
 
     @staticmethod
@@ -107,6 +110,12 @@ class MovieService:
         movie = Movie.objects.get_by_slug(mv_slug=mv_slug)
         return movie
 
+    @staticmethod
+    def get_details(mv_slug: str, lang: str) -> dict:
+        """Get precomputed data of movie page."""
+        details = Movie.objects.get_details(mv_slug=mv_slug, lang=lang)
+        return details
+
     @staticmethod
     def search(search_line: str) -> QuerySet[Movie]:
         """Get movies queryset by search_line."""
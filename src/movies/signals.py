@@ -0,0 +1,71 @@
+"""Receivers of signals for movie app"""
+
+from django.db import transaction
+from django.db.models.signals import m2m_changed
+from django.db.models.signals import post_save
+from django.db.models.signals import pre_delete
+from django.dispatch import receiver
+
+from src.movies.models import Movie
+from src.movies.models import MovieParticipant
+from src.movies.models import MovieParticipantPerson
+from src.movies.models import MovieParticipantRole
+from src.movies.models import Tech
+from src.movies.tasks import build_movie_details
+
+MOVIE_LOOKUPS = {
+    Tech: "techs",
+    MovieParticipant: "participants",
+    MovieParticipantPerson: "participants__person",
+    MovieParticipantRole: "participants__role",
+}
+
+
+def schedule_details(movie_ids: list[int]) -> None:
+    """Start rebuilding of movie documents after commit.
+    :param movie_ids: ids of changed movies
+    """
+    if movie_ids:
+        transaction.on_commit(lambda: build_movie_details.delay(movie_ids=movie_ids))
+
+
+@receiver(post_save, sender=Movie)
+def movie_saved(sender, instance: Movie, raw: bool = False, **kwargs) -> None:
+    """Rebuild document of saved movie."""
+    if not raw:
+        schedule_details([instance.id])
+
+
+@receiver(post_save, sender=Tech)
+@receiver(post_save, sender=MovieParticipant)
+@receiver(post_save, sender=MovieParticipantPerson)
+@receiver(post_save, sender=MovieParticipantRole)
+@receiver(pre_delete, sender=Tech)
+@receiver(pre_delete, sender=MovieParticipant)
+@receiver(pre_delete, sender=MovieParticipantPerson)
+@receiver(pre_delete, sender=MovieParticipantRole)
+def movie_relation_saved(sender, instance, raw: bool = False, **kwargs) -> None:
+    """Increase versions of movies which show changed tech
+    or participant and rebuild their documents.
+    """
+    if raw:
+        return
+    lookup = {MOVIE_LOOKUPS[sender]: instance}
+    movie_ids = list(Movie.objects.filter(**lookup).values_list("id", flat=True))
+    Movie.touch(id__in=movie_ids)
+    schedule_details(movie_ids)
+
+
+@receiver(m2m_changed, sender=Movie.techs.through)
+@receiver(m2m_changed, sender=Movie.participants.through)
+def movie_relations_changed(
+    sender, instance, action: str, reverse: bool, pk_set: set | None, **kwargs
+) -> None:
+    """Increase versions of movies whose techs or participants
+    were changed and rebuild their documents.
+    """
+    if not action.startswith("post_"):
+        return
+    movie_ids = list(pk_set or []) if reverse else [instance.id]
+    Movie.touch(id__in=movie_ids)
+    schedule_details(movie_ids)
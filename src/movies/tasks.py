@@ -0,0 +1,17 @@
+"""Celery tasks for movies"""
+
+from celery.app import shared_task
+
+from src.movies.models import Movie
+
+
+@shared_task()
+def build_movie_details(movie_ids: list[int]) -> int:
+    """Rebuild documents of movie pages after changes of movies.
+    :param movie_ids: ids of changed movies
+    :return: count of rebuilt documents
+    """
+    movie_ids = Movie.objects.filter(id__in=movie_ids).values_list("id", flat=True)
+    for movie_id in movie_ids:
+        Movie.objects.build_details(movie_id=movie_id)
+    return len(movie_ids)
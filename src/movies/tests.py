@@ -1,10 +1,16 @@
 """Test cases for movie app"""
 
+from datetime import date
+from datetime import timedelta
+from urllib.parse import urlsplit
+
 import pytest
 from ninja_extra.testing import TestClient
 
 from ..core.management.commands.init_script import Command
+from ..core.models import Image
 from .endpoints import MovieController
+from .models import Movie
 
 
 @pytest.mark.django_db()
@@ -378,6 +384,62 @@ class TestCinemaAdminController:
         response = self.client.get("/all-cards/", headers=self.headers)
         assert response.status_code == 200
 
+    def test_get_all_movie_cards_by_cursor(self):
+        images = Image.objects.bulk_create(
+            [Image(alt="string", image=f"Image/cursor-{i}.jpg") for i in range(5)]
+        )
+        movies = Movie.objects.bulk_create(
+            [
+                Movie(
+                    name=f"Курсор-{i}",
+                    name_uk=f"Курсор-{i}",
+                    name_ru=f"Курсор-{i}",
+                    slug=f"cursor-{i}",
+                    description="string",
+                    description_uk="string",
+                    description_ru="string",
+                    seo_title="string",
+                    seo_description="string" * 10,
+                    trailer_link="https://example.com/",
+                    year=2010,
+                    budget=700000,
+                    duration=timedelta(minutes=90),
+                    released=date.today(),
+                    card_img=image,
+                )
+                for i, image in enumerate(images)
+            ]
+        )
+        newest = [movie.slug for movie in reversed(movies)]
+
+        url = "/all-cards/cursor/?page_size=2"
+        response = self.client.get(url, headers=self.headers)
+        assert response.status_code == 200
+        first = response.json()
+        assert first["previous"] is None
+        response = self.client.get(
+            f"{url}&{urlsplit(first['next']).query}", headers=self.headers
+        )
+        assert response.status_code == 200
+        second = response.json()
+        first_slugs = [card["slug"] for card in first["results"]]
+        second_slugs = [card["slug"] for card in second["results"]]
+        assert first_slugs + second_slugs == newest[:4]
+
+        response = self.client.get(
+            f"{url}&{urlsplit(second['previous']).query}", headers=self.headers
+        )
+        assert response.status_code == 200
+        previous = response.json()
+        assert [card["slug"] for card in previous["results"]] == first_slugs
+        assert previous["previous"] is None
+
+    def test_get_all_movie_cards_by_invalid_cursor(self):
+        response = self.client.get(
+            "/all-cards/cursor/?cursor=invalid", headers=self.headers
+        )
+        assert response.status_code == 422
+
     def test_get_all_movie_techs(self):
         response = self.client.get("/techs/", headers=self.headers)
         assert response.status_code == 200
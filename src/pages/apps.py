@@ -8,3 +8,7 @@ class PagesConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "src.pages"
+
+    def ready(self) -> None:
+        """Connect receivers of signals"""
+        import src.pages.signals  # noqa: F401
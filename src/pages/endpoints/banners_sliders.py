@@ -13,10 +13,12 @@ from ninja_extra.schemas.response import PaginatedResponseSchema
 from src.core.errors import InvalidTokenExceptionError
 from src.core.errors import NotFoundExceptionError
 from src.core.errors import UnprocessableEntityExceptionError
+from src.core.models import Image
 from src.core.schemas.base import LangEnum
 from src.core.schemas.base import MessageOutSchema
 from src.core.schemas.base import errors_to_docs
 from src.core.utils import CustomJWTAuth
+from src.core.utils import cache_response
 from src.pages.models import BottomSlider
 from src.pages.models import BottomSliderItem
 from src.pages.models import ETEndBBanner
@@ -359,6 +361,7 @@ class SliderClientController(ControllerBase):
             ),
         },
     )
+    @cache_response(TopSlider, TopSliderItem, Image)
     def get_top_slider(
             self,
             request: HttpRequest,
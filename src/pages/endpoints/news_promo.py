@@ -17,11 +17,14 @@ from src.core.errors import InvalidTokenExceptionError
 from src.core.errors import NotFoundExceptionError
 from src.core.errors import NotUniqueFieldExceptionError
 from src.core.errors import UnprocessableEntityExceptionError
+from src.core.models import Gallery
 from src.core.models import Image
 from src.core.schemas.base import LangEnum
 from src.core.schemas.base import MessageOutSchema
 from src.core.schemas.base import errors_to_docs
 from src.core.utils import CustomJWTAuth
+from src.core.utils import cache_response
+from src.core.utils import versioned_response
 from src.pages.models import NewsPromo
 from src.pages.models import Tag
 from src.pages.schemas.news_promo import NewsPromoCardClientOutSchema
@@ -371,6 +374,7 @@ class NewsPromoClientController(ControllerBase):
             ),
         },
     )
+    @cache_response(NewsPromo, Image)
     @paginate()
     def get_all_news_promo_cards(
         self,
@@ -402,6 +406,8 @@ class NewsPromoClientController(ControllerBase):
             ),
         },
     )
+    @versioned_response(NewsPromo, "np_slug")
+    @cache_response(NewsPromo, Tag, Image, Gallery)
     def get_news_promo_by_slug(
         self,
         request: HttpRequest,
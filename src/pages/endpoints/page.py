@@ -17,11 +17,14 @@ from src.core.errors import InvalidTokenExceptionError
 from src.core.errors import NotFoundExceptionError
 from src.core.errors import NotUniqueFieldExceptionError
 from src.core.errors import UnprocessableEntityExceptionError
+from src.core.models import Gallery
 from src.core.models import Image
 from src.core.schemas.base import LangEnum
 from src.core.schemas.base import MessageOutSchema
 from src.core.schemas.base import errors_to_docs
 from src.core.utils import CustomJWTAuth
+from src.core.utils import cache_response
+from src.core.utils import versioned_response
 from src.pages.errors import PageUnableToDeleteExceptionError
 from src.pages.models import Page
 from src.pages.schemas.page import PageCardClientOutSchema
@@ -327,6 +330,7 @@ class PageClientController(ControllerBase):
             ),
         },
     )
+    @cache_response(Page, Image)
     @paginate()
     def get_all_page_cards(
         self,
@@ -357,6 +361,8 @@ class PageClientController(ControllerBase):
             ),
         },
     )
+    @versioned_response(Page, "pg_slug")
+    @cache_response(Page, Image, Gallery)
     def get_page_by_slug(
         self,
         request: HttpRequest,
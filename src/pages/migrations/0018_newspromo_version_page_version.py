@@ -0,0 +1,23 @@
+# Generated by Django 5.0.6 on 2026-10-17 22:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pages', '0017_alter_bottomslideritem_options_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='newspromo',
+            name='version',
+            field=models.PositiveIntegerField(default=1, editable=False),
+        ),
+        migrations.AddField(
+            model_name='page',
+            name='version',
+            field=models.PositiveIntegerField(default=1, editable=False),
+        ),
+    ]
@@ -3,13 +3,14 @@
 from django.db import models
 
 from src.core.models import Seo
+from src.core.models import Versioned
 from src.pages.managers.bottom_slider_item import BottomSliderItemManager
 from src.pages.managers.news_promo import NewsPromoManager
 from src.pages.managers.page import PageManager
 from src.pages.managers.top_slider_item import TopSliderItemManager
 
 
-class Page(Seo):
+class Page(Seo, Versioned):
     """Описание Page
     Модель хранит все шаблонные страницы для сайта,
     часть из которых встроенные и неудаляемые благодаря полю can_delete
@@ -70,7 +71,7 @@ class Tag(models.Model):
         db_table = "tags"
 
 
-class NewsPromo(Seo):
+class NewsPromo(Seo, Versioned):
     """Описание NewsPromo
     Модель хранит новости и акции сайта
     :param slug (SlugField): это поля нужно для внешнего
@@ -6,7 +6,7 @@ from matplotlib.colors import is_color_like
 from ninja import ModelSchema
 
 from src.core.errors import UnprocessableEntityExceptionError
-from src.core.schemas.images import ImageOutSchema
+from src.core.schemas.images import ImageCardOutSchema
 from src.core.schemas.images import ImageUpdateSchema
 from src.pages.models import BottomSlider
 from src.pages.models import BottomSliderItem
@@ -90,7 +90,7 @@ class BottomSliderUpdateSchema(ninja_schema.ModelSchema):
 class TopSliderItemOutSchema(ModelSchema):
     """Pydantic schema for getting Top slider items."""
 
-    image: ImageOutSchema
+    image: ImageCardOutSchema
 
     class Meta:
         model = TopSliderItem
@@ -106,7 +106,7 @@ class TopSliderItemOutSchema(ModelSchema):
 class TopSliderItemClientOutSchema(ModelSchema):
     """Pydantic schema for getting Top slider items."""
 
-    image: ImageOutSchema
+    image: ImageCardOutSchema
 
     class Meta:
         model = TopSliderItem
@@ -147,7 +147,7 @@ class TopSliderOutSchema(ModelSchema):
 class BottomSliderItemOutSchema(ModelSchema):
     """Pydantic schema for getting Bottom slider items."""
 
-    image: ImageOutSchema
+    image: ImageCardOutSchema
 
     class Meta:
         model = BottomSliderItem
@@ -197,7 +197,7 @@ class ETEndBBannerUpdateSchema(ninja_schema.ModelSchema):
 class ETEndBBannerOutSchema(ModelSchema):
     """Pydantic schema for getting ETEndBBanner."""
 
-    image: ImageOutSchema
+    image: ImageCardOutSchema
 
     class Meta:
         model = ETEndBBanner
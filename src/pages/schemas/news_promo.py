@@ -5,12 +5,13 @@ from django.utils.translation import gettext as _
 from ninja import ModelSchema
 from pydantic.fields import Field
 
-from src.core.errors import NotFoundExceptionError
 from src.core.errors import UnprocessableEntityExceptionError
 from src.core.schemas.gallery import GalleryItemSchema
+from src.core.schemas.images import ImageCardOutSchema
 from src.core.schemas.images import ImageInSchema
 from src.core.schemas.images import ImageOutSchema
 from src.core.schemas.images import ImageUpdateSchema
+from src.core.services.core import CoreService
 from src.pages.models import NewsPromo
 from src.pages.models import Tag
 
@@ -31,13 +32,10 @@ class NewsPromoInSchema(ninja_schema.ModelSchema):
         if len(tag_ids) > 5:
             msg = _("Максимальна кількість тегів 5")
             raise UnprocessableEntityExceptionError(message=msg)
-        tags_db = list(Tag.objects.filter(id__in=tag_ids).values_list("id", flat=True))
-        if len(tag_ids) != len(tags_db):
-            diff = list(set(tag_ids) ^ set(tags_db))
-            msg = _(
-                "У заданому переліку тегів є " "ids {diff} які не присутні у базі"
-            ).format(diff=diff)
-            raise NotFoundExceptionError(message=msg, cls_model=Tag, field="tags")
+        msg = _("У заданому переліку тегів є " "ids {diff} які не присутні у базі")
+        CoreService.check_ids_exist(
+            ids=tag_ids, queryset=Tag.objects.all(), message=msg, field="tags"
+        )
         return tag_ids
 
     class Config:
@@ -72,7 +70,7 @@ class NewsPromoCardOutSchema(ModelSchema):
 class NewsPromoCardClientOutSchema(ModelSchema):
     """Pydantic schema for showing news and promo card in the client site."""
 
-    banner: ImageOutSchema
+    banner: ImageCardOutSchema
     tags: list[TagOutSchema]
 
     class Meta:
@@ -87,7 +85,7 @@ class NewsPromoCardClientOutSchema(ModelSchema):
 class NewsPromoOutSchema(ModelSchema):
     """Pydantic schema for showing news and promo full data."""
 
-    banner: ImageOutSchema
+    banner: ImageCardOutSchema
     seo_image: ImageOutSchema
 
     class Meta:
@@ -98,7 +96,7 @@ class NewsPromoOutSchema(ModelSchema):
 class NewsPromoClientOutSchema(ModelSchema):
     """Pydantic schema for showing news and promo full data."""
 
-    banner: ImageOutSchema
+    banner: ImageCardOutSchema
     seo_image: ImageOutSchema
     tags: list[TagOutSchema]
 
@@ -131,13 +129,10 @@ class NewsPromoUpdateSchema(ninja_schema.ModelSchema):
         if len(tag_ids) > 5:
             msg = _("Максимальна кількість тегів 5")
             raise UnprocessableEntityExceptionError(message=msg)
-        tags_db = list(Tag.objects.filter(id__in=tag_ids).values_list("id", flat=True))
-        if len(tag_ids) != len(tags_db):
-            diff = list(set(tag_ids) ^ set(tags_db))
-            msg = _(
-                "У заданому переліку тегів є " "ids {diff} які не присутні у базі"
-            ).format(diff=diff)
-            raise NotFoundExceptionError(message=msg, cls_model=Tag, field="tags")
+        msg = _("У заданому переліку тегів є " "ids {diff} які не присутні у базі")
+        CoreService.check_ids_exist(
+            ids=tag_ids, queryset=Tag.objects.all(), message=msg, field="tags"
+        )
         return tag_ids
 
     class Config:
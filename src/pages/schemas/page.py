@@ -8,6 +8,7 @@ from pydantic import Json
 from pydantic.fields import Field
 
 from src.core.schemas.gallery import GalleryItemSchema
+from src.core.schemas.images import ImageCardOutSchema
 from src.core.schemas.images import ImageInSchema
 from src.core.schemas.images import ImageOutSchema
 from src.core.schemas.images import ImageUpdateSchema
@@ -61,7 +62,7 @@ class PageCardClientOutSchema(ModelSchema):
 class PageOutSchema(ModelSchema):
     """Pydantic schema for showing pages full data."""
 
-    banner: ImageOutSchema
+    banner: ImageCardOutSchema
     seo_image: ImageOutSchema
 
     class Meta:
@@ -72,7 +73,7 @@ class PageOutSchema(ModelSchema):
 class PageClientOutSchema(ModelSchema):
     """Pydantic schema for showing pages full data."""
 
-    banner: ImageOutSchema
+    banner: ImageCardOutSchema
     seo_image: ImageOutSchema
 
     class Meta:
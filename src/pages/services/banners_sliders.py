@@ -7,7 +7,9 @@ from injector import inject
 from src.core.errors import NotFoundExceptionError
 from src.core.errors import UnprocessableEntityExceptionError
 from src.core.schemas.base import MessageOutSchema
+from src.core.services.core import CoreService
 from src.core.services.images import ImageService
+from src.core.utils import invalidate_responses
 from src.core.utils import primitives
 from src.pages.errors import TooMuchElementsExceptionError
 from src.pages.models import BaseSlider
@@ -25,8 +27,9 @@ class SliderService:
     """A service class for solving common task in our system."""
 
     @inject
-    def __init__(self, image_service: ImageService):
+    def __init__(self, image_service: ImageService, core_service: CoreService):
         self.image_service = image_service
+        self.core_service = core_service
 
     @staticmethod
     def get_speed_choices() -> list:
@@ -85,7 +88,9 @@ class SliderService:
         schemas: list[TopSliderItemUpdateSchema] | list[BottomSliderItemUpdateSchema],
         slider: TopSlider | BottomSlider,
     ) -> None:
-        """Update Slider."""
+        """Update Slider. Count of items and their images are checked
+        before any item is created, updated or deleted
+        """
         del_item_ids = []
         item_ids = []
         update_items_dict = {}
@@ -109,26 +114,34 @@ class SliderService:
                             )
                             raise UnprocessableEntityExceptionError(message=msg)
                     create_item_schemas.append(schema)
-            db_ids = slider.items.model.objects.values_list("id", flat=True)
-            for item_id in item_ids:
-                if item_id not in db_ids:
-                    slider_item_model_name = slider.items.model.__name__
-                    slider_model_name = slider._meta.model.__name__
-                    msg = (
-                        f"Наданий {slider_item_model_name} з id {item_id} "
-                        f"не належить до {slider_model_name}"
-                    )
-                    cls_model = slider.items.model
-                    raise NotFoundExceptionError(message=msg, cls_model=cls_model)
-            self.bulk_delete_slider_items(item_ids=del_item_ids, slider=slider)
-            self.bulk_update_slider_items(items_dict=update_items_dict, slider=slider)
-            sliders_length = slider.items.count() + len(create_item_schemas)
+            slider_item_model_name = slider.items.model.__name__
+            slider_model_name = slider._meta.model.__name__
+            msg = (
+                f"Надані {slider_item_model_name} з ids {{diff}} "
+                f"не належать до {slider_model_name}"
+            )
+            self.core_service.check_ids_exist(
+                ids=item_ids, queryset=slider.items.all(), message=msg
+            )
+            sliders_length = (
+                slider.items.count()
+                - len(set(del_item_ids))
+                + len(create_item_schemas)
+            )
             if sliders_length >= 10:
                 msg = _("Максимальна кількість елементів " "верхнього банеру, 10")
                 raise TooMuchElementsExceptionError(message=msg)
+            self.image_service.check_images(
+                [schema.image for schema in create_item_schemas]
+            )
+            self.image_service.check_updates(
+                [schema.image for schema in update_items_dict.values()]
+            )
             self.bulk_create_slider_items(
                 item_schemas=create_item_schemas, slider=slider
             )
+            self.bulk_update_slider_items(items_dict=update_items_dict, slider=slider)
+            self.bulk_delete_slider_items(item_ids=del_item_ids, slider=slider)
 
     def bulk_create_slider_items(
         self,
@@ -150,6 +163,7 @@ class SliderService:
             for img, item in zip(imgs_list, new_items, strict=False):
                 item.image = img
             slider.items.model.objects.bulk_create(new_items)
+            invalidate_responses(slider.items.model)
 
     def bulk_update_slider_items(
         self, items_dict: dict, slider: TopSlider | BottomSlider
@@ -172,6 +186,7 @@ class SliderService:
             fields.remove("id")
             fields.remove("delete")
             slider.items.model.objects.bulk_update(slider_items, fields)
+            invalidate_responses(slider.items.model)
 
     def bulk_delete_slider_items(
         self, item_ids: list[int], slider: TopSlider | BottomSlider
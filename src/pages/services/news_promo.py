@@ -10,7 +10,7 @@ from src.core.schemas.base import MessageOutSchema
 from src.core.services.core import CoreService
 from src.core.services.gallery import GalleryService
 from src.core.services.images import ImageService
-from src.core.utils import make_slug
+from src.core.services.slug import SlugService
 from src.pages.models import NewsPromo
 from src.pages.models import Tag
 from src.pages.schemas.news_promo import NewsPromoInSchema
@@ -26,10 +26,12 @@ class NewsPromoService:
         image_service: ImageService,
         core_service: CoreService,
         gallery_service: GalleryService,
+        slug_service: SlugService,
     ):
         self.image_service = image_service
         self.gallery_service = gallery_service
         self.core_service = core_service
+        self.slug_service = slug_service
 
     def create(
         self, request: HttpRequest, schema: NewsPromoInSchema
@@ -41,14 +43,15 @@ class NewsPromoService:
         self.core_service.check_field_unique(
             value=schema.name_ru, field_name="name_ru", model=NewsPromo
         )
-        bodies = [schema.banner, schema.seo_image]
-        banner, seo_image = self.image_service.bulk_create(schemas=bodies)
-        gallery = self.gallery_service.create(images=schema.gallery)
+        bodies = [schema.banner, schema.seo_image, *(schema.gallery or [])]
+        banner, seo_image, *gallery_images = self.image_service.bulk_create(
+            schemas=bodies
+        )
+        gallery = self.gallery_service.create(images=gallery_images)
 
-        news_promo = NewsPromo.objects.create(
+        news_promo = NewsPromo(
             name_uk=schema.name_uk,
             name_ru=schema.name_ru,
-            slug=make_slug(value=schema.name_uk, model=NewsPromo),
             description_uk=schema.description_uk,
             description_ru=schema.description_ru,
             banner=banner,
@@ -60,9 +63,9 @@ class NewsPromoService:
             seo_description=schema.seo_description,
             seo_image=seo_image,
         )
+        self.slug_service.save(instance=news_promo, value=news_promo.name_uk)
         if schema.tags is not None:
             news_promo.tags.set(schema.tags)
-        news_promo.save()
         if news_promo.promo:
             return MessageOutSchema(detail=_("Акція успішно створена"))
         return MessageOutSchema(detail=_("Новина успішно створена"))
@@ -84,21 +87,17 @@ class NewsPromoService:
             field_name="name_ru",
             model=NewsPromo,
         )
+        self.image_service.check_updates([schema.banner, schema.seo_image])
+        self.gallery_service.update(schemas=schema.gallery, gallery=news_promo.gallery)
         self.image_service.update(schema.banner, news_promo.banner)
         self.image_service.update(schema.seo_image, news_promo.seo_image)
-
-        self.gallery_service.update(schemas=schema.gallery, gallery=news_promo.gallery)
         expt_list = ["banner", "seo_image", "gallery", "tags"]
         for attr, value in schema.dict().items():
             if attr not in expt_list and value is not None:
                 setattr(news_promo, attr, value)
-        news_promo.slug = make_slug(
-            value=news_promo.name_uk, model=NewsPromo, instance=news_promo
-        )
         if schema.tags is not None:
             news_promo.tags.set(schema.tags)
-
-        news_promo.save()
+        self.slug_service.save(instance=news_promo, value=news_promo.name_uk)
         if news_promo.promo:
             return MessageOutSchema(detail=_("Акція успішно оновлена"))
         return MessageOutSchema(detail=_("Новина успішно оновлена"))
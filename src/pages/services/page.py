@@ -10,7 +10,7 @@ from src.core.schemas.base import MessageOutSchema
 from src.core.services.core import CoreService
 from src.core.services.gallery import GalleryService
 from src.core.services.images import ImageService
-from src.core.utils import make_slug
+from src.core.services.slug import SlugService
 from src.pages.errors import PageUnableToDeleteExceptionError
 from src.pages.models import Page
 from src.pages.schemas.page import PageInSchema
@@ -26,16 +26,19 @@ class PageService:
         image_service: ImageService,
         core_service: CoreService,
         gallery_service: GalleryService,
+        slug_service: SlugService,
     ):
         """Method helps to inject external services and
         init reusable variables for endpoints
         :param image_service: manage images
         :param core_service: manage common things
         :param gallery_service: manage gallery
+        :param slug_service: manage unique slugs
         """
         self.image_service = image_service
         self.gallery_service = gallery_service
         self.core_service = core_service
+        self.slug_service = slug_service
 
     def create(self, request: HttpRequest, schema: PageInSchema) -> MessageOutSchema:
         """Create page."""
@@ -45,14 +48,15 @@ class PageService:
         self.core_service.check_field_unique(
             value=schema.name_ru, field_name="name_ru", model=Page
         )
-        bodies = [schema.banner, schema.seo_image]
-        banner, seo_image = self.image_service.bulk_create(schemas=bodies)
-        gallery = self.gallery_service.create(images=schema.gallery)
+        bodies = [schema.banner, schema.seo_image, *(schema.gallery or [])]
+        banner, seo_image, *gallery_images = self.image_service.bulk_create(
+            schemas=bodies
+        )
+        gallery = self.gallery_service.create(images=gallery_images)
 
-        Page.objects.create(
+        page = Page(
             name_uk=schema.name_uk,
             name_ru=schema.name_ru,
-            slug=make_slug(value=schema.name_uk, model=Page),
             content_uk=schema.content_uk,
             content_ru=schema.content_ru,
             banner=banner,
@@ -62,6 +66,7 @@ class PageService:
             seo_description=schema.seo_description,
             seo_image=seo_image,
         )
+        self.slug_service.save(instance=page, value=page.name_uk)
         return MessageOutSchema(detail=_("Сторінка успішно створена"))
 
     def update(
@@ -75,16 +80,15 @@ class PageService:
         self.core_service.check_field_unique(
             value=schema.name_ru, field_name="name_ru", instance=page, model=Page
         )
+        self.image_service.check_updates([schema.banner, schema.seo_image])
+        self.gallery_service.update(schemas=schema.gallery, gallery=page.gallery)
         self.image_service.update(schema.banner, page.banner)
         self.image_service.update(schema.seo_image, page.seo_image)
-
-        self.gallery_service.update(schemas=schema.gallery, gallery=page.gallery)
         expt_list = ["banner", "seo_image", "gallery"]
         for attr, value in schema.dict().items():
             if attr not in expt_list and value is not None:
                 setattr(page, attr, value)
-        page.slug = make_slug(value=page.name_uk, model=Page, instance=page)
-        page.save()
+        self.slug_service.save(instance=page, value=page.name_uk)
         return MessageOutSchema(detail=_("Сторінка успішно оновлена"))
 
     @staticmethod
@@ -0,0 +1,16 @@
+"""Receivers of signals for pages app"""
+
+from django.db.models.signals import post_save
+from django.db.models.signals import pre_delete
+from django.dispatch import receiver
+
+from src.pages.models import NewsPromo
+from src.pages.models import Tag
+
+
+@receiver(post_save, sender=Tag)
+@receiver(pre_delete, sender=Tag)
+def tag_saved(sender, instance: Tag, raw: bool = False, **kwargs) -> None:
+    """Increase versions of news and promos which show changed tag."""
+    if not raw:
+        NewsPromo.touch(tags=instance)
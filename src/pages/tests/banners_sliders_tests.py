@@ -106,6 +106,32 @@ class TestBannersSlidersController:
         after = TopSliderItem.objects.count()
         assert after == before - 1
 
+    def test_update_top_slider_with_broken_image(self):
+        item_ids = list(TopSliderItem.objects.values_list("id", flat=True))
+        response = self.client.patch(
+            "/top/",
+            json={
+                "items": [
+                    {"id": random.choice(item_ids), "delete": True},
+                    {
+                        "image": {
+                            "alt": "string",
+                            "image": "broken",
+                            "filename": "string.jpg",
+                        },
+                        "url": "https://www.youtube.com/",
+                        "text_uk": "new text",
+                        "text_ru": "new text",
+                        "delete": False,
+                    },
+                ]
+            },
+            headers=self.headers,
+        )
+
+        assert response.status_code == 422
+        assert TopSliderItem.objects.count() == len(item_ids)
+
     def test_create_bottom_slider_item(self):
         before = BottomSliderItem.objects.count()
         # test create
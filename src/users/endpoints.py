@@ -16,6 +16,8 @@ from src.core.errors import InvalidTokenExceptionError
 from src.core.errors import NotFoundExceptionError
 from src.core.errors import NotUniqueFieldExceptionError
 from src.core.errors import UnprocessableEntityExceptionError
+from src.core.pagination import CursorPaginatedResponseSchema
+from src.core.pagination import CursorPagination
 from src.core.schemas.base import DirectionEnum
 from src.core.schemas.base import LangEnum
 from src.core.schemas.base import MessageOutSchema
@@ -217,3 +219,49 @@ class UsersAdminController(ControllerBase):
         """
         result = self.user_service.search(search_line, sort, direction)
         return result
+
+    @http_get(
+        "/datable/cursor/",
+        response=CursorPaginatedResponseSchema[UserOutSchema],
+        auth=CustomJWTAuth(),
+        permissions=[IsAdminUser()],
+        openapi_extra={
+            "operationId": "users_datatable_by_cursor",
+            "responses": errors_to_docs(
+                {
+                    401: [InvalidTokenExceptionError()],
+                    422: [UnprocessableEntityExceptionError()],
+                }
+            ),
+        },
+    )
+    @paginate(CursorPagination)
+    def users_datatable_by_cursor(
+        self,
+        request: HttpRequest,
+        search_line: str = None,
+        sort: UserFieldsEnum = None,
+        direction: DirectionEnum = DirectionEnum.Descending,
+        accept_lang: LangEnum = Header(alias="Accept-Language", default="uk"),
+    ) -> QuerySet:
+        """Endpoint gets all users by pages of cursor pagination.
+
+        Makes pagination, search and sorting of records.
+
+        Please provide:
+         - **cursor**  cursor of page from next or previous link
+         - **page_size**  length of records per page
+         - **count**  return estimated count of records
+         - **search_line**  helps to find rows which contains search line
+         - **sort**  define by which field sort rows
+         - **direction**  determines in which direction to sort
+
+        Returns
+        -------
+          - **200**: Success response with the data.
+          - **422**: Error: Unprocessable Entity.
+          - **500**: Internal server error if an unexpected error occurs.
+
+        """
+        result = self.user_service.search(search_line, sort, direction)
+        return result
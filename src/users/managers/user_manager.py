@@ -1,9 +1,17 @@
 """Manager for User model"""
 
+import re
+from datetime import date
+from datetime import datetime
+from datetime import time
+from datetime import timedelta
 from typing import TYPE_CHECKING
 
 from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import UserManager
+from django.db.models import Q
+from django.db.models import QuerySet
+from django.utils import timezone
 from django.utils.translation import gettext as _
 
 from src.core.errors import NotFoundExceptionError
@@ -16,6 +24,10 @@ if TYPE_CHECKING:
     from src.users.schemas import UserRegisterSchema
     from src.users.schemas import UserUpdateSchema
 
+SEARCH_DATE_FORMATS = ["%d.%m.%Y", "%d/%m/%Y", "%d-%m-%Y", "%Y-%m-%d"]
+SEARCH_PHONE_RE = re.compile(r"[\s()+-]")
+SEARCH_ID_MAX_LENGTH = 18
+
 
 # um1.User
 class CustomUserManager(UserManager):
@@ -33,6 +45,8 @@ class CustomUserManager(UserManager):
         :param extra_fields: others extra
         :return: User model instance
         """
+        from src.core.services.statistic import StatisticService
+
         if not email:
             raise ValueError("The given email must be set")
         email = self.normalize_email(email)
@@ -42,6 +56,7 @@ class CustomUserManager(UserManager):
         user = self.model(email=email, **extra_fields)
         user.password = make_password(password)
         user.save(using=self._db)
+        StatisticService.invalidate_computed_nums()
         return user
 
     def create_user(self, email, password=None, **extra_fields) -> object:
@@ -92,16 +107,68 @@ class CustomUserManager(UserManager):
             raise NotFoundExceptionError(message=msg, cls_model=self.model)
         return user
 
+    def search(self, search_line: str) -> QuerySet:
+        """Find users by search line of admin table.
+        Kind of line is detected first (email, date, number or text),
+        so only lookups backed by indexes are used for it
+        :param search_line: line for searching users
+        :return: queryset of found users
+        """
+        search_line = search_line.strip()
+        users = self.model.objects.all()
+        if not search_line:
+            return users
+        if "@" in search_line:
+            return users.filter(email__icontains=search_line)
+        day = self._parse_search_date(search_line)
+        if day is not None:
+            start = timezone.make_aware(datetime.combine(day, time.min))
+            return users.filter(
+                Q(birthday=day)
+                | Q(date_joined__gte=start, date_joined__lt=start + timedelta(days=1))
+            )
+        digits = SEARCH_PHONE_RE.sub("", search_line)
+        if digits.isdigit():
+            lookups = Q(phone_number__contains=digits)
+            if len(digits) <= SEARCH_ID_MAX_LENGTH:
+                lookups |= Q(id=int(digits))
+            return users.filter(lookups)
+        for word in search_line.split():
+            users = users.filter(
+                Q(first_name__icontains=word)
+                | Q(last_name__icontains=word)
+                | Q(nickname__icontains=word)
+                | Q(email__icontains=word)
+                | Q(city__icontains=word)
+            )
+        return users
+
+    @staticmethod
+    def _parse_search_date(search_line: str) -> date | None:
+        """Get date from search line like 31.12.2000 or 2000-12-31.
+        :param search_line: line for searching users
+        :return: date or None if line isn't date
+        """
+        for date_format in SEARCH_DATE_FORMATS:
+            try:
+                return datetime.strptime(search_line, date_format).date()
+            except ValueError:
+                continue
+        return None
+
     def delete_by_id(self, user_id: int) -> MessageOutSchema:
         """Update user's model instance by id
         :param user_id:
         :rtype: User
         :return: User model instance
         """
+        from src.core.services.statistic import StatisticService
+
         try:
             user = self.model.objects.get(id=user_id)
             if not user.is_superuser:
                 user.delete()
+                StatisticService.invalidate_computed_nums()
         except self.model.DoesNotExist:
             msg = _("Не знайдено: немає збігів користувачів" " на заданному запиті.")
             raise NotFoundExceptionError(message=msg, cls_model=self.model)
@@ -116,6 +183,8 @@ class CustomUserManager(UserManager):
         :rtype: User
         :return: User model instance
         """
+        from src.core.services.statistic import StatisticService
+
         try:
             user = self.model.objects.get(id=user_id)
         except self.model.DoesNotExist:
@@ -139,6 +208,7 @@ class CustomUserManager(UserManager):
         if user_body.password:
             user.set_password(user_body.password.get_secret_value())
         user.save()
+        StatisticService.invalidate_computed_nums()
         return user
 
     def register(self, user_body: "UserRegisterSchema") -> None:
@@ -147,6 +217,8 @@ class CustomUserManager(UserManager):
         :rtype: User
         :return: User model instance
         """
+        from src.core.services.statistic import StatisticService
+
         pass1 = user_body.password1.get_secret_value()
         pass2 = user_body.password2.get_secret_value()
         if pass1 != pass2:
@@ -168,3 +240,4 @@ class CustomUserManager(UserManager):
             birthday=user_body.birthday,
             password=make_password(pass1),
         )
+        StatisticService.invalidate_computed_nums()
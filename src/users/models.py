@@ -4,7 +4,10 @@ and access control system in our site
 """
 
 from django.contrib.auth.models import AbstractUser
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.indexes import OpClass
 from django.db import models
+from django.db.models.functions import Upper
 from django.utils.translation import gettext_lazy as _
 from phonenumber_field.modelfields import PhoneNumberField
 
@@ -63,3 +66,19 @@ class User(AbstractUser):
         verbose_name = "Users"
         verbose_name_plural = "Users"
         db_table = "users"
+        indexes = [
+            *(
+                GinIndex(
+                    OpClass(Upper(field), name="gin_trgm_ops"),
+                    name=f"users_{field}_trgm",
+                )
+                for field in ["first_name", "last_name", "nickname", "email", "city"]
+            ),
+            GinIndex(
+                fields=["phone_number"],
+                opclasses=["gin_trgm_ops"],
+                name="users_phone_number_trgm",
+            ),
+            models.Index(fields=["birthday"], name="users_birthday_idx"),
+            models.Index(fields=["date_joined"], name="users_date_joined_idx"),
+        ]
@@ -1,7 +1,5 @@
 """Module contains class for managing users data in the site."""
 
-from dateutil.parser import parse
-from django.db.models import Q
 from django.db.models import QuerySet
 from django.utils.translation import gettext as _
 
@@ -91,23 +89,7 @@ class UserService:
         :param search_line: line for searching users
         :return: dict which contains all parameters for pagination
         """
-        users = User.objects.all()
-        if search_line:
-            try:
-                search_line = str(parse(search_line, dayfirst=True).date())
-            except ValueError:
-                pass
-            users = users.filter(
-                Q(id__icontains=search_line)
-                | Q(first_name__icontains=search_line)
-                | Q(last_name__icontains=search_line)
-                | Q(email__icontains=search_line)
-                | Q(nickname__icontains=search_line)
-                | Q(phone_number__icontains=search_line)
-                | Q(date_joined__icontains=search_line)
-                | Q(birthday__icontains=search_line)
-                | Q(city__icontains=search_line)
-            )
+        users = User.objects.search(search_line or "")
         if sort:
             symbol = ""
             if direction.value == "descending":
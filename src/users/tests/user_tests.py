@@ -1,14 +1,18 @@
 """Module for testing essence User"""
 
 import json
+from datetime import date
+from datetime import datetime
 
 import pytest
+from django.utils import timezone
 from ninja_extra.testing import TestClient
 from pydantic_core._pydantic_core import ValidationError
 
 from ...authz.test_schemas import UserTestOutSchema
 from ...core.schemas.base import MessageOutSchema
 from ..endpoints import UsersAdminController
+from ..models import User
 
 
 @pytest.mark.django_db()
@@ -213,3 +217,97 @@ class TestUsersAdminController:
         """
         response = self.client.get(f"/datable/{queries}", headers=self.headers)
         assert response.status_code == expected_status
+
+    @pytest.mark.parametrize(
+        "queries,expected_status",
+        [
+            (
+                "?sort=date_joined&direction=descending",
+                200,
+            ),
+            (
+                "?search_line=12.12.2012&count=true",
+                200,
+            ),
+            (
+                "?cursor=invalid",
+                422,
+            ),
+            (
+                "?sort=hello&direction=descending",
+                422,
+            ),
+        ],
+    )
+    def test_datable_by_cursor(self, queries, expected_status):
+        """Test get datable by cursor pagination
+        :param queries: kit of query parameters for filtering
+        :param expected_status: expected_status
+        :return: None
+        """
+        response = self.client.get(f"/datable/cursor/{queries}", headers=self.headers)
+        assert response.status_code == expected_status
+
+
+@pytest.mark.django_db()
+class TestUserSearch:
+    """Test detecting kind of search line in User.objects.search"""
+
+    @pytest.fixture()
+    def users(self) -> dict[str, User]:
+        alice = User.objects.create(
+            first_name="Аліса",
+            last_name="Коваль",
+            nickname="alice",
+            man=False,
+            phone_number="+380501112233",
+            email="alice.search@example.com",
+            address="string",
+            city="київ",
+            birthday=date(2000, 5, 17),
+        )
+        User.objects.filter(id=alice.id).update(
+            date_joined=timezone.make_aware(datetime(2021, 3, 4, 12))
+        )
+        bob = User.objects.create(
+            first_name="Борис",
+            last_name="Шевченко",
+            nickname="bob",
+            man=True,
+            phone_number="+380672000999",
+            email="bob.search@example.com",
+            address="string",
+            city="львів",
+            birthday=date(1990, 1, 1),
+        )
+        return {"alice": alice, "bob": bob}
+
+    @staticmethod
+    def found(search_line: str, users: dict[str, User]) -> set[str]:
+        ids = {user.id: name for name, user in users.items()}
+        result = User.objects.search(search_line).filter(id__in=ids)
+        return {ids[user_id] for user_id in result.values_list("id", flat=True)}
+
+    @pytest.mark.parametrize(
+        "search_line,expected",
+        [
+            ("ALICE.search@", {"alice"}),
+            ("17.05.2000", {"alice"}),
+            ("17/05/2000", {"alice"}),
+            ("17-05-2000", {"alice"}),
+            ("2000-05-17", {"alice"}),
+            ("04.03.2021", {"alice"}),
+            ("+38 (050) 111-22-33", {"alice"}),
+            ("2000", {"bob"}),
+            ("Аліса Коваль", {"alice"}),
+            ("Аліса Шевченко", set()),
+            ("львів", {"bob"}),
+            ("", {"alice", "bob"}),
+            ("   ", {"alice", "bob"}),
+        ],
+    )
+    def test_search(self, users, search_line, expected):
+        assert self.found(search_line, users) == expected
+
+    def test_search_by_id(self, users):
+        assert "alice" in self.found(str(users["alice"].id), users)